@@ -0,0 +1,248 @@
+"""
+Import-time and cold-start benchmarks for omisoshiru.
+
+Every measurement runs in a fresh interpreter, so it includes the cost of importing dependencies
+as a short-lived process would see it. The results are written as JSON and can be compared with a
+previous report.
+
+Example:
+    $ python benchmarks/cold_start.py --output report.json
+    $ python benchmarks/cold_start.py --compare report.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PACKAGES = [
+    "omisoshiru",
+    "omisoshiru.text",
+    "omisoshiru.graph",
+    "omisoshiru.pipeline",
+    "omisoshiru.ml",
+    "omisoshiru.utils",
+]
+
+# Each case imports an object, constructs it and calls it once.
+FIRST_CALLS = {
+    "Wakachi": {
+        "import": "from omisoshiru.text.wakachi import Wakachi",
+        "construct": "obj = Wakachi()",
+        "call": "obj.parse('これはテストです。')",
+    },
+    "FuzzyReplacer": {
+        "import": "from omisoshiru.text import FuzzyReplacer",
+        "construct": "obj = FuzzyReplacer([f'item{i}' for i in range(1000)])",
+        "call": "obj.replace('item 42')",
+    },
+    "MultiSentenceSum": {
+        "import": "import torch\nfrom omisoshiru.ml.models import MultiSentenceSum",
+        "construct": "obj = MultiSentenceSum(MODEL)",
+        "call": "obj([['This is a test.']], torch.tensor([[1.0]]))",
+    },
+}
+
+_FIRST_CALL_SCRIPT = """
+import json, time
+MODEL = {model!r}
+t0 = time.perf_counter()
+{import}
+t1 = time.perf_counter()
+{construct}
+t2 = time.perf_counter()
+{call}
+t3 = time.perf_counter()
+print(json.dumps({{"import": t1 - t0, "construct": t2 - t1, "first_call": t3 - t2}}))
+"""
+
+
+def _run(args: List[str]) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run(args, cwd=ROOT, env=env, capture_output=True, text=True)
+
+
+def measure_import(module: str, repeat: int = 5, top: int = 10) -> Dict[str, Any]:
+    """
+    Measure the import time of a module with `python -X importtime`.
+
+    Args:
+        module (str): The module name.
+        repeat (int): The number of fresh interpreters to measure. Defaults to 5.
+        top (int): The number of most expensive imported modules to report. Defaults to 10.
+
+    Returns:
+        Dict[str, Any]: The median cumulative import time in seconds (`seconds`), all samples,
+        and the modules with the largest self time (`top`) in the last sample.
+    """
+    samples = []
+    self_times: Dict[str, int] = {}
+    for _ in range(repeat):
+        result = _run([sys.executable, "-X", "importtime", "-c", f"import {module}"])
+        if result.returncode != 0:
+            return {"error": result.stderr.strip().splitlines()[-1]}
+        self_times = {}
+        cumulative = None
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            self_times[name.strip()] = int(self_us)
+            if name.strip() == module:
+                cumulative = int(cumulative_us)
+        samples.append(cumulative / 1e6)
+    ranked = sorted(self_times.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "seconds": statistics.median(samples),
+        "samples": samples,
+        "top": [{"module": name, "seconds": us / 1e6} for name, us in ranked[:top]],
+    }
+
+
+def measure_first_call(
+    name: str, repeat: int = 3, model: str = "bert-base-uncased"
+) -> Dict[str, Any]:
+    """
+    Measure the import, construction and first call latency of an object in `FIRST_CALLS`.
+
+    Args:
+        name (str): The case name.
+        repeat (int): The number of fresh interpreters to measure. Defaults to 3.
+        model (str): The pre-trained model for transformer-based cases.
+
+    Returns:
+        Dict[str, Any]: The median seconds of `import`, `construct`, `first_call` and `total`, or
+        the `error` if the case could not run (e.g. the model cannot be downloaded).
+    """
+    script = _FIRST_CALL_SCRIPT.format(model=model, **FIRST_CALLS[name])
+    samples = []
+    for _ in range(repeat):
+        result = _run([sys.executable, "-c", script])
+        if result.returncode != 0:
+            return {"error": result.stderr.strip().splitlines()[-1]}
+        samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    report = {
+        key: statistics.median(sample[key] for sample in samples)
+        for key in ["import", "construct", "first_call"]
+    }
+    report["total"] = sum(report.values())
+    return report
+
+
+def run_benchmarks(
+    packages: Optional[List[str]] = None,
+    first_calls: Optional[List[str]] = None,
+    repeat: int = 5,
+    model: str = "bert-base-uncased",
+) -> Dict[str, Any]:
+    """
+    Run the benchmarks.
+
+    Args:
+        packages (Optional[List[str]]): The modules to import. Defaults to `PACKAGES`.
+        first_calls (Optional[List[str]]): The cases of `FIRST_CALLS`. Defaults to all.
+        repeat (int): The number of fresh interpreters per measurement. Defaults to 5.
+        model (str): The pre-trained model for transformer-based cases.
+
+    Returns:
+        Dict[str, Any]: The report.
+    """
+    commit = _run(["git", "rev-parse", "HEAD"])
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": commit.stdout.strip() if commit.returncode == 0 else None,
+        "imports": {
+            module: measure_import(module, repeat=repeat)
+            for module in (PACKAGES if packages is None else packages)
+        },
+        "first_calls": {
+            name: measure_first_call(name, repeat=max(1, repeat // 2), model=model)
+            for name in (list(FIRST_CALLS) if first_calls is None else first_calls)
+        },
+    }
+
+
+def compare(
+    report: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """
+    Find measurements that got slower than in a baseline report.
+
+    Args:
+        report (Dict[str, Any]): The current report.
+        baseline (Dict[str, Any]): The baseline report.
+        threshold (float): The allowed relative slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        List[str]: A description of each regression.
+    """
+    pairs = [
+        (
+            f"import {name}",
+            result.get("seconds"),
+            baseline["imports"].get(name, {}).get("seconds"),
+        )
+        for name, result in report["imports"].items()
+    ] + [
+        (
+            f"first call {name}",
+            result.get("total"),
+            baseline["first_calls"].get(name, {}).get("total"),
+        )
+        for name, result in report["first_calls"].items()
+    ]
+    regressions = []
+    for label, current, previous in pairs:
+        if current is None or previous is None:
+            continue
+        change = (current - previous) / previous
+        print(f"{label}: {previous:.3f}s -> {current:.3f}s ({change:+.0%})")
+        if change > threshold:
+            regressions.append(f"{label} is {change:.0%} slower")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="Write the JSON report to this file.")
+    parser.add_argument("--compare", metavar="BASELINE", help="A previous JSON report.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="The relative slowdown reported as a regression. Defaults to 0.2.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--packages", nargs="*", help="Modules to import.")
+    parser.add_argument(
+        "--first-calls", nargs="*", choices=list(FIRST_CALLS), help="First call cases."
+    )
+    parser.add_argument("--model", default="bert-base-uncased")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.packages, args.first_calls, args.repeat, args.model)
+    data = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(data)
+    else:
+        print(data)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Benchmark of min_cost_within_n_hops against the previous BFS implementation.
+
+Each case is a random graph with uniform edge costs. The script reports the median time per source
+node of the previous implementation (`legacy`), of the current one on the NetworkX graph (`networkx`)
+and on a compiled `CSRGraph` (`csr`), and how many nodes the previous implementation got a different
+cost for than the current one.
+
+Example:
+    $ python benchmarks/min_cost_within_n_hops.py --output report.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+import networkx as nx
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from omisoshiru.collections import PrioritySet, remove_item_from_deque  # noqa: E402
+from omisoshiru.graph import CSRGraph, min_cost_within_n_hops  # noqa: E402
+
+# name: (number of nodes, number of edges, max_hops, max_nodes, cost_type)
+CASES = {
+    "sparse": (20000, 60000, 5, None, "cost"),
+    "sparse-top100": (20000, 60000, 5, 100, "cost"),
+    "dense": (500, 25000, 4, None, "cost"),
+    "dense-weight": (500, 25000, 4, None, "weight"),
+}
+
+
+def legacy_min_cost_within_n_hops(
+    graph: nx.Graph,
+    source_node: Any,
+    max_hops: int = 5,
+    max_nodes: Optional[int] = None,
+    cost_type: str = "cost",
+) -> PrioritySet:
+    """
+    The previous implementation: a BFS that re-queues a node whenever its cost improves.
+    """
+    ascending_order = cost_type == "cost"
+    cost_calculation = lambda x, y: x + y if cost_type == "cost" else x * y
+    initial_cost = 0 if cost_type == "cost" else 1
+    queue = deque([(0, initial_cost, source_node)])
+    priority_set = PrioritySet(ascending=ascending_order, max_size=max_nodes)
+    priority_set.add(initial_cost, source_node)
+    while queue:
+        current_hop, current_cost, current_node = queue.popleft()
+        for _, next_node, data in graph.edges(current_node, data=True):
+            next_hop = current_hop + 1
+            next_cost = cost_calculation(current_cost, data[cost_type])
+            succeed, removed = priority_set.add(next_cost, next_node)
+            if removed:
+                remove_item_from_deque(queue, lambda x: x[2] == removed[1])
+            if succeed and next_hop < max_hops:
+                queue.append((next_hop, next_cost, next_node))
+    return priority_set
+
+
+def make_graph(num_nodes: int, num_edges: int, seed: int = 0) -> nx.Graph:
+    """
+    Create a random graph with uniform `cost` in [0, 1) and `weight` in [0.5, 1).
+
+    Args:
+        num_nodes (int): The number of nodes.
+        num_edges (int): The number of edges.
+        seed (int): The random seed. Defaults to 0.
+
+    Returns:
+        nx.Graph: The graph.
+    """
+    graph = nx.gnm_random_graph(num_nodes, num_edges, seed=seed)
+    rng = np.random.default_rng(seed)
+    for _, _, data in graph.edges(data=True):
+        data["cost"] = float(rng.random())
+        data["weight"] = float(rng.uniform(0.5, 1.0))
+    return graph
+
+
+def _time(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run_case(name: str, sources: int = 5, seed: int = 0) -> Dict[str, Any]:
+    """
+    Run a case of `CASES`.
+
+    Args:
+        name (str): The case name.
+        sources (int): The number of random source nodes. Defaults to 5.
+        seed (int): The random seed. Defaults to 0.
+
+    Returns:
+        Dict[str, Any]: The median seconds per source of each implementation, the seconds to
+        compile the `CSRGraph`, and the number of nodes with a different cost in `legacy`.
+    """
+    num_nodes, num_edges, max_hops, max_nodes, cost_type = CASES[name]
+    graph = make_graph(num_nodes, num_edges, seed)
+    start = time.perf_counter()
+    csr = CSRGraph.from_networkx(graph)
+    compile_seconds = time.perf_counter() - start
+
+    kwargs = dict(max_hops=max_hops, max_nodes=max_nodes, cost_type=cost_type)
+    implementations = {
+        "legacy": lambda source: legacy_min_cost_within_n_hops(graph, source, **kwargs),
+        "networkx": lambda source: min_cost_within_n_hops(graph, source, **kwargs),
+        "csr": lambda source: min_cost_within_n_hops(csr, source, **kwargs),
+    }
+    seconds: Dict[str, List[float]] = {key: [] for key in implementations}
+    mismatches = 0
+    rng = np.random.default_rng(seed)
+    for source in rng.choice(num_nodes, size=sources, replace=False).tolist():
+        for key, fn in implementations.items():
+            seconds[key].append(_time(lambda: fn(source)))
+        legacy = {node: cost for cost, node in implementations["legacy"](source)}
+        current = {node: cost for cost, node in implementations["networkx"](source)}
+        mismatches += sum(
+            1
+            for node in set(legacy) | set(current)
+            if node not in legacy
+            or node not in current
+            or not np.isclose(legacy[node], current[node])
+        )
+    return {
+        "graph": {"nodes": num_nodes, "edges": num_edges},
+        **kwargs,
+        "seconds": {key: statistics.median(value) for key, value in seconds.items()},
+        "compile_seconds": compile_seconds,
+        "legacy_mismatches": mismatches,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="Write the JSON report to this file.")
+    parser.add_argument(
+        "--cases", nargs="*", choices=list(CASES), help="Cases to run. Defaults to all."
+    )
+    parser.add_argument("--sources", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report = {}
+    for name in args.cases or list(CASES):
+        report[name] = run_case(name, args.sources, args.seed)
+        seconds = report[name]["seconds"]
+        print(
+            f"{name}: "
+            + ", ".join(f"{key} {value * 1000:.1f}ms" for key, value in seconds.items())
+            + f", legacy mismatches {report[name]['legacy_mismatches']}",
+            file=sys.stderr,
+        )
+    data = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(data)
+    else:
+        print(data)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,5 +2,23 @@
 omisoshiru: A collection of utility modules for various tasks.
 
 This package provides a set of utility modules for tasks such as text processing, graph algorithms, date-time operations, mathematical calculations, and more.
+
+Subpackages are imported on first access, so `import omisoshiru` does not load heavy dependencies.
 """
-from . import algorithm, collections, datetime, graph, math, ml, pipeline, text, utils
+
+from ._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=[
+        "algorithm",
+        "collections",
+        "datetime",
+        "graph",
+        "math",
+        "ml",
+        "pipeline",
+        "text",
+        "utils",
+    ],
+)
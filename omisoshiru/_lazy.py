@@ -0,0 +1,63 @@
+import importlib
+import sys
+import types
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule binds it on its package. When the submodule has the same name
+        # as an object it exports (e.g. `text.join_str`), keep the object bound instead, as an
+        # eager `from .join_str import join_str` would.
+        if (
+            isinstance(value, types.ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+            and self.__dict__.get("_lazy_attributes", {}).get(name) == name
+            and hasattr(value, name)
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def attach(
+    package: str,
+    submodules: Sequence[str] = (),
+    attributes: Dict[str, str] = None,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Make the submodules and exported objects of a package load on first access (PEP 562).
+
+    Use it in the `__init__.py` of a package instead of importing submodules eagerly:
+
+        __getattr__, __dir__ = attach(__name__, attributes={"HeapQueue": "heap_queue"})
+
+    Args:
+        package (str): The name of the package, i.e. `__name__`.
+        submodules (Sequence[str]): Submodules exposed as attributes of the package.
+        attributes (Dict[str, str]): The submodule that defines each exported object.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: The `__getattr__` and `__dir__`
+        functions of the package.
+    """
+    attributes = dict(attributes or {})
+    module = sys.modules[package]
+    module._lazy_attributes = attributes
+    module.__class__ = _LazyModule
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            value = getattr(
+                importlib.import_module(f".{attributes[name]}", package), name
+            )
+        elif name in submodules:
+            value = importlib.import_module(f".{name}", package)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(module.__dict__) | set(submodules) | set(attributes))
+
+    return __getattr__, __dir__
@@ -4,8 +4,13 @@ Module providing various algorithms for pattern matching.
 This module includes functions for finding partial matches in a target list.
 """
 
-from .partial_match import partial_match
+from .._lazy import attach
 
-__all__ = [
-    "partial_match",
-]
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "partial_match": "partial_match",
+    },
+)
+
+__all__ = ["partial_match"]
@@ -4,8 +4,25 @@ Collection of custom data structures and algorithms.
 This module provides custom implementations of data structures and algorithms for various purposes.
 """
 
-from .heap_queue import HeapQueue
-from .priority_set import PrioritySet
-from .remove_item_from_deque import remove_item_from_deque
+from .._lazy import attach
 
-__all__ = ["HeapQueue", "PrioritySet", "remove_item_from_deque"]
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "ArrayHeapQueue": "array_heap_queue",
+        "HeapQueue": "heap_queue",
+        "LazyDeque": "lazy_deque",
+        "PrioritySet": "priority_set",
+        "remove_item_from_deque": "remove_item_from_deque",
+        "TopK": "top_k",
+    },
+)
+
+__all__ = [
+    "ArrayHeapQueue",
+    "HeapQueue",
+    "LazyDeque",
+    "PrioritySet",
+    "remove_item_from_deque",
+    "TopK",
+]
@@ -0,0 +1,281 @@
+from typing import Tuple
+
+import numpy as np
+
+# Batch operations rebuild the heap with vectorized NumPy operations in O(n) instead of sifting
+# element by element in Python once the batch is at least 1/_BULK_RATIO of the heap.
+_BULK_RATIO = 256
+
+
+class ArrayHeapQueue:
+    def __init__(
+        self, ascending: bool = True, capacity: int = 1024, dtype=np.float64
+    ) -> None:
+        """
+        A compact priority queue of numeric priorities and integer ids, stored in NumPy arrays.
+
+        Each element takes 24 bytes (the priority, an int64 id and an int64 insertion counter that
+        breaks ties in insertion order), instead of a Python tuple per element as in `HeapQueue`.
+        Batches are pushed with `push_many` and popped with `pop_k` using vectorized heap
+        construction and selection when the batch is large relative to the heap.
+
+        Args:
+            ascending (bool): If True, the heap will be in ascending order; if False, in descending order.
+            capacity (int): The initial number of elements the buffers can hold. They grow as needed.
+                Defaults to 1024.
+            dtype: The NumPy dtype of the priorities. It must be a signed type. Defaults to float64.
+
+        Example:
+            >>> queue = ArrayHeapQueue()
+            >>> queue.push_many(np.array([3.0, 1.0, 2.0]), np.array([10, 11, 12]))
+            >>> queue.push(0.5, 13)
+            >>> queue.pop()
+            (0.5, 13)
+            >>> queue.pop_k(2)
+            (array([1., 2.]), array([11, 12]))
+        """
+        capacity = max(capacity, 1)
+        self._values = np.empty(capacity, dtype=dtype)
+        self._ids = np.empty(capacity, dtype=np.int64)
+        self._counts = np.empty(capacity, dtype=np.int64)
+        self._size = 0
+        self._count = 0
+        self._ascending = ascending
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._values)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name in ["_values", "_ids", "_counts"]:
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            setattr(self, name, new)
+
+    def _move(self, source: int, target: int) -> None:
+        self._values[target] = self._values[source]
+        self._ids[target] = self._ids[source]
+        self._counts[target] = self._counts[source]
+
+    def _sift_up(self, i: int) -> None:
+        values, ids, counts = self._values, self._ids, self._counts
+        value, item_id, count = values[i], ids[i], counts[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            parent_value = values[parent]
+            if value > parent_value or (
+                value == parent_value and count > counts[parent]
+            ):
+                break
+            self._move(parent, i)
+            i = parent
+        values[i], ids[i], counts[i] = value, item_id, count
+
+    def _sift_down(self, i: int) -> None:
+        values, ids, counts = self._values, self._ids, self._counts
+        value, item_id, count = values[i], ids[i], counts[i]
+        size = self._size
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            child_value = values[child]
+            if child + 1 < size:
+                right_value = values[child + 1]
+                if right_value < child_value or (
+                    right_value == child_value and counts[child + 1] < counts[child]
+                ):
+                    child += 1
+                    child_value = right_value
+            if value < child_value or (value == child_value and count < counts[child]):
+                break
+            self._move(child, i)
+            i = child
+        values[i], ids[i], counts[i] = value, item_id, count
+
+    def _less(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        values, counts = self._values, self._counts
+        return (values[a] < values[b]) | (
+            (values[a] == values[b]) & (counts[a] < counts[b])
+        )
+
+    def _heapify(self) -> None:
+        # Floyd's heap construction, sifting down all nodes of a level at once. Nodes of the same
+        # level have disjoint subtrees, so their sifts never touch the same position.
+        size = self._size
+        level = (size // 2).bit_length() - 1
+        while level >= 0:
+            i = np.arange(2**level - 1, min(2 ** (level + 1) - 1, size // 2))
+            while i.size:
+                child = 2 * i + 1
+                inside = child < size
+                i, child = i[inside], child[inside]
+                right = np.minimum(child + 1, size - 1)
+                child = np.where(self._less(right, child), right, child)
+                swap = self._less(child, i)
+                i, child = i[swap], child[swap]
+                for array in (self._values, self._ids, self._counts):
+                    array[i], array[child] = array[child], array[i]
+                i = child
+            level -= 1
+
+    def _output(self, values: np.ndarray) -> np.ndarray:
+        # Invert the values back for descending order
+        return values if self._ascending else -values
+
+    def push(self, value: float, item_id: int) -> None:
+        """
+        Pushes an element with its priority value onto the heap.
+
+        Args:
+            value (float): The priority value of the element.
+            item_id (int): The id of the element.
+
+        Returns:
+            None
+        """
+        self._reserve(self._size + 1)
+        i = self._size
+        self._values[i] = value if self._ascending else -value
+        self._ids[i] = item_id
+        self._counts[i] = self._count
+        self._size += 1
+        self._count += 1
+        self._sift_up(i)
+
+    def push_many(self, values: np.ndarray, ids: np.ndarray) -> None:
+        """
+        Pushes elements with their priority values onto the heap.
+
+        Args:
+            values (np.ndarray): The priority values of the elements.
+            ids (np.ndarray): The ids of the elements, of the same length as `values`.
+
+        Returns:
+            None
+        """
+        values = np.asarray(values, dtype=self._values.dtype).ravel()
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        if len(values) != len(ids):
+            raise ValueError("values and ids must have the same length.")
+        m = len(values)
+        start = self._size
+        self._reserve(start + m)
+        self._values[start : start + m] = self._output(values)
+        self._ids[start : start + m] = ids
+        self._counts[start : start + m] = np.arange(self._count, self._count + m)
+        self._size += m
+        self._count += m
+        if m * _BULK_RATIO >= self._size:
+            self._heapify()
+        else:
+            for i in range(start, start + m):
+                self._sift_up(i)
+
+    def pop(self) -> Tuple[float, int]:
+        """
+        Pops and returns the element with the highest priority from the heap.
+
+        Returns:
+            Tuple[float, int]: The priority value and id of the element with the highest priority.
+        """
+        if self._size == 0:
+            raise IndexError("pop from an empty heap")
+        value, item_id = self.peek()
+        self._size -= 1
+        if self._size > 0:
+            self._move(self._size, 0)
+            self._sift_down(0)
+        return value, item_id
+
+    def pop_k(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pops the `k` elements with the highest priorities from the heap.
+
+        Args:
+            k (int): The number of elements. If the heap has fewer elements, all are popped.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The priority values and ids of the elements, from the
+            highest priority.
+
+        Raises:
+            ValueError: If `k` is negative.
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative.")
+        k = min(k, self._size)
+        n = self._size
+        if k * _BULK_RATIO < n:
+            popped = [self.pop() for _ in range(k)]
+            return (
+                np.array([value for value, _ in popped], dtype=self._values.dtype),
+                np.array([item_id for _, item_id in popped], dtype=np.int64),
+            )
+
+        # Select the k highest priorities in O(n), sort only them, and rebuild the heap from the
+        # remaining elements.
+        values, counts = self._values[:n], self._counts[:n]
+        if k < n:
+            threshold = values[np.argpartition(values, k - 1)[k - 1]]
+            (better,) = np.nonzero(values < threshold)
+            (tied,) = np.nonzero(values == threshold)
+            # Ties with the threshold are taken in insertion order.
+            tied = tied[np.argsort(counts[tied])[: k - len(better)]]
+            selected = np.concatenate([better, tied])
+        else:
+            selected = np.arange(n)
+        selected = selected[np.lexsort((counts[selected], values[selected]))]
+        result = self._output(self._values[selected]), self._ids[selected]
+
+        keep = np.ones(n, dtype=bool)
+        keep[selected] = False
+        for array in (self._values, self._ids, self._counts):
+            array[: n - k] = array[:n][keep]
+        self._size = n - k
+        self._heapify()
+        return result
+
+    def peek(self) -> Tuple[float, int]:
+        """
+        Returns the element with the highest priority without removing it.
+
+        Returns:
+            Tuple[float, int]: The priority value and id of the element with the highest priority.
+        """
+        if self._size == 0:
+            raise IndexError("peek at an empty heap")
+        value = self._values[0].item()
+        return (value if self._ascending else -value), int(self._ids[0])
+
+    def items(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the elements in the heap, in heap order.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The priority values and ids of the elements.
+        """
+        return (
+            self._output(self._values[: self._size].copy()),
+            self._ids[: self._size].copy(),
+        )
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the heap.
+
+        Returns:
+            int: The number of elements in the heap.
+        """
+        return self._size
+
+    def __bool__(self) -> bool:
+        """
+        Returns True if the heap is non-empty, False otherwise.
+
+        Returns:
+            bool: True if the heap is non-empty, False otherwise.
+        """
+        return self._size > 0
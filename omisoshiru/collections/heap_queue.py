@@ -1,14 +1,24 @@
-import heapq
-from typing import Any, List, Tuple
+import itertools
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
 
 
 class HeapQueue:
-    def __init__(self, ascending: bool = True) -> None:
+    def __init__(
+        self,
+        ascending: bool = True,
+        items: Optional[Iterable[Tuple[Any, Hashable]]] = None,
+    ) -> None:
         """
-        A priority queue implementation using the heapq module.
+        An addressable priority queue implemented as a binary heap.
+
+        The position of every element in the heap is indexed, so the priority of an element can be
+        updated or the element removed in O(log n). Elements must therefore be hashable and unique.
+        Elements with equal priorities are popped in insertion order and are never compared.
 
         Args:
             ascending (bool): If True, the heap will be in ascending order; if False, in descending order.
+            items (Optional[Iterable[Tuple[Any, Hashable]]]): Initial `(value, item)` pairs. The heap is
+                built from them in O(n). Defaults to None.
 
         Example:
             >>> priority_queue = HeapQueue()
@@ -17,30 +27,97 @@ class HeapQueue:
             >>> priority_queue.push(2, 'orange')
             >>> priority_queue.items()
             [(1, 'banana'), (3, 'apple'), (2, 'orange')]
+            >>> priority_queue.update(0, 'orange')
             >>> priority_queue.pop()
-            (1, 'banana')
+            (0, 'orange')
             >>> len(priority_queue)
             2
             >>> bool(priority_queue)
             True
         """
-        self._heap: List[Tuple[int, Any]] = []
+        # Entries are [value, count, item]. The count is unique, so entries never compare items.
+        self._heap: List[list] = []
+        self._index: Dict[Hashable, int] = {}
         self._ascending = ascending
+        self._counter = itertools.count()
+        if items is not None:
+            for value, item in items:
+                if item in self._index:
+                    raise ValueError(f"Item {item!r} is given more than once.")
+                self._index[item] = len(self._heap)
+                self._heap.append([self._sign(value), next(self._counter), item])
+            for i in reversed(range(len(self._heap) // 2)):
+                self._sift_down(i)
+
+    def _sign(self, value: Any) -> Any:
+        # Invert the value for descending order
+        return value if self._ascending else -value
+
+    def _set(self, i: int, entry: list) -> None:
+        self._heap[i] = entry
+        self._index[entry[2]] = i
+
+    def _sift_up(self, i: int) -> None:
+        heap, index = self._heap, self._index
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            parent_entry = heap[parent]
+            if not entry < parent_entry:
+                break
+            heap[i] = parent_entry
+            index[parent_entry[2]] = i
+            i = parent
+        heap[i] = entry
+        index[entry[2]] = i
 
-    def push(self, value: int, item: Any) -> None:
+    def _sift_down(self, i: int) -> None:
+        heap, index = self._heap, self._index
+        entry = heap[i]
+        size = len(heap)
+        child = 2 * i + 1
+        while child < size:
+            right = child + 1
+            if right < size and heap[right] < heap[child]:
+                child = right
+            child_entry = heap[child]
+            if not child_entry < entry:
+                break
+            heap[i] = child_entry
+            index[child_entry[2]] = i
+            i = child
+            child = 2 * i + 1
+        heap[i] = entry
+        index[entry[2]] = i
+
+    def _remove_at(self, i: int) -> list:
+        entry = self._heap[i]
+        del self._index[entry[2]]
+        last = self._heap.pop()
+        if i < len(self._heap):
+            self._set(i, last)
+            self._sift_down(i)
+            self._sift_up(i)
+        return entry
+
+    def push(self, value: int, item: Hashable) -> None:
         """
         Pushes an element with its priority value onto the heap.
 
         Args:
             value (int): The priority value of the element.
-            item (Any): The element to be added.
+            item (Hashable): The element to be added.
 
         Returns:
             None
+
+        Raises:
+            ValueError: If the element is already in the heap.
         """
-        if not self._ascending:
-            value = -value  # Invert the value for descending order
-        heapq.heappush(self._heap, (value, item))
+        if item in self._index:
+            raise ValueError(f"Item {item!r} is already in the heap. Use update().")
+        self._heap.append([self._sign(value), next(self._counter), item])
+        self._sift_up(len(self._heap) - 1)
 
     def pop(self) -> Tuple[int, Any]:
         """
@@ -49,10 +126,105 @@ class HeapQueue:
         Returns:
             Tuple[int, Any]: The element with the highest priority.
         """
-        value, item = heapq.heappop(self._heap)
-        if not self._ascending:
-            value = -value  # Invert the value back for descending order
-        return value, item
+        if not self._heap:
+            raise IndexError("pop from an empty heap")
+        value, _, item = self._remove_at(0)
+        return self._sign(value), item
+
+    def peek(self) -> Tuple[int, Any]:
+        """
+        Returns the element with the highest priority without removing it.
+
+        Returns:
+            Tuple[int, Any]: The element with the highest priority.
+        """
+        if not self._heap:
+            raise IndexError("peek at an empty heap")
+        value, _, item = self._heap[0]
+        return self._sign(value), item
+
+    def pushpop(self, value: int, item: Hashable) -> Tuple[int, Any]:
+        """
+        Pushes an element and then pops the element with the highest priority, faster than
+        calling `push` and `pop` separately.
+
+        Args:
+            value (int): The priority value of the element.
+            item (Hashable): The element to be added.
+
+        Returns:
+            Tuple[int, Any]: The element with the highest priority, which may be the pushed one.
+
+        Raises:
+            ValueError: If the element is already in the heap.
+        """
+        if item in self._index:
+            raise ValueError(f"Item {item!r} is already in the heap. Use update().")
+        entry = [self._sign(value), next(self._counter), item]
+        if not self._heap or not self._heap[0] < entry:
+            return value, item
+        top = self._heap[0]
+        del self._index[top[2]]
+        self._set(0, entry)
+        self._sift_down(0)
+        return self._sign(top[0]), top[2]
+
+    def update(self, value: int, item: Hashable) -> None:
+        """
+        Changes the priority value of an element, or pushes it if it is not in the heap.
+
+        Args:
+            value (int): The new priority value of the element.
+            item (Hashable): The element.
+
+        Returns:
+            None
+        """
+        i = self._index.get(item)
+        if i is None:
+            self.push(value, item)
+            return
+        self._heap[i][0] = self._sign(value)
+        self._sift_up(i)
+        self._sift_down(self._index[item])
+
+    def remove(self, item: Hashable) -> int:
+        """
+        Removes an element from the heap.
+
+        Args:
+            item (Hashable): The element to be removed.
+
+        Returns:
+            int: The priority value of the removed element.
+
+        Raises:
+            KeyError: If the element is not in the heap.
+        """
+        return self._sign(self._remove_at(self._index[item])[0])
+
+    def get(self, item: Hashable, default: Any = None) -> Any:
+        """
+        Returns the priority value of an element.
+
+        Args:
+            item (Hashable): The element.
+            default (Any): The value returned if the element is not in the heap. Defaults to None.
+
+        Returns:
+            Any: The priority value of the element, or `default`.
+        """
+        i = self._index.get(item)
+        return default if i is None else self._sign(self._heap[i][0])
+
+    def __contains__(self, item: Hashable) -> bool:
+        """
+        Returns True if the element is in the heap, False otherwise.
+
+        Returns:
+            bool: True if the element is in the heap, False otherwise.
+        """
+        return item in self._index
 
     def __len__(self) -> int:
         """
@@ -74,13 +246,9 @@ class HeapQueue:
 
     def items(self) -> List[Tuple[int, Any]]:
         """
-        Returns a list of elements in the heap.
+        Returns a list of elements in the heap, in heap order.
 
         Returns:
             List[Tuple[int, Any]]: List of elements in the heap.
         """
-        if self._ascending:
-            return self._heap
-        else:
-            # Invert the values back for descending order
-            return [(-value, item) for value, item in self._heap]
+        return [(self._sign(value), item) for value, _, item in self._heap]
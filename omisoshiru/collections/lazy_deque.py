@@ -0,0 +1,193 @@
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+
+
+class LazyDeque:
+    def __init__(self, key: Optional[Callable[[Any], Hashable]] = None) -> None:
+        """
+        A deque whose elements can be removed by key in O(1).
+
+        Removed elements are only marked as removed (tombstoned) and are skipped when they reach
+        either end of the deque. The deque is compacted once most of its entries are tombstones.
+
+        Args:
+            key (Optional[Callable[[Any], Hashable]]): A callable that returns the key of an element.
+                Defaults to None, in which case the element itself is used.
+
+        Example:
+            >>> queue = LazyDeque(key=lambda x: x[0])
+            >>> queue.append(('apple', 1))
+            >>> queue.append(('banana', 2))
+            >>> queue.append(('apple', 3))
+            >>> queue.remove('apple')
+            2
+            >>> queue.popleft()
+            ('banana', 2)
+        """
+        self._key = key or (lambda x: x)
+        # Entries are (sequence, key, item). An entry is removed if its key was removed after it
+        # was added, i.e. `sequence < _removed[key]`.
+        self._deque = deque()
+        self._sequence = 0
+        self._removed: Dict[Hashable, int] = {}
+        self._counts: Dict[Hashable, int] = {}
+        self._size = 0
+
+    def _is_live(self, entry: tuple) -> bool:
+        sequence, key, _ = entry
+        return sequence >= self._removed.get(key, 0)
+
+    def _entry(self, item: Any) -> tuple:
+        key = self._key(item)
+        self._counts[key] = self._counts.get(key, 0) + 1
+        self._size += 1
+        self._sequence += 1
+        return self._sequence, key, item
+
+    def _take(self, entry: tuple) -> Any:
+        _, key, item = entry
+        self._counts[key] -= 1
+        if not self._counts[key]:
+            del self._counts[key]
+        self._size -= 1
+        return item
+
+    def append(self, item: Any) -> None:
+        """
+        Adds an element to the right end.
+
+        Args:
+            item (Any): The element.
+
+        Returns:
+            None
+        """
+        self._deque.append(self._entry(item))
+
+    def appendleft(self, item: Any) -> None:
+        """
+        Adds an element to the left end.
+
+        Args:
+            item (Any): The element.
+
+        Returns:
+            None
+        """
+        self._deque.appendleft(self._entry(item))
+
+    def popleft(self) -> Any:
+        """
+        Removes and returns the element at the left end.
+
+        Returns:
+            Any: The element.
+        """
+        while self._deque:
+            entry = self._deque.popleft()
+            if self._is_live(entry):
+                return self._take(entry)
+        self._removed = {}
+        raise IndexError("pop from an empty deque")
+
+    def pop(self) -> Any:
+        """
+        Removes and returns the element at the right end.
+
+        Returns:
+            Any: The element.
+        """
+        while self._deque:
+            entry = self._deque.pop()
+            if self._is_live(entry):
+                return self._take(entry)
+        self._removed = {}
+        raise IndexError("pop from an empty deque")
+
+    def remove(self, key: Hashable) -> int:
+        """
+        Removes all elements with a key in O(1).
+
+        Args:
+            key (Hashable): The key.
+
+        Returns:
+            int: The number of removed elements.
+        """
+        count = self._counts.pop(key, 0)
+        if count:
+            self._removed[key] = self._sequence + 1
+            self._size -= count
+            if len(self._deque) > 2 * self._size + 16:
+                self.compact()
+        return count
+
+    def remove_where(self, condition_func: Callable[[Any], bool]) -> int:
+        """
+        Removes all elements that satisfy a condition in a single pass.
+
+        Args:
+            condition_func (Callable[[Any], bool]): A callable that takes an element and returns True if
+                it should be removed.
+
+        Returns:
+            int: The number of removed elements.
+        """
+        size = self._size
+        entries = [entry for entry in self._deque if self._is_live(entry)]
+        self._deque = deque()
+        self._removed = {}
+        self._counts = {}
+        self._size = 0
+        for sequence, key, item in entries:
+            if not condition_func(item):
+                self._counts[key] = self._counts.get(key, 0) + 1
+                self._size += 1
+                self._deque.append((sequence, key, item))
+        return size - self._size
+
+    def compact(self) -> None:
+        """
+        Drops the tombstones of removed elements.
+
+        Returns:
+            None
+        """
+        self._deque = deque(entry for entry in self._deque if self._is_live(entry))
+        self._removed = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Returns True if an element with the key is in the deque, False otherwise.
+
+        Returns:
+            bool: True if an element with the key is in the deque, False otherwise.
+        """
+        return key in self._counts
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the deque.
+
+        Returns:
+            int: The number of elements in the deque.
+        """
+        return self._size
+
+    def __bool__(self) -> bool:
+        """
+        Returns True if the deque is non-empty, False otherwise.
+
+        Returns:
+            bool: True if the deque is non-empty, False otherwise.
+        """
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Returns an iterator for the elements from the left end.
+
+        Returns:
+            iterator: Iterator for the elements.
+        """
+        return (entry[2] for entry in self._deque if self._is_live(entry))
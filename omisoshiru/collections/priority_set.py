@@ -1,25 +1,39 @@
-import bisect
-from typing import Any, Callable, Optional, Tuple
+import heapq
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class _Reversed:
+    __slots__ = ["entry"]
+
+    def __init__(self, entry: tuple) -> None:
+        self.entry = entry
+
+    def __lt__(self, other: "_Reversed") -> bool:
+        return other.entry[:2] < self.entry[:2]
 
 
 class PrioritySet:
     def __init__(
         self,
-        equality_check: Optional[Callable[[Any, Any], bool]] = None,
+        key: Optional[Callable[[Any], Hashable]] = None,
         ascending: bool = True,
         max_size: Optional[int] = None,
     ) -> None:
         """
         A priority set implementation that maintains a sorted set of unique elements based on their priority values.
 
+        Elements are identified by `key(item)`, so membership tests take O(1) and adding or popping an element
+        takes O(log n). Adding an element that is already in the set keeps the higher priority of the two
+        (decrease-key).
+
         Args:
-            equality_check (Optional[Callable[[Any, Any], bool]]): A callable that determines equality between two elements.
-                Defaults to None, in which case the default equality function (x == y) is used.
+            key (Optional[Callable[[Any], Hashable]]): A callable that returns the identity of an element.
+                Defaults to None, in which case the element itself is used.
             ascending (bool): If True, the priority set will be in ascending order; if False, in descending order.
             max_size (Optional[int]): The maximum number of elements the priority set can hold. Defaults to None.
 
         Example:
-            >>> priority_set = PrioritySet(lambda x, y: x == y, ascending=True, max_size=5)
+            >>> priority_set = PrioritySet(ascending=True, max_size=5)
             >>> priority_set.add(3, 'apple')
             >>> priority_set.add(1, 'banana')
             >>> priority_set.add(2, 'orange')
@@ -29,18 +43,66 @@ class PrioritySet:
             (1, 'banana')
             >>> priority_set.items()
             [(2, 'orange'), (3, 'apple')]
+            >>> 'apple' in priority_set
+            True
         """
-        self._data = []
-        self._equality_check = equality_check or (lambda x, y: x == y)
+        self._key = key or (lambda x: x)
         self._ascending = ascending
         self._max_size = max_size
+        # Entries are (value, item, key) tuples. Replaced or removed entries stay in the heaps
+        # until they reach the top or the heaps are rebuilt; an entry is live only if it is the
+        # one stored in `_entries`.
+        self._entries: Dict[Hashable, Tuple[Any, Any, Hashable]] = {}
+        self._heap: List[Tuple[Any, Any, Hashable]] = []
+        self._worst_heap: List[_Reversed] = []
+
+    def _is_live(self, entry: Tuple[Any, Any, Hashable]) -> bool:
+        return self._entries.get(entry[2]) is entry
+
+    def _push(self, entry: Tuple[Any, Any, Hashable]) -> None:
+        self._entries[entry[2]] = entry
+        heapq.heappush(self._heap, entry)
+        if self._max_size is not None:
+            heapq.heappush(self._worst_heap, _Reversed(entry))
+        self._compact()
+
+    def _discard(self, key: Hashable) -> None:
+        del self._entries[key]
+        self._compact()
+
+    def _compact(self) -> None:
+        # Rebuild the heaps once most of their entries are stale, so they stay O(n).
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._heap = list(self._entries.values())
+        heapq.heapify(self._heap)
+        if self._max_size is not None:
+            self._worst_heap = [_Reversed(entry) for entry in self._heap]
+            heapq.heapify(self._worst_heap)
+
+    def _best(self) -> Tuple[Any, Any, Hashable]:
+        while not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0]
+
+    def _worst(self) -> Tuple[Any, Any, Hashable]:
+        while not self._is_live(self._worst_heap[0].entry):
+            heapq.heappop(self._worst_heap)
+        return self._worst_heap[0].entry
+
+    def _output(self, entry: Tuple[Any, Any, Hashable]) -> Tuple[Any, Any]:
+        value, item, _ = entry
+        if not self._ascending:
+            value = -value  # Invert the value back for descending order
+        return value, item
 
     def _truncation(self):
-        if self._max_size is not None and len(self._data) > self._max_size:
-            removed_value, removed_item = self._data.pop()
-            if not self._ascending:
-                removed_value = -removed_value
-            return removed_value, removed_item
+        if self._max_size is not None and len(self._entries) > self._max_size:
+            removed = self._worst()
+            self._discard(removed[2])
+            return self._output(removed)
 
     def add(self, value: Any, item: Any) -> Tuple[bool, Optional[Any]]:
         """
@@ -53,27 +115,56 @@ class PrioritySet:
         Returns:
             Tuple[bool, Optional[Tuple[Any, Any]]]: A tuple containing a boolean indicating whether the element was
             successfully added, and an optional tuple containing the removed element's priority value and item if
-            the addition resulted in truncation due to reaching the maximum size.
+            the addition replaced the same element with a lower priority or resulted in truncation due to reaching
+            the maximum size.
         """
         if not self._ascending:
             value = -value  # Invert the value back for descending order
+        key = self._key(item)
+
+        if self._max_size is not None and len(self._entries) >= self._max_size:
+            if not self._entries or (value, item) >= self._worst()[:2]:
+                return False, None
+        existing = self._entries.get(key)
+        if existing is not None:
+            if (value, item) < existing[:2]:
+                self._push((value, item, key))
+                return True, self._output(existing)
+            else:
+                return False, None
+        self._push((value, item, key))
+        return True, self._truncation()
+
+    def remove(self, item: Any) -> Tuple[Any, Any]:
+        """
+        Removes an element from the priority set.
+
+        Args:
+            item (Any): The element to be removed.
+
+        Returns:
+            Tuple[Any, Any]: The priority value and item of the removed element.
+
+        Raises:
+            KeyError: If the element is not in the priority set.
+        """
+        entry = self._entries[self._key(item)]
+        self._discard(entry[2])
+        return self._output(entry)
+
+    def get(self, item: Any, default: Any = None) -> Any:
+        """
+        Returns the priority value of an element.
 
-        j = bisect.bisect_right(self._data, (value, item))
-        if self._max_size is not None and j >= self._max_size:
-            return False, None
-        for i, existing in enumerate(self._data):
-            if self._equality_check(item, existing[1]):
-                if j <= i:  # priority of new value is higher than exististing value
-                    removed_value, removed_item = self._data.pop(i)
-                    if not self._ascending:
-                        removed_value = -removed_value
-                    self._data.insert(j, (value, item))
-                    return True, (removed_value, removed_item)
-                else:
-                    return False, None
-        else:
-            self._data.insert(j, (value, item))
-            return True, self._truncation()
+        Args:
+            item (Any): The element.
+            default (Any): The value returned if the element is not in the priority set. Defaults to None.
+
+        Returns:
+            Any: The priority value of the element, or `default`.
+        """
+        entry = self._entries.get(self._key(item))
+        return default if entry is None else self._output(entry)[0]
 
     def pop(self) -> Any:
         """
@@ -82,10 +173,12 @@ class PrioritySet:
         Returns:
             Any: The element with the highest priority.
         """
-        value, item = self._data.pop(0)
-        if not self._ascending:
-            value = -value  # Invert the value back for descending order
-        return value, item
+        if not self._entries:
+            raise IndexError("pop from an empty priority set")
+        entry = self._best()
+        heapq.heappop(self._heap)
+        self._discard(entry[2])
+        return self._output(entry)
 
     def items(self) -> list:
         """
@@ -94,11 +187,28 @@ class PrioritySet:
         Returns:
             list: List of elements in the priority set.
         """
-        if self._ascending:
-            return self._data
-        else:
-            # Invert the values back for descending order
-            return [(-value, item) for value, item in self._data]
+        return [
+            self._output(entry)
+            for entry in sorted(self._entries.values(), key=lambda entry: entry[:2])
+        ]
+
+    def __contains__(self, item: Any) -> bool:
+        """
+        Returns True if the element is in the priority set, False otherwise.
+
+        Returns:
+            bool: True if the element is in the priority set, False otherwise.
+        """
+        return self._key(item) in self._entries
+
+    def __len__(self) -> int:
+        """
+        Returns the number of elements in the priority set.
+
+        Returns:
+            int: The number of elements in the priority set.
+        """
+        return len(self._entries)
 
     def __bool__(self) -> bool:
         """
@@ -107,7 +217,7 @@ class PrioritySet:
         Returns:
             bool: True if the priority set is non-empty, False otherwise.
         """
-        return bool(self._data)
+        return bool(self._entries)
 
     def __iter__(self):
         """
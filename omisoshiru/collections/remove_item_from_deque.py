@@ -1,4 +1,4 @@
-from collections import deque
+from .lazy_deque import LazyDeque
 
 
 def remove_item_from_deque(deque_obj, condition_func):
@@ -6,13 +6,17 @@ def remove_item_from_deque(deque_obj, condition_func):
     Remove items from a deque based on a custom condition.
 
     Args:
-        deque_obj (deque): The deque from which items should be removed.
+        deque_obj (Union[deque, LazyDeque]): The deque from which items should be removed.
         condition_func (Callable): A callable that takes an item and returns a boolean indicating whether the item should be removed.
 
     Returns:
-        deque: The modified deque with items removed based on the specified condition.
+        Union[deque, LazyDeque]: The modified deque with items removed based on the specified condition.
     """
-    filtered_data = deque(item for item in deque_obj if not condition_func(item))
-    deque_obj.clear()
-    deque_obj.extend(filtered_data)
+    if isinstance(deque_obj, LazyDeque):
+        deque_obj.remove_where(condition_func)
+        return deque_obj
+    kept = [item for item in deque_obj if not condition_func(item)]
+    if len(kept) < len(deque_obj):
+        deque_obj.clear()
+        deque_obj.extend(kept)
     return deque_obj
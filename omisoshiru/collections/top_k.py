@@ -0,0 +1,221 @@
+import heapq
+import itertools
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class TopK:
+    def __init__(
+        self,
+        k: int,
+        largest: bool = True,
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ) -> None:
+        """
+        A streaming collector of the `k` elements with the largest (or smallest) values.
+
+        The collected elements are kept in a bounded heap, so offering an element takes O(log k).
+        Of elements with equal values, the one offered first is kept.
+
+        Args:
+            k (int): The number of elements to keep.
+            largest (bool): If True, the elements with the largest values are kept; if False, the
+                smallest. Defaults to True.
+            key (Optional[Callable[[Any], Hashable]]): If given, elements with the same `key(item)`
+                are deduplicated and only the best value is kept. Defaults to None.
+
+        Example:
+            >>> top_k = TopK(2)
+            >>> top_k.offer(3, 'apple')
+            True
+            >>> top_k.offer_many(np.array([1, 5, 2]), ['banana', 'orange', 'grape'])
+            >>> top_k.items()
+            [(5, 'orange'), (3, 'apple')]
+        """
+        if k < 0:
+            raise ValueError("k must not be negative.")
+        self.k = k
+        self._largest = largest
+        self._key = key
+        self._counter = itertools.count()
+        self._offered = 0
+        # Entries are (value, -count, item) with the value negated for `largest=False`, so the
+        # top of the heap is the worst element. With a key, replaced entries stay in the heap
+        # until they reach the top; an entry is live only if it is the one stored in `_entries`.
+        self._heap: List[Tuple[Any, int, Any]] = []
+        self._entries: Dict[Hashable, Tuple[Any, int, Any]] = {}
+
+    def _sign(self, value: Any) -> Any:
+        return value if self._largest else -value
+
+    def _worst(self) -> Tuple[Any, int, Any]:
+        if self._key is not None:
+            while self._entries.get(self._key(self._heap[0][2])) is not self._heap[0]:
+                heapq.heappop(self._heap)
+        return self._heap[0]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of collected elements.
+
+        Returns:
+            int: The number of collected elements.
+        """
+        return len(self._entries) if self._key is not None else len(self._heap)
+
+    def __bool__(self) -> bool:
+        """
+        Returns True if any element is collected, False otherwise.
+
+        Returns:
+            bool: True if any element is collected, False otherwise.
+        """
+        return len(self) > 0
+
+    @property
+    def threshold(self) -> Optional[Any]:
+        """
+        The value an element must beat to be collected, or None while fewer than `k` elements
+        are collected.
+        """
+        if self.k == 0 or len(self) < self.k:
+            return None
+        return self._sign(self._worst()[0])
+
+    def offer(self, value: Any, item: Any) -> bool:
+        """
+        Offers an element.
+
+        Args:
+            value (Any): The value of the element.
+            item (Any): The element.
+
+        Returns:
+            bool: True if the element is collected, False otherwise.
+        """
+        self._offered += 1
+        if self.k == 0:
+            return False
+        entry = (self._sign(value), -next(self._counter), item)
+        full = len(self) >= self.k
+        if full and entry[0] <= self._worst()[0]:
+            return False
+
+        if self._key is None:
+            if full:
+                heapq.heapreplace(self._heap, entry)
+            else:
+                heapq.heappush(self._heap, entry)
+            return True
+
+        key = self._key(item)
+        existing = self._entries.get(key)
+        if existing is not None and entry[0] <= existing[0]:
+            return False
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        if existing is None and full:
+            worst = self._worst()
+            del self._entries[self._key(worst[2])]
+            heapq.heappop(self._heap)
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+        return True
+
+    def offer_many(
+        self,
+        values: np.ndarray,
+        items: Optional[Iterable[Any]] = None,
+        chunk_size: int = 65536,
+    ) -> None:
+        """
+        Offers many elements at once.
+
+        Each chunk is reduced with NumPy to the candidates that can enter the top `k` (with
+        `np.partition`, or a sort when deduplicating by key) before they are offered one by one.
+
+        Args:
+            values (np.ndarray): The values of the elements.
+            items (Optional[Iterable[Any]]): The elements, of the same length as `values`. Defaults to
+                None, in which case each element is its position among all offered elements.
+            chunk_size (int): The number of elements reduced at once. Defaults to 65536.
+
+        Returns:
+            None
+        """
+        values = np.asarray(values).ravel()
+        offset = self._offered
+        self._offered = offset + len(values)
+        if self.k == 0:
+            return
+        items = None if items is None else list(items)
+        if items is not None and len(items) != len(values):
+            raise ValueError("values and items must have the same length.")
+
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start : start + chunk_size]
+            signed = chunk if self._largest else -chunk
+            threshold = self.threshold
+            if threshold is not None:
+                (candidates,) = np.nonzero(signed > self._sign(threshold))
+            else:
+                candidates = np.arange(len(chunk))
+            if self._key is None and len(candidates) > self.k:
+                # Keep the first offered of the elements equal to the k-th best value.
+                kth = np.partition(signed[candidates], len(candidates) - self.k)[
+                    len(candidates) - self.k
+                ]
+                above = candidates[signed[candidates] > kth]
+                equal = candidates[signed[candidates] == kth][: self.k - len(above)]
+                candidates = np.sort(np.concatenate([above, equal]))
+            elif self._key is not None:
+                candidates = candidates[np.argsort(-signed[candidates], kind="stable")]
+            for i in candidates.tolist():
+                value = chunk[i].item()
+                if self._key is not None and len(self) >= self.k:
+                    # Candidates are sorted, so no later one can be collected either.
+                    if not self._sign(value) > self._sign(self.threshold):
+                        break
+                index = start + i
+                self.offer(value, offset + index if items is None else items[index])
+        self._offered = offset + len(values)
+
+    def merge(self, other: "TopK") -> "TopK":
+        """
+        Merges the elements collected by another collector, e.g. a partial result of a worker.
+
+        Args:
+            other (TopK): The other collector.
+
+        Returns:
+            TopK: This collector.
+        """
+        for value, item in other.items():
+            self.offer(value, item)
+        return self
+
+    def items(self) -> List[Tuple[Any, Any]]:
+        """
+        Returns the collected elements from the best value.
+
+        Returns:
+            List[Tuple[Any, Any]]: List of `(value, item)` of the collected elements.
+        """
+        entries = self._entries.values() if self._key is not None else self._heap
+        return [
+            (self._sign(value), item)
+            for value, _, item in sorted(
+                entries, key=lambda entry: entry[:2], reverse=True
+            )
+        ]
+
+    def __iter__(self):
+        """
+        Returns an iterator for the collected elements from the best value.
+
+        Returns:
+            iterator: Iterator for the collected elements.
+        """
+        return iter(self.items())
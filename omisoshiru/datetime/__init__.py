@@ -7,6 +7,13 @@ Available functions:
     - date_to_str: Convert a datetime object to a string in the format '%Y%m%d'.
 """
 
-from .date_to_str import date_to_str
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "date_to_str": "date_to_str",
+    },
+)
 
 __all__ = ["date_to_str"]
@@ -1,8 +1,6 @@
 from datetime import datetime
 from typing import Literal, Optional
 
-import pandas as pd
-
 
 def date_to_str(
     date: datetime,
@@ -33,6 +31,8 @@ def date_to_str(
         >>> print(date_string)
         '20230101'
     """
+    import pandas as pd
+
     if isinstance(date, datetime) and not pd.isna(date):
         return date.strftime("%Y%m%d")
     elif on_error == "raise":
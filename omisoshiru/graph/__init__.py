@@ -4,8 +4,29 @@ Graph-related utilities and algorithms.
 This module provides utilities and algorithms for working with graphs using the networkx library.
 """
 
-from .bfs_select_nodes import bfs_select_nodes
-from .create_tree_html import create_tree_html
-from .min_cost_within_n_hops import min_cost_within_n_hops
+from .._lazy import attach
 
-__all__ = ["bfs_select_nodes", "min_cost_within_n_hops", "create_tree_html"]
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "bfs_select_nodes": "bfs_select_nodes",
+        "create_tree_html": "create_tree_html",
+        "CSRGraph": "csr_graph",
+        "hop_bounded_costs": "csr_graph",
+        "min_cost_within_n_hops": "min_cost_within_n_hops",
+        "min_cost_within_n_hops_many": "min_cost_within_n_hops_many",
+        "NeighborSampler": "neighbor_sampler",
+        "Subgraph": "neighbor_sampler",
+    },
+)
+
+__all__ = [
+    "bfs_select_nodes",
+    "min_cost_within_n_hops",
+    "min_cost_within_n_hops_many",
+    "create_tree_html",
+    "CSRGraph",
+    "hop_bounded_costs",
+    "NeighborSampler",
+    "Subgraph",
+]
@@ -1,21 +1,105 @@
 # omisoshiru/graph/bfs_select_nodes.py
 
-from typing import Any, List
+import itertools
+from collections import deque
+from typing import Any, Iterable, List, Literal, Tuple, Union
 
 import networkx as nx
+import numpy as np
 
+from .csr_graph import CSRGraph
 
-def bfs_select_nodes(graph: nx.Graph, start_node: Any, target_count: int) -> List[Any]:
+Direction = Literal["out", "in", "both"]
+
+
+def _neighbors(graph: nx.Graph, node: Any, direction: Direction) -> Iterable[Any]:
+    if direction == "out" or not graph.is_directed():
+        return graph.neighbors(node)
+    if direction == "in":
+        return graph.predecessors(node)
+    return itertools.chain(graph.successors(node), graph.predecessors(node))
+
+
+def _csr_graphs(csr: CSRGraph, direction: Direction) -> List[CSRGraph]:
+    # The graphs whose outgoing edges are followed: the graph and/or its reverse.
+    if not csr.directed or direction == "out":
+        return [csr]
+    if direction == "in":
+        return [csr.reverse()]
+    return [csr, csr.reverse()]
+
+
+def _expand_csr(
+    csr: CSRGraph, frontier: np.ndarray, direction: Direction
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # The edges of the frontier in BFS order: by frontier node, outgoing before incoming edges,
+    # then in edge order. Returns the position in `frontier` of the node each edge was followed
+    # from, the neighbor it leads to, the edge id in `csr`, and whether it was followed backwards.
+    origins, neighbors, edges, incoming = [], [], [], []
+    for graph in _csr_graphs(csr, direction):
+        graph_edges, graph_origins = graph.expand(frontier)
+        origins.append(graph_origins)
+        neighbors.append(graph.indices[graph_edges])
+        edges.append(graph.original_edges(graph_edges))
+        incoming.append(np.full(len(graph_edges), graph is not csr))
+    origins, neighbors, edges, incoming = (
+        np.concatenate(arrays) for arrays in (origins, neighbors, edges, incoming)
+    )
+    order = np.lexsort((incoming, origins))
+    return origins[order], neighbors[order], edges[order], incoming[order]
+
+
+def _first_unvisited(neighbors: np.ndarray, visited: np.ndarray) -> np.ndarray:
+    # The unvisited neighbors, each once, in the order they are first reached.
+    neighbors = neighbors[~visited[neighbors]]
+    _, first = np.unique(neighbors, return_index=True)
+    return neighbors[np.sort(first)]
+
+
+def _bfs_csr(
+    csr: CSRGraph, start_nodes: np.ndarray, target_count: int, direction: Direction
+) -> np.ndarray:
+    visited = np.zeros(csr.num_nodes, dtype=bool)
+    frontier = _first_unvisited(start_nodes, visited)[:target_count]
+    visited[frontier] = True
+    selected = [frontier]
+    count = len(frontier)
+
+    while count < target_count and frontier.size:
+        _, neighbors, _, _ = _expand_csr(csr, frontier, direction)
+        frontier = _first_unvisited(neighbors, visited)[: target_count - count]
+        visited[frontier] = True
+        selected.append(frontier)
+        count += len(frontier)
+    return np.concatenate(selected)
+
+
+def bfs_select_nodes(
+    graph: Union[nx.Graph, CSRGraph],
+    start_node: Any,
+    target_count: int,
+    direction: Direction = "out",
+) -> Union[List[Any], np.ndarray]:
     """
     Perform Breadth-First Search (BFS) on a graph to select a specified number of nodes.
 
+    Each node is queued at most once and the search stops as soon as enough nodes are queued, so it
+    takes at most O(V + E).
+
     Args:
-        graph (networkx.Graph): The input graph (NetworkX Graph object).
-        start_node (Any): The starting node for BFS.
+        graph (Union[networkx.Graph, CSRGraph]): The input graph (NetworkX Graph object), or a
+            `CSRGraph` for a vectorized search over large graphs. A `CSRGraph` compiled with
+            `CSRGraph.from_networkx` selects the same nodes as the NetworkX graph; otherwise
+            incoming edges are followed in the order of their source.
+        start_node (Any): The starting node for BFS, or a list of starting nodes which are all
+            selected first. With a `CSRGraph`, the node positions (ids) as an int array or list.
         target_count (int): The number of nodes to be selected.
+        direction (Literal["out", "in", "both"]): The edges followed in a directed graph: outgoing,
+            incoming, or both. Defaults to "out".
 
     Returns:
-        List[Any]: A list of selected nodes.
+        Union[List[Any], np.ndarray]: A list of selected nodes, or an array of their positions
+        with a `CSRGraph`.
 
     Example:
         >>> import networkx as nx
@@ -26,18 +110,37 @@ def bfs_select_nodes(graph: nx.Graph, start_node: Any, target_count: int) -> Lis
         >>> bfs_select_nodes(graph, start_node, target_count)
         [1, 2, 3]
     """
+    valid_directions = ["out", "in", "both"]
+    if direction not in valid_directions:
+        raise ValueError(
+            f"Invalid direction. Valid values are: {', '.join(valid_directions)}"
+        )
+
+    if isinstance(graph, CSRGraph):
+        start_nodes = np.atleast_1d(np.asarray(start_node, dtype=np.int64))
+        return _bfs_csr(graph, start_nodes, target_count, direction)
+
+    start_nodes = start_node if isinstance(start_node, list) else [start_node]
     visited = set()
-    queue = [start_node]
+    queue = deque()
     selected_nodes = []
+    for node in start_nodes:
+        if node not in visited and len(visited) < target_count:
+            visited.add(node)
+            queue.append(node)
 
-    while queue and len(selected_nodes) < target_count:
-        current_node = queue.pop(0)
-
-        if current_node not in visited:
-            visited.add(current_node)
-            selected_nodes.append(current_node)
+    while queue:
+        current_node = queue.popleft()
+        selected_nodes.append(current_node)
 
-            neighbors = list(graph.neighbors(current_node))
-            queue.extend(neighbors)
+        # Every queued node is selected, so stop queueing once there are enough.
+        if len(visited) >= target_count:
+            continue
+        for neighbor in _neighbors(graph, current_node, direction):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append(neighbor)
+                if len(visited) >= target_count:
+                    break
 
     return selected_nodes
@@ -53,24 +53,36 @@ def create_tree_html(
         nodes_with_edges = [node for node, degree in graph.degree() if degree > 0]
         root_node = random.choice(nodes_with_edges)
 
-    # Initialize HeapQueue and subgraph
+    # Initialize HeapQueue and subgraph. The queue holds each node once, with the weight of the
+    # heaviest edge found to it so far; `parents` holds the corresponding depth, parent and label.
     queue = HeapQueue(ascending=False)
     subgraph = nx.Graph()
-    queue.push(1, (0, root_node, None, None))
+    queue.push(1, root_node)
+    parents = {root_node: (0, None, None)}
+    visited = set()
 
     # Build the tree using BFS
     while queue and subgraph.number_of_nodes() < max_nodes:
-        weight, (depth, node, parent, label) = queue.pop()
-        if parent is not None and not subgraph.has_node(node):
+        weight, node = queue.pop()
+        depth, parent, label = parents.pop(node)
+        visited.add(node)
+        if parent is not None:
             subgraph.add_edge(parent, node, label=label, weight=(weight * 10))
         if depth < max_depth:
             neighbors = graph.neighbors(node)
             for neighbor in neighbors:
+                if neighbor in visited:
+                    continue
                 data = [
                     __data
                     for __x, __y, __data in graph.edges(node, data=True)
                     if __y == neighbor
                 ]
+                weight = max(
+                    [data["weight"] if "weight" in data else 1 for data in data]
+                )
+                if neighbor in queue and queue.get(neighbor) >= weight:
+                    continue
                 label = "\n\n".join(
                     [
                         f"link[{i}]\n"
@@ -78,10 +90,8 @@ def create_tree_html(
                         for i, data in enumerate(data)
                     ]
                 )
-                weight = max(
-                    [data["weight"] if "weight" in data else 1 for data in data]
-                )
-                queue.push(weight, (depth + 1, neighbor, node, label))
+                queue.update(weight, neighbor)
+                parents[neighbor] = (depth + 1, node, label)
 
     subgraph = nx.relabel_nodes(
         subgraph,
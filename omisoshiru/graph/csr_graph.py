@@ -0,0 +1,285 @@
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+
+import networkx as nx
+import numpy as np
+
+
+class CSRGraph:
+    def __init__(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        nodes: Optional[Sequence[Any]] = None,
+        edge_data: Optional[Dict[str, np.ndarray]] = None,
+        directed: bool = True,
+    ) -> None:
+        """
+        A read-only graph in compressed sparse row (CSR) format.
+
+        The edges leaving node `i` are `indices[indptr[i]:indptr[i + 1]]`, and their attributes are
+        the same slices of the arrays in `edge_data`. Nodes are identified by their position; `nodes`
+        maps positions back to the original node labels.
+
+        Args:
+            indptr (np.ndarray): The offsets of the edges of each node, of length `num_nodes + 1`.
+            indices (np.ndarray): The target node of each edge.
+            nodes (Optional[Sequence[Any]]): The label of each node. Defaults to None, in which case the
+                labels are the positions.
+            edge_data (Optional[Dict[str, np.ndarray]]): Numeric edge attributes, one value per edge.
+                Missing values are NaN. Defaults to None.
+            directed (bool): False if every edge is stored in both directions. Defaults to True.
+
+        Example:
+            >>> graph = nx.Graph()
+            >>> graph.add_edge('a', 'b', cost=1)
+            >>> csr = CSRGraph.from_networkx(graph)
+            >>> csr.neighbors(csr.index('a'))
+            array([1])
+        """
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.num_nodes = len(self.indptr) - 1
+        self.nodes = list(nodes) if nodes is not None else list(range(self.num_nodes))
+        self.edge_data = {
+            name: np.asarray(values, dtype=np.float64)
+            for name, values in (edge_data or {}).items()
+        }
+        self.directed = directed
+        self._index: Optional[Dict[Any, int]] = None
+        self._checked: Dict[str, bool] = {}
+        self._reverse: Optional[CSRGraph] = None
+        self._reversed_edges: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_networkx(
+        cls, graph: nx.Graph, edge_attributes: Sequence[str] = ("cost", "weight")
+    ) -> "CSRGraph":
+        """
+        Compile a NetworkX graph.
+
+        The edges of each node keep the order of `graph.edges(node)`, and every parallel edge of a
+        multigraph is kept. An undirected edge is stored in both directions. For a directed graph,
+        `reverse` is compiled at the same time, keeping the order of `graph.in_edges(node)`.
+
+        Args:
+            graph (nx.Graph): The graph.
+            edge_attributes (Sequence[str]): The numeric edge attributes to keep.
+                Defaults to ("cost", "weight").
+
+        Returns:
+            CSRGraph: The compiled graph.
+        """
+        nodes = list(graph.nodes)
+        index = {node: i for i, node in enumerate(nodes)}
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        indices: List[int] = []
+        edge_data: Dict[str, List[float]] = {name: [] for name in edge_attributes}
+        # The id of each edge by (source, target) or (source, target, key), to compile `reverse`.
+        edge_ids: Dict[tuple, int] = {}
+        multigraph = graph.is_multigraph()
+        for i, node in enumerate(nodes):
+            for edge in graph.edges(
+                node, data=True, **({"keys": True} if multigraph else {})
+            ):
+                if graph.is_directed():
+                    edge_ids[edge[:-1]] = len(indices)
+                indices.append(index[edge[1]])
+                for name in edge_attributes:
+                    edge_data[name].append(edge[-1].get(name, np.nan))
+            indptr[i + 1] = len(indices)
+        csr = cls(
+            indptr,
+            np.array(indices, dtype=np.int64),
+            nodes,
+            edge_data,
+            directed=graph.is_directed(),
+        )
+        csr._index = index
+        if graph.is_directed():
+            # Follow incoming edges in the same order as NetworkX, e.g. for `bfs_select_nodes`.
+            order = [
+                edge_ids[edge]
+                for node in nodes
+                for edge in graph.in_edges(
+                    node, **({"keys": True} if multigraph else {})
+                )
+            ]
+            csr._set_reverse(np.array(order, dtype=np.int64))
+        return csr
+
+    def index(self, node: Any) -> int:
+        """
+        Returns the position of a node.
+
+        Args:
+            node (Any): The node label.
+
+        Returns:
+            int: The position of the node.
+        """
+        if self._index is None:
+            self._index = {node: i for i, node in enumerate(self.nodes)}
+        return self._index[node]
+
+    def neighbors(self, i: int) -> np.ndarray:
+        """
+        Returns the targets of the edges leaving a node.
+
+        Args:
+            i (int): The position of the node.
+
+        Returns:
+            np.ndarray: The positions of the targets.
+        """
+        return self.indices[self.indptr[i] : self.indptr[i + 1]]
+
+    def reverse(self) -> "CSRGraph":
+        """
+        Returns the graph with every edge reversed, e.g. to follow the edges entering a node.
+        The result is computed once and cached.
+
+        Returns:
+            CSRGraph: The reversed graph. The edges entering each node keep the order of
+            `graph.in_edges(node)` for a graph compiled with `from_networkx`, and are ordered by
+            their source otherwise.
+        """
+        if not self.directed:
+            return self
+        if self._reverse is None:
+            self._set_reverse(np.argsort(self.indices, kind="stable"))
+        return self._reverse
+
+    def _set_reverse(self, order: np.ndarray) -> None:
+        # `order` lists the edge ids grouped by target, in the order of the reversed edges.
+        sources = np.repeat(np.arange(self.num_nodes), np.diff(self.indptr))
+        indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=self.num_nodes), out=indptr[1:])
+        self._reverse = CSRGraph(
+            indptr,
+            sources[order],
+            self.nodes,
+            {name: values[order] for name, values in self.edge_data.items()},
+        )
+        self._reverse._index = self._index
+        self._reverse._reverse = self
+        self._reverse._reversed_edges = order
+
+    def original_edges(self, edges: np.ndarray) -> np.ndarray:
+        """
+        Returns the ids of edges in the graph this one was reversed from, e.g. to tell whether
+        edges followed in both directions are the same.
+
+        Args:
+            edges (np.ndarray): The edge ids.
+
+        Returns:
+            np.ndarray: The ids of the reversed edges for a graph returned by `reverse`, and
+            `edges` otherwise.
+        """
+        return edges if self._reversed_edges is None else self._reversed_edges[edges]
+
+    def edge_attribute(self, name: str) -> np.ndarray:
+        """
+        Returns an edge attribute of all edges.
+
+        Args:
+            name (str): The attribute name.
+
+        Returns:
+            np.ndarray: The value of each edge.
+
+        Raises:
+            KeyError: If the attribute is not stored or is missing for some edge.
+        """
+        if name not in self.edge_data:
+            raise KeyError(name)
+        if name not in self._checked:
+            self._checked[name] = not np.isnan(self.edge_data[name]).any()
+        if not self._checked[name]:
+            raise KeyError(f"Some edges have no `{name}` attribute.")
+        return self.edge_data[name]
+
+    def expand(self, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns all edges leaving a set of nodes.
+
+        Args:
+            frontier (np.ndarray): The positions of the nodes.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The edge ids, and the position in `frontier` of the
+            source of each edge.
+        """
+        starts = self.indptr[frontier]
+        counts = self.indptr[frontier + 1] - starts
+        sources = np.repeat(np.arange(len(frontier)), counts)
+        # The edge ids of each node are consecutive, starting at `starts`.
+        offsets = np.cumsum(counts) - counts
+        edges = np.arange(counts.sum()) - np.repeat(offsets - starts, counts)
+        return edges, sources
+
+
+def hop_bounded_costs(
+    csr: CSRGraph,
+    source: int,
+    max_hops: Optional[int] = 5,
+    cost_type: Literal["cost", "weight"] = "cost",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the best cost of each node reachable from a source node within a number of hops.
+
+    For "cost", the cost of a path is the sum of the `cost` attribute of its edges, and the lowest
+    cost is the best. For "weight", it is the product of the `weight` attribute of its edges, and
+    the highest weight is the best; weights are expected to be non-negative. Paths may revisit
+    nodes, including the source, whose cost of the empty path is 0 (or 1 for "weight").
+
+    The search relaxes the edges of the nodes improved in the previous hop, one hop at a time,
+    with vectorized NumPy operations.
+
+    Args:
+        csr (CSRGraph): The graph.
+        source (int): The position of the source node.
+        max_hops (Optional[int]): The maximum number of hops. Defaults to 5. None means no limit.
+        cost_type (Literal["cost", "weight"]): The type of cost. Defaults to "cost".
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The positions of the reached nodes and their best costs.
+
+    Raises:
+        ValueError: If `max_hops` is None and costs keep improving along a cycle.
+    """
+    if cost_type == "cost":
+        best = np.full(csr.num_nodes, np.inf)
+        best[source] = 0.0
+    elif cost_type == "weight":
+        best = np.full(csr.num_nodes, -np.inf)
+        best[source] = 1.0
+    else:
+        raise ValueError("Invalid cost_type. Valid values are: cost, weight")
+    data = csr.edge_attribute(cost_type) if csr.indptr[-1] > 0 else np.empty(0)
+
+    frontier = np.array([source], dtype=np.int64)
+    hops = 0
+    while frontier.size and (max_hops is None or hops < max_hops):
+        if max_hops is None and hops > csr.num_nodes:
+            raise ValueError(
+                "Costs improve along a cycle. Specify max_hops for such graphs."
+            )
+        edges, sources = csr.expand(frontier)
+        targets = csr.indices[edges]
+        if cost_type == "cost":
+            candidates = best[frontier][sources] + data[edges]
+            improved = candidates < best[targets]
+        else:
+            candidates = best[frontier][sources] * data[edges]
+            improved = candidates > best[targets]
+        targets, candidates = targets[improved], candidates[improved]
+        if cost_type == "cost":
+            np.minimum.at(best, targets, candidates)
+        else:
+            np.maximum.at(best, targets, candidates)
+        frontier = np.unique(targets)
+        hops += 1
+
+    (reached,) = np.nonzero(np.isfinite(best))
+    return reached, best[reached]
@@ -1,14 +1,155 @@
-from collections import deque
-from typing import Any, Literal, Optional
+import operator
+from typing import Any, Callable, Dict, Iterable, Literal, Optional, Tuple, Union
 
 import networkx as nx
+import numpy as np
 
-from ..collections import PrioritySet, remove_item_from_deque
+from ..collections import HeapQueue, PrioritySet
+from .csr_graph import CSRGraph, hop_bounded_costs
 
 
-def min_cost_within_n_hops(
+def _select_best(
+    reached: np.ndarray, costs: np.ndarray, ascending: bool, max_nodes: Optional[int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    if max_nodes is not None and len(costs) > max_nodes > 0:
+        # Keep every node tied with the last one, so PrioritySet breaks the ties as usual.
+        order = costs if ascending else -costs
+        keep = order <= np.partition(order, max_nodes - 1)[max_nodes - 1]
+        reached, costs = reached[keep], costs[keep]
+    return reached, costs
+
+
+def _to_priority_set(
+    csr: CSRGraph,
+    reached: np.ndarray,
+    costs: np.ndarray,
+    ascending: bool,
+    max_nodes: Optional[int],
+) -> PrioritySet:
+    reached, costs = _select_best(reached, costs, ascending, max_nodes)
+    priority_set = PrioritySet(ascending=ascending, max_size=max_nodes)
+    for i, cost in zip(reached.tolist(), costs.tolist()):
+        priority_set.add(cost, csr.nodes[i])
+    return priority_set
+
+
+def _operators(cost_type: str) -> Tuple[Callable, Callable]:
+    # How a cost is extended by an edge, and which of two costs is better.
+    if cost_type == "cost":
+        return operator.add, operator.lt
+    return operator.mul, operator.gt
+
+
+def _edges(graph: nx.Graph, node: Any) -> Iterable[Tuple[Any, dict]]:
+    if graph.is_multigraph():
+        return (
+            (next_node, data) for _, next_node, data in graph.edges(node, data=True)
+        )
+    return graph.adj[node].items()
+
+
+def _never_improves(graph: nx.Graph, cost_type: str) -> bool:
+    # Whether no edge can improve the cost of a path: non-negative costs, or weights up to 1.
+    if cost_type == "cost":
+        return all(value >= 0 for _, _, value in graph.edges(data=cost_type))
+    return all(0 <= value <= 1 for _, _, value in graph.edges(data=cost_type))
+
+
+def _push_state(
+    queue: HeapQueue,
+    labels: Dict[Any, Dict[int, Any]],
+    is_better: Callable,
+    node: Any,
+    hops: int,
+    cost: Any,
+) -> None:
+    # Queue a (node, hops) state unless a state of the node with no more hops has no worse cost.
+    node_labels = labels.setdefault(node, {})
+    for h, c in node_labels.items():
+        if h <= hops and not is_better(cost, c):
+            return
+    # Queued states with more hops and no better cost are dominated by the new one. Expanded
+    # states keep their label, so they are never expanded again.
+    for h, c in list(node_labels.items()):
+        if h > hops and not is_better(c, cost) and (node, h) in queue:
+            queue.remove((node, h))
+            del node_labels[h]
+    node_labels[hops] = cost
+    queue.update(cost, (node, hops))
+
+
+def _best_first(
     graph: nx.Graph,
     source_node: Any,
+    max_hops: Optional[int],
+    max_nodes: Optional[int],
+    cost_type: str,
+) -> Dict[Any, Any]:
+    # Dijkstra over (node, hops) states. It requires that extending a path never improves its
+    # cost, which the caller checks with _never_improves.
+    extend, is_better = _operators(cost_type)
+    initial_cost = 0 if cost_type == "cost" else 1
+    queue = HeapQueue(ascending=cost_type == "cost")
+    queue.push(initial_cost, (source_node, 0))
+    # The cost of each state queued or expanded so far, by node and hops. A new state is pruned
+    # if a state of the node with no more hops has no worse cost.
+    labels: Dict[Any, Dict[int, Any]] = {source_node: {0: initial_cost}}
+    best: Dict[Any, Any] = {}
+    # The cost of the max_nodes-th node found. The search goes on through every state tied with
+    # it, so the caller can break the ties by (cost, node) like the CSR backend.
+    cutoff = None
+
+    while queue:
+        cost, (node, hops) = queue.pop()
+        if cutoff is not None and is_better(cutoff, cost):
+            break
+        if node not in best:
+            # States are popped from the best cost, so the first one of a node is its best.
+            best[node] = cost
+            if cutoff is None and max_nodes is not None and len(best) >= max_nodes:
+                cutoff = cost
+        if max_hops is not None and hops >= max_hops:
+            continue
+
+        next_hops = hops + 1
+        last_hop = max_hops is not None and next_hops >= max_hops
+        for next_node, data in _edges(graph, node):
+            if last_hop and next_node in best:
+                continue
+            next_cost = extend(cost, data[cost_type])
+            _push_state(queue, labels, is_better, next_node, next_hops, next_cost)
+    return best
+
+
+def _hop_layers(
+    graph: nx.Graph, source_node: Any, max_hops: Optional[int], cost_type: str
+) -> Dict[Any, Any]:
+    # Bellman-Ford bounded by hops: each hop extends only the nodes improved in the previous
+    # one, so every (node, hops) state is expanded at most once.
+    extend, is_better = _operators(cost_type)
+    best = {source_node: 0 if cost_type == "cost" else 1}
+    layer = dict(best)
+    hops = 0
+    while layer and (max_hops is None or hops < max_hops):
+        if max_hops is None and hops > graph.number_of_nodes():
+            raise ValueError(
+                "Costs improve along a cycle. Specify max_hops for such graphs."
+            )
+        next_layer = {}
+        for node, cost in layer.items():
+            for next_node, data in _edges(graph, node):
+                next_cost = extend(cost, data[cost_type])
+                if next_node not in best or is_better(next_cost, best[next_node]):
+                    best[next_node] = next_cost
+                    next_layer[next_node] = next_cost
+        layer = next_layer
+        hops += 1
+    return best
+
+
+def min_cost_within_n_hops(
+    graph: Union[nx.Graph, CSRGraph],
+    source_node: Any,
     max_hops: Optional[int] = 5,
     max_nodes: Optional[int] = None,
     cost_type: Optional[Literal["cost", "weight"]] = "cost",
@@ -16,11 +157,25 @@ def min_cost_within_n_hops(
     """
     Finds the minimum cost paths within a specified number of hops from a source node in a graph.
 
+    Each node gets the best cost of all paths from the source node with at most `max_hops` edges.
+    Paths may revisit nodes, so the source node itself may get a better cost than the initial one
+    through a cycle. With "cost", the cost of a path is the sum of the `cost` attributes of its
+    edges and lower is better; with "weight", it is the product of the `weight` attributes and
+    higher is better (weights are expected to be non-negative).
+
+    The graph is searched hop by hop, extending only the nodes improved by the previous hop. With
+    `max_nodes`, when no edge can improve a path (non-negative costs, or weights up to 1), it is
+    instead searched best-first over (node, hops) states and stops once `max_nodes` nodes are
+    found. Either way, each (node, hops) state is expanded at most once.
+
     Args:
-        graph (nx.Graph): The input graph.
+        graph (Union[nx.Graph, CSRGraph]): The input graph. For large graphs, compile it once with
+            `CSRGraph.from_networkx` and pass the `CSRGraph`, which is searched with vectorized
+            NumPy operations.
         source_node (Any): The source node to start the traversal.
         max_hops (Optional[int]): The maximum number of hops to consider. Defaults to 5.
-        max_nodes (Optional[int]): The maximum number of nodes to visit. Defaults to None.
+            None means no limit.
+        max_nodes (Optional[int]): The maximum number of nodes to return. Defaults to None.
         cost_type (Optional[Literal]): The type of cost to consider.
             Valid values are "cost" or "weight". Defaults to "cost".
 
@@ -34,41 +189,23 @@ def min_cost_within_n_hops(
             f"Invalid cost_type. Valid values are: {', '.join(valid_cost_types)}"
         )
 
-    # Determine priority order and cost calculation based on cost_type
+    # Determine priority order based on cost_type
     ascending_order = True if cost_type == "cost" else False
-    cost_calculation = lambda x, y: x + y if cost_type == "cost" else x * y
-    initial_cost = 0 if cost_type == "cost" else 1
 
-    # Initialize the queue with the source node
-    hop_cost_node_queue = deque()
-    hop_cost_node_queue.append((0, initial_cost, source_node))  # hop, cost, node
-
-    # Initialize the priority set
-    priority_set = PrioritySet(
-        equality_check=lambda x, y: x == y,
-        ascending=ascending_order,
-        max_size=max_nodes,
-    )
-    priority_set.add(initial_cost, source_node)
-
-    # Process nodes in the queue
-    while hop_cost_node_queue:
-        current_hop, current_cost, current_node = hop_cost_node_queue.popleft()
-
-        # Explore neighboring nodes
-        edges = graph.edges(current_node, data=True)
-        for _, next_node, data in edges:
-            next_hop = current_hop + 1
-            next_cost = cost_calculation(current_cost, data[cost_type])
-
-            # Add the next node to the priority set if it has not been visited
-            # and the maximum hop limit has not been reached
-            succeed, removed = priority_set.add(next_cost, next_node)
-            if removed:
-                remove_item_from_deque(
-                    hop_cost_node_queue, lambda x: x[2] == removed[1]
-                )
-            if succeed and next_hop < max_hops:
-                hop_cost_node_queue.append((next_hop, next_cost, next_node))
+    if isinstance(graph, CSRGraph):
+        reached, costs = hop_bounded_costs(
+            graph, graph.index(source_node), max_hops, cost_type
+        )
+        return _to_priority_set(graph, reached, costs, ascending_order, max_nodes)
+
+    # With max_nodes, search best-first so the search can stop early. It requires that costs
+    # can only get worse along a path; otherwise, or without max_nodes, search hop by hop.
+    if max_nodes is not None and _never_improves(graph, cost_type):
+        best = _best_first(graph, source_node, max_hops, max_nodes, cost_type)
+    else:
+        best = _hop_layers(graph, source_node, max_hops, cost_type)
 
+    priority_set = PrioritySet(ascending=ascending_order, max_size=max_nodes)
+    for node, cost in best.items():
+        priority_set.add(cost, node)
     return priority_set
@@ -0,0 +1,100 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, Literal, Optional, Tuple, Union
+
+import networkx as nx
+import numpy as np
+
+from ..collections import PrioritySet
+from .csr_graph import CSRGraph, hop_bounded_costs
+from .min_cost_within_n_hops import _select_best, _to_priority_set
+
+_worker_graph: Optional[CSRGraph] = None
+
+
+def _init_worker(csr: CSRGraph) -> None:
+    global _worker_graph
+    _worker_graph = csr
+
+
+def _search(
+    csr: Optional[CSRGraph],
+    source: int,
+    max_hops: Optional[int],
+    max_nodes: Optional[int],
+    cost_type: str,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Worker processes receive the graph once, through `_init_worker`.
+    csr = _worker_graph if csr is None else csr
+    reached, costs = hop_bounded_costs(csr, source, max_hops, cost_type)
+    return _select_best(reached, costs, cost_type == "cost", max_nodes)
+
+
+def min_cost_within_n_hops_many(
+    graph: Union[nx.Graph, CSRGraph],
+    source_nodes: Iterable[Any],
+    max_hops: Optional[int] = 5,
+    max_nodes: Optional[int] = None,
+    cost_type: Literal["cost", "weight"] = "cost",
+    max_workers: Optional[int] = None,
+    chunksize: int = 16,
+) -> Iterator[Tuple[Any, PrioritySet]]:
+    """
+    Runs `min_cost_within_n_hops` for many source nodes, sharing the graph preprocessing.
+
+    The graph is compiled to a `CSRGraph` once (unless it already is one) and sent once to each
+    worker process. Results are yielded in the order of `source_nodes` as soon as they are ready.
+
+    Args:
+        graph (Union[nx.Graph, CSRGraph]): The input graph.
+        source_nodes (Iterable[Any]): The source nodes.
+        max_hops (Optional[int]): The maximum number of hops to consider. Defaults to 5.
+            None means no limit.
+        max_nodes (Optional[int]): The maximum number of nodes returned per source. Defaults to None.
+        cost_type (Literal["cost", "weight"]): The type of cost to consider.
+            Valid values are "cost" or "weight". Defaults to "cost".
+        max_workers (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+            If 1, the sources are searched in the calling process.
+        chunksize (int): The number of sources sent to a worker at once. Defaults to 16.
+
+    Yields:
+        Tuple[Any, PrioritySet]: Each source node and the PrioritySet `min_cost_within_n_hops`
+        returns for a `CSRGraph`.
+
+    Example:
+        >>> for source, result in min_cost_within_n_hops_many(graph, [1, 2, 3], max_nodes=10):
+        ...     print(source, result.items())
+    """
+    valid_cost_types = ["cost", "weight"]
+    if cost_type not in valid_cost_types:
+        raise ValueError(
+            f"Invalid cost_type. Valid values are: {', '.join(valid_cost_types)}"
+        )
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_networkx(graph, edge_attributes=[cost_type])
+    source_nodes = list(source_nodes)
+    sources = [graph.index(node) for node in source_nodes]
+    ascending = cost_type == "cost"
+
+    if max_workers == 1:
+        for node, source in zip(source_nodes, sources):
+            reached, costs = _search(graph, source, max_hops, max_nodes, cost_type)
+            yield node, _to_priority_set(graph, reached, costs, ascending, max_nodes)
+        return
+
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(graph,)
+    )
+    try:
+        results = executor.map(
+            _search,
+            [None] * len(sources),
+            sources,
+            [max_hops] * len(sources),
+            [max_nodes] * len(sources),
+            [cost_type] * len(sources),
+            chunksize=chunksize,
+        )
+        for node, (reached, costs) in zip(source_nodes, results):
+            yield node, _to_priority_set(graph, reached, costs, ascending, max_nodes)
+    finally:
+        executor.shutdown(cancel_futures=True)
@@ -0,0 +1,184 @@
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Literal, Optional, Sequence, Union
+
+import networkx as nx
+import numpy as np
+
+from .bfs_select_nodes import _expand_csr, _first_unvisited
+from .csr_graph import CSRGraph
+
+
+@dataclass
+class Subgraph:
+    """
+    A sampled neighborhood of a batch of seed nodes.
+
+    `nodes` holds the positions of the sampled nodes in the `CSRGraph`, starting with the seeds.
+    `edge_index` holds the sampled edges as a `(2, num_edges)` array of source and target indices
+    into `nodes`, in the direction of the graph.
+    """
+
+    nodes: np.ndarray
+    edge_index: np.ndarray
+    num_seeds: int
+
+
+class NeighborSampler:
+    def __init__(
+        self,
+        graph: Union[nx.Graph, CSRGraph],
+        fanouts: Sequence[int],
+        batch_size: int = 1,
+        direction: Literal["out", "in", "both"] = "out",
+        shuffle: bool = False,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Samples fixed-size k-hop neighborhood subgraphs around seed nodes.
+
+        From the nodes reached in the previous hop (the seeds at first), each hop samples at most
+        `fanouts[hop]` of the edges of every node uniformly without replacement (counting both
+        directions with "both"), and the neighbors not sampled before are the nodes of the next
+        hop. A batch therefore has at most
+        `batch_size * (1 + f1 + f1 * f2 + ...)` nodes. Each hop is sampled with vectorized NumPy
+        operations over the whole batch.
+
+        The sampler can be iterated with `sample`, or used as the `epoch_processor` of a
+        `DynamicDataset` whose data is the seed nodes, in which case every epoch is sampled anew.
+
+        Args:
+            graph (Union[networkx.Graph, CSRGraph]): The graph. A NetworkX graph is compiled to a
+                `CSRGraph` once.
+            fanouts (Sequence[int]): The maximum number of edges sampled per node at each hop. -1
+                samples all edges.
+            batch_size (int): The number of seed nodes sampled into one subgraph. Defaults to 1.
+            direction (Literal["out", "in", "both"]): The edges followed in a directed graph:
+                outgoing, incoming, or both. Defaults to "out".
+            shuffle (bool): If True, the seed nodes are shuffled before batching. Defaults to False.
+            seed (Optional[int]): The random seed. Defaults to None.
+
+        Example:
+            >>> graph = nx.path_graph(5)
+            >>> sampler = NeighborSampler(graph, fanouts=[-1, -1])
+            >>> subgraph = next(sampler.sample([2]))
+            >>> sampler.csr.nodes[subgraph.nodes[0]]
+            2
+            >>> subgraph.nodes.tolist()
+            [2, 1, 3, 0, 4]
+            >>> subgraph.edge_index.tolist()
+            [[0, 0, 1, 1, 2, 2], [1, 2, 3, 0, 0, 4]]
+        """
+        valid_directions = ["out", "in", "both"]
+        if direction not in valid_directions:
+            raise ValueError(
+                f"Invalid direction. Valid values are: {', '.join(valid_directions)}"
+            )
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        self.csr = (
+            graph if isinstance(graph, CSRGraph) else CSRGraph.from_networkx(graph)
+        )
+        self._labels = not isinstance(graph, CSRGraph)
+        self.fanouts = list(fanouts)
+        self.batch_size = batch_size
+        self.direction = direction
+        self.shuffle = shuffle
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        # Whether each node is in the current subgraph, and its index there (-1 if not). Reset
+        # after each batch, so a batch costs only its own size.
+        self._visited = np.zeros(self.csr.num_nodes, dtype=bool)
+        self._local = np.full(self.csr.num_nodes, -1, dtype=np.int64)
+
+    def _sample_batch(self, seeds: np.ndarray, rng: np.random.Generator) -> Subgraph:
+        local, visited = self._local, self._visited
+        frontier = _first_unvisited(seeds, visited)
+        visited[frontier] = True
+        local[frontier] = np.arange(len(frontier))
+        num_seeds = num_nodes = len(frontier)
+        nodes = [frontier]
+        sources, targets, edge_ids = [], [], []
+
+        for fanout in self.fanouts:
+            if frontier.size == 0:
+                break
+            origins, neighbors, edges, incoming = _expand_csr(
+                self.csr, frontier, self.direction
+            )
+            if fanout >= 0 and len(origins):
+                # Sample uniformly by ranking the edges of each node in a random order.
+                order = np.lexsort((rng.random(len(origins)), origins))
+                ranks = np.arange(len(order)) - np.searchsorted(
+                    origins[order], origins[order]
+                )
+                keep = np.sort(order[ranks < fanout])
+                origins, neighbors = origins[keep], neighbors[keep]
+                edges, incoming = edges[keep], incoming[keep]
+            centers = frontier[origins]
+            sources.append(np.where(incoming, neighbors, centers))
+            targets.append(np.where(incoming, centers, neighbors))
+            edge_ids.append(edges)
+
+            frontier = _first_unvisited(neighbors, visited)
+            visited[frontier] = True
+            local[frontier] = np.arange(num_nodes, num_nodes + len(frontier))
+            num_nodes += len(frontier)
+            nodes.append(frontier)
+
+        nodes = np.concatenate(nodes)
+        if sources:
+            sources, targets = np.concatenate(sources), np.concatenate(targets)
+            if self.csr.directed and self.direction == "both":
+                # An edge between two sampled nodes may be sampled from both of them.
+                _, first = np.unique(np.concatenate(edge_ids), return_index=True)
+                first = np.sort(first)
+                sources, targets = sources[first], targets[first]
+            edge_index = np.stack([local[sources], local[targets]])
+        else:
+            edge_index = np.empty((2, 0), dtype=np.int64)
+        local[nodes] = -1
+        visited[nodes] = False
+        return Subgraph(nodes=nodes, edge_index=edge_index, num_seeds=num_seeds)
+
+    def _sample(
+        self, seed_nodes: Iterable[Any], rng: np.random.Generator
+    ) -> Iterator[Subgraph]:
+        if self._labels:
+            seeds = np.array(
+                [self.csr.index(node) for node in seed_nodes], dtype=np.int64
+            )
+        else:
+            seeds = np.asarray(list(seed_nodes), dtype=np.int64)
+        if self.shuffle:
+            seeds = rng.permutation(seeds)
+        for start in range(0, len(seeds), self.batch_size):
+            yield self._sample_batch(seeds[start : start + self.batch_size], rng)
+
+    def sample(self, seed_nodes: Iterable[Any]) -> Iterator[Subgraph]:
+        """
+        Samples the neighborhoods of seed nodes, one batch at a time.
+
+        Args:
+            seed_nodes (Iterable[Any]): The seed nodes: node labels for a NetworkX graph, or node
+                positions for a `CSRGraph`.
+
+        Returns:
+            Iterator[Subgraph]: The subgraph of each batch of `batch_size` seed nodes.
+        """
+        return self._sample(seed_nodes, self._rng)
+
+    def __call__(self, epoch: int, seed_nodes: Iterable[Any]) -> Iterator[Subgraph]:
+        """
+        Samples the neighborhoods of seed nodes for an epoch, as the `epoch_processor` of a
+        `DynamicDataset`. With a `seed`, each epoch is reproducible.
+
+        Args:
+            epoch (int): The epoch number.
+            seed_nodes (Iterable[Any]): The seed nodes, as in `sample`.
+
+        Returns:
+            Iterator[Subgraph]: The subgraph of each batch of `batch_size` seed nodes.
+        """
+        rng = np.random.default_rng(None if self.seed is None else [self.seed, epoch])
+        return self._sample(seed_nodes, rng)
@@ -4,6 +4,13 @@ Mathematical utilities.
 This module provides mathematical utilities, including functions for calculating cosine similarity.
 """
 
-from .cosine_similarity import cosine_similarity
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "cosine_similarity": "cosine_similarity",
+    },
+)
 
 __all__ = ["cosine_similarity"]
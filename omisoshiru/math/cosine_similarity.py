@@ -1,7 +1,6 @@
 from typing import Optional
 
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity as pairwise_cosine_similarity
 
 
 def cosine_similarity(
@@ -36,6 +35,10 @@ def cosine_similarity(
     pairwise = pairwise if pairwise is not None else False
 
     if pairwise:
+        from sklearn.metrics.pairwise import (
+            cosine_similarity as pairwise_cosine_similarity,
+        )
+
         return pairwise_cosine_similarity(a, b)
 
     else:
@@ -1,3 +1,12 @@
-from . import datasets, models
-from .early_stopping_helper import EarlyStoppingHelper
-from .training_logger import TrainingLogger
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=["datasets", "models"],
+    attributes={
+        "EarlyStoppingHelper": "early_stopping_helper",
+        "TrainingLogger": "training_logger",
+    },
+)
+
+__all__ = ["EarlyStoppingHelper", "TrainingLogger"]
@@ -1 +1,10 @@
-from .dynamic_dataset import DynamicDataset
+from ..._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "DynamicDataset": "dynamic_dataset",
+    },
+)
+
+__all__ = ["DynamicDataset"]
@@ -1,5 +1,12 @@
-from .multi_sentence_pair_classifier import MultiSentencePairClassifier
-from .multi_sentence_sum import MultiSentenceSum
-from .sentence_pair_classifier import SentencePairClassifier
+from ..._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "MultiSentencePairClassifier": "multi_sentence_pair_classifier",
+        "MultiSentenceSum": "multi_sentence_sum",
+        "SentencePairClassifier": "sentence_pair_classifier",
+    },
+)
 
 __all__ = ["MultiSentenceSum", "MultiSentencePairClassifier", "SentencePairClassifier"]
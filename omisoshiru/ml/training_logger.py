@@ -1,10 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
 from dataclass_wizard import YAMLWizard
 
 
@@ -55,6 +53,9 @@ class TrainingLogger(YAMLWizard):
         return epoch_result
 
     def epoch_plot(self, variables=None, log=False):
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         sns.set(style="whitegrid", palette="deep", context="paper")
         if variables is None:
             variables = ["train_loss", "eval_loss"]
@@ -4,9 +4,36 @@ Pipeline Module
 This module provides a simple pipeline framework for orchestrating and executing data processing tasks using Jupyter Notebooks.
 """
 
+from .._lazy import attach
 
-from .notebook_helper import NotebookHelper
-from .pipeline import Node, Pipeline, Run, get_catalog_dir, set_catalog_dir
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "Catalog": "catalog",
+        "SQLiteCatalog": "catalog",
+        "YAMLCatalog": "catalog",
+        "GCReport": "cleanup",
+        "collect_garbage": "cleanup",
+        "FileQueueExecutor": "file_queue",
+        "run_worker": "file_queue",
+        "KernelPool": "kernel_pool",
+        "Lineage": "lineage",
+        "NotebookHelper": "notebook_helper",
+        "Node": "pipeline",
+        "Pipeline": "pipeline",
+        "Run": "pipeline",
+        "get_catalog": "pipeline",
+        "get_catalog_dir": "pipeline",
+        "set_catalog_backend": "pipeline",
+        "set_catalog_dir": "pipeline",
+        "CellProfiler": "profiling",
+        "profile_report": "profiling",
+        "RunSpec": "scheduler",
+        "build_run_graph": "scheduler",
+        "execute_runs": "scheduler",
+        "expand_grid": "scheduler",
+    },
+)
 
 __all__ = [
     "Node",
@@ -15,4 +42,21 @@ __all__ = [
     "NotebookHelper",
     "set_catalog_dir",
     "get_catalog_dir",
+    "get_catalog",
+    "set_catalog_backend",
+    "Catalog",
+    "YAMLCatalog",
+    "SQLiteCatalog",
+    "RunSpec",
+    "build_run_graph",
+    "execute_runs",
+    "expand_grid",
+    "KernelPool",
+    "CellProfiler",
+    "profile_report",
+    "Lineage",
+    "collect_garbage",
+    "GCReport",
+    "FileQueueExecutor",
+    "run_worker",
 ]
@@ -0,0 +1,153 @@
+import json
+import os
+import pickle
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .fingerprint import hash_file
+
+OUTPUTS_FILE = ".outputs.json"
+
+_EXTENSIONS = {
+    ".npy": "npy",
+    ".parquet": "parquet",
+    ".feather": "feather",
+    ".pkl": "pickle",
+    ".pickle": "pickle",
+    ".csv": "csv",
+}
+
+# Loaded artifacts keyed by path, reused while the file's mtime and size are unchanged.
+_ARTIFACTS: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _get_format(path: str, format: Optional[str]) -> str:
+    if format is None:
+        format = _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise ValueError(
+                f"Cannot infer the format of `{path}`. Specify the format explicitly."
+            )
+    valid_formats = sorted(set(_EXTENSIONS.values()))
+    if format not in valid_formats:
+        raise ValueError(
+            f"Invalid format. Valid values are: {', '.join(valid_formats)}"
+        )
+    return format
+
+
+def load_artifact(path: str, format: Optional[str] = None) -> Any:
+    """
+    Load an artifact file.
+
+    `.npy` files are memory-mapped read-only, so only the accessed parts are read from disk.
+    Loaded objects are cached per path and returned again while the file's modification time and
+    size stay the same; copy them before modifying them in place.
+
+    Args:
+        path (str): The path to the file.
+        format (Optional[str]): One of "npy", "parquet", "feather", "pickle" or "csv".
+            Defaults to the format given by the file extension.
+
+    Returns:
+        Any: The loaded object.
+    """
+    format = _get_format(path, format)
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _ARTIFACTS.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    if format == "npy":
+        obj = np.load(path, mmap_mode="r")
+    elif format == "parquet":
+        obj = pd.read_parquet(path)
+    elif format == "feather":
+        obj = pd.read_feather(path)
+    elif format == "pickle":
+        with open(path, "rb") as f:
+            obj = pickle.load(f)
+    else:
+        obj = pd.read_csv(path)
+    _ARTIFACTS[path] = (stamp, obj)
+    return obj
+
+
+def save_artifact(obj: Any, path: str, format: Optional[str] = None) -> None:
+    """
+    Save an artifact file that can be loaded with `load_artifact`.
+
+    Args:
+        obj (Any): The object. "npy" takes an array, "parquet", "feather" and "csv" take a
+            DataFrame, and "pickle" takes any picklable object.
+        path (str): The path to the file.
+        format (Optional[str]): The format. Defaults to the format given by the file extension.
+    """
+    format = _get_format(path, format)
+    if format == "npy":
+        with open(path, "wb") as f:
+            np.save(f, obj)
+    elif format == "parquet":
+        obj.to_parquet(path)
+    elif format == "feather":
+        obj.to_feather(path)
+    elif format == "pickle":
+        with open(path, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    else:
+        obj.to_csv(path, index=False)
+
+
+def record_output(run_dir: str, file: str) -> Dict[str, Any]:
+    """
+    Record the size and hash of an output file in the outputs manifest of a run directory.
+
+    Args:
+        run_dir (str): The run directory.
+        file (str): The path of the file, relative to `run_dir`.
+
+    Returns:
+        Dict[str, Any]: The recorded `size` and `hash` of the file.
+    """
+    path = os.path.join(run_dir, file)
+    output = {"size": os.path.getsize(path), "hash": hash_file(path)}
+    outputs = read_outputs(run_dir) or {}
+    outputs[file] = output
+    with open(os.path.join(run_dir, OUTPUTS_FILE), "w", encoding="utf-8") as f:
+        json.dump(outputs, f, ensure_ascii=False, indent=2)
+    return output
+
+
+def reset_outputs(run_dir: str) -> None:
+    """
+    Remove the outputs manifest of a run directory, e.g. before the run is executed again.
+
+    Args:
+        run_dir (str): The run directory.
+    """
+    try:
+        os.remove(os.path.join(run_dir, OUTPUTS_FILE))
+    except FileNotFoundError:
+        pass
+
+
+def read_outputs(run_dir: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Read the outputs manifest of a run directory.
+
+    Args:
+        run_dir (str): The run directory.
+
+    Returns:
+        Optional[Dict[str, Dict[str, Any]]]: The size and hash of each recorded file, or None if no
+        output was recorded.
+    """
+    try:
+        with open(os.path.join(run_dir, OUTPUTS_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
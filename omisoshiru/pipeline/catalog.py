@@ -0,0 +1,433 @@
+import contextlib
+import copy
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+Record = Dict[str, Any]
+
+
+class Catalog(ABC):
+    """
+    Base class of catalog stores.
+
+    A catalog store keeps node and run records. Records are plain dictionaries with the same
+    layout as the catalog YAML file, e.g. ``{"name": ...}`` for nodes and
+    ``{"node": ..., "name": ..., "inputs": ..., "params": ..., "success": ...}`` for runs.
+    """
+
+    @abstractmethod
+    def get_node(self, name: str) -> Optional[Record]:
+        """
+        Get a node record by name.
+
+        Args:
+            name (str): The name of the node.
+
+        Returns:
+            Optional[Record]: The node record if found, else None.
+        """
+
+    @abstractmethod
+    def get_run(self, node: str, name: str) -> Optional[Record]:
+        """
+        Get the first successful run record by node and name.
+
+        Args:
+            node (str): The name of the node.
+            name (str): The name of the run.
+
+        Returns:
+            Optional[Record]: The run record if found, else None.
+        """
+
+    @abstractmethod
+    def get_run_by_fingerprint(self, fingerprint: str) -> Optional[Record]:
+        """
+        Get the first successful run record with the given fingerprint.
+
+        Args:
+            fingerprint (str): The fingerprint of the run.
+
+        Returns:
+            Optional[Record]: The run record if found, else None.
+        """
+
+    @abstractmethod
+    def nodes(self) -> List[Record]:
+        """
+        Get all node records in catalog order.
+
+        Returns:
+            List[Record]: The node records.
+        """
+
+    @abstractmethod
+    def runs(self, node: Optional[str] = None) -> List[Record]:
+        """
+        Get run records, including failed ones, in catalog order.
+
+        Args:
+            node (Optional[str]): If given, only runs of this node are returned.
+
+        Returns:
+            List[Record]: The run records.
+        """
+
+    @abstractmethod
+    def add_node(self, node: Record) -> None:
+        """
+        Append a node record to the catalog.
+
+        Args:
+            node (Record): The node record.
+        """
+
+    @abstractmethod
+    def add_run(self, run: Record) -> None:
+        """
+        Append a run record to the catalog.
+
+        Args:
+            run (Record): The run record.
+        """
+
+    @abstractmethod
+    def replace(self, nodes: List[Record], runs: List[Record]) -> None:
+        """
+        Replace the whole content of the catalog.
+
+        Args:
+            nodes (List[Record]): The node records.
+            runs (List[Record]): The run records.
+        """
+
+    def compact(self) -> None:
+        """
+        Reclaim storage space left by removed records. Does nothing by default.
+        """
+
+
+class YAMLCatalog(Catalog):
+    """
+    Indexed, cached view of a catalog YAML file.
+
+    The file is parsed only when its modification time or size changes. Nodes are indexed by name
+    and successful runs by ``(node, run)``, so lookups do not scan or re-read the catalog.
+
+    Every record returned by this class is a copy, so callers may mutate it freely.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): The path to the catalog YAML file. The file does not need to exist.
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._nodes: List[Record] = []
+        self._runs: List[Record] = []
+        self._node_index: Dict[str, Record] = {}
+        self._run_index: Dict[Tuple[str, str], Record] = {}
+        self._node_runs: Dict[str, List[Record]] = {}
+        self._fingerprint_index: Dict[str, Record] = {}
+
+    def _get_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        # Every write replaces the file, so the inode changes even when a rewrite keeps the
+        # size and falls within the resolution of the modification time.
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _refresh(self) -> None:
+        stamp = self._get_stamp()
+        if stamp == self._stamp:
+            return
+        data = {}
+        if stamp is not None:
+            with open(self.path, encoding="utf-8") as f:
+                data = yaml.safe_load(f) or {}
+        self._set(data.get("nodes") or [], data.get("runs") or [])
+        self._stamp = stamp
+
+    def _set(self, nodes: List[Record], runs: List[Record]) -> None:
+        self._nodes = nodes
+        self._runs = runs
+        self._node_index = {}
+        for node in nodes:
+            self._index_node(node)
+        self._run_index = {}
+        self._node_runs = {}
+        self._fingerprint_index = {}
+        for run in runs:
+            self._index_run(run)
+
+    def _index_node(self, node: Record) -> None:
+        self._node_index.setdefault(node["name"], node)
+
+    def _index_run(self, run: Record) -> None:
+        self._node_runs.setdefault(run["node"], []).append(run)
+        # Only the first successful run is visible through `get_run`, as before.
+        if run["success"]:
+            self._run_index.setdefault((run["node"], run["name"]), run)
+            if run.get("fingerprint"):
+                self._fingerprint_index.setdefault(run["fingerprint"], run)
+
+    def _write(self) -> None:
+        temp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            yaml.safe_dump({"nodes": self._nodes, "runs": self._runs}, f)
+        os.replace(temp, self.path)
+        self._stamp = self._get_stamp()
+
+    def get_node(self, name: str) -> Optional[Record]:
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy(self._node_index.get(name))
+
+    def get_run(self, node: str, name: str) -> Optional[Record]:
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy(self._run_index.get((node, name)))
+
+    def get_run_by_fingerprint(self, fingerprint: str) -> Optional[Record]:
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy(self._fingerprint_index.get(fingerprint))
+
+    def nodes(self) -> List[Record]:
+        with self._lock:
+            self._refresh()
+            return copy.deepcopy(self._nodes)
+
+    def runs(self, node: Optional[str] = None) -> List[Record]:
+        with self._lock:
+            self._refresh()
+            if node is not None:
+                return copy.deepcopy(self._node_runs.get(node, []))
+            return copy.deepcopy(self._runs)
+
+    def add_node(self, node: Record) -> None:
+        with self._lock:
+            self._refresh()
+            node = copy.deepcopy(node)
+            self._nodes.append(node)
+            self._index_node(node)
+            self._write()
+
+    def add_run(self, run: Record) -> None:
+        with self._lock:
+            self._refresh()
+            run = copy.deepcopy(run)
+            self._runs.append(run)
+            self._index_run(run)
+            self._write()
+
+    def replace(self, nodes: List[Record], runs: List[Record]) -> None:
+        with self._lock:
+            self._set(copy.deepcopy(nodes), copy.deepcopy(runs))
+            self._write()
+
+
+class SQLiteCatalog(Catalog):
+    """
+    Catalog stored in an SQLite database.
+
+    Every append is a single-row insert in its own transaction, and lookups use indexes on node
+    and run names. The database runs in WAL mode, so several processes can append runs to the
+    same catalog concurrently without overwriting each other's records.
+
+    Connections are opened lazily, one per thread.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS nodes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS nodes_name ON nodes (name);
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            node TEXT NOT NULL,
+            name TEXT NOT NULL,
+            inputs TEXT NOT NULL,
+            params TEXT NOT NULL,
+            success INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS runs_node_name ON runs (node, name, success);
+    """
+    # Optional run fields. They are added to existing databases when opened, and omitted
+    # from records when NULL.
+    _EXTRA_RUN_COLUMNS = {"fingerprint": "TEXT", "profile": "TEXT", "outputs": "TEXT"}
+    _EXTRA_INDEXES = """
+        CREATE INDEX IF NOT EXISTS runs_fingerprint ON runs (fingerprint, success);
+    """
+    _RUN_COLUMNS = ["node", "name", "inputs", "params", "success"] + list(
+        _EXTRA_RUN_COLUMNS
+    )
+    _JSON_COLUMNS = {"inputs", "params", "profile", "outputs"}
+    _SELECT_RUNS = f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs"
+    _INSERT_RUN = (
+        f"INSERT INTO runs ({', '.join(_RUN_COLUMNS)})"
+        f" VALUES ({', '.join('?' * len(_RUN_COLUMNS))})"
+    )
+
+    def __init__(self, path: str, timeout: float = 30.0) -> None:
+        """
+        Args:
+            path (str): The path to the database file. It is created if it does not exist.
+            timeout (float): Seconds to wait for a lock held by another writer. Defaults to 30.
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self._SCHEMA)
+            self._local.conn = conn
+            self._migrate()
+        return conn
+
+    def _migrate(self) -> None:
+        with self._transaction() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(runs)")}
+            for column, typ in self._EXTRA_RUN_COLUMNS.items():
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE runs ADD COLUMN {column} {typ}")
+        self._connect().executescript(self._EXTRA_INDEXES)
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @classmethod
+    def _to_run(cls, row: Tuple) -> Record:
+        run = {}
+        for column, value in zip(cls._RUN_COLUMNS, row):
+            if value is None:
+                continue
+            if column in cls._JSON_COLUMNS:
+                value = json.loads(value)
+            run[column] = value
+        run["success"] = bool(run["success"])
+        return run
+
+    @classmethod
+    def _from_run(cls, run: Record) -> Tuple:
+        row = []
+        for column in cls._RUN_COLUMNS:
+            value = run.get(column)
+            if value is not None and column in cls._JSON_COLUMNS:
+                value = json.dumps(value)
+            row.append(value)
+        return tuple(row)
+
+    def get_node(self, name: str) -> Optional[Record]:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT name FROM nodes WHERE name = ? ORDER BY id LIMIT 1", (name,)
+            )
+            .fetchone()
+        )
+        return {"name": row[0]} if row else None
+
+    def get_run(self, node: str, name: str) -> Optional[Record]:
+        row = (
+            self._connect()
+            .execute(
+                f"{self._SELECT_RUNS}"
+                " WHERE node = ? AND name = ? AND success = 1 ORDER BY id LIMIT 1",
+                (node, name),
+            )
+            .fetchone()
+        )
+        return self._to_run(row) if row else None
+
+    def get_run_by_fingerprint(self, fingerprint: str) -> Optional[Record]:
+        row = (
+            self._connect()
+            .execute(
+                f"{self._SELECT_RUNS}"
+                " WHERE fingerprint = ? AND success = 1 ORDER BY id LIMIT 1",
+                (fingerprint,),
+            )
+            .fetchone()
+        )
+        return self._to_run(row) if row else None
+
+    def nodes(self) -> List[Record]:
+        rows = self._connect().execute("SELECT name FROM nodes ORDER BY id")
+        return [{"name": name} for name, in rows]
+
+    def runs(self, node: Optional[str] = None) -> List[Record]:
+        if node is None:
+            rows = self._connect().execute(f"{self._SELECT_RUNS} ORDER BY id")
+        else:
+            rows = self._connect().execute(
+                f"{self._SELECT_RUNS} WHERE node = ? ORDER BY id", (node,)
+            )
+        return [self._to_run(row) for row in rows]
+
+    def add_node(self, node: Record) -> None:
+        with self._transaction() as conn:
+            conn.execute("INSERT INTO nodes (name) VALUES (?)", (node["name"],))
+
+    def add_run(self, run: Record) -> None:
+        with self._transaction() as conn:
+            conn.execute(self._INSERT_RUN, self._from_run(run))
+
+    def replace(self, nodes: List[Record], runs: List[Record]) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM nodes")
+            conn.execute("DELETE FROM runs")
+            conn.executemany(
+                "INSERT INTO nodes (name) VALUES (?)",
+                [(node["name"],) for node in nodes],
+            )
+            conn.executemany(self._INSERT_RUN, [self._from_run(run) for run in runs])
+
+    def compact(self) -> None:
+        conn = self._connect()
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def import_yaml(self, path: str) -> None:
+        """
+        Replace the content of this catalog with a catalog YAML file.
+
+        Args:
+            path (str): The path to the catalog YAML file.
+        """
+        source = YAMLCatalog(path)
+        self.replace(source.nodes(), source.runs())
+
+    def export_yaml(self, path: str) -> None:
+        """
+        Write the content of this catalog to a catalog YAML file.
+
+        Args:
+            path (str): The path to the catalog YAML file.
+        """
+        YAMLCatalog(path).replace(self.nodes(), self.runs())
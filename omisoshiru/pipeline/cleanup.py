@@ -0,0 +1,204 @@
+import os
+import shutil
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from . import pipeline
+from .catalog import Catalog
+from .fingerprint import hash_file
+from .lineage import Lineage
+
+RunKey = Tuple[str, str]
+
+
+@dataclass
+class GCReport:
+    """
+    The result of `collect_garbage`.
+    """
+
+    removed_records: int = 0
+    removed_dirs: List[str] = field(default_factory=list)
+    linked_files: int = 0
+    bytes_reclaimed: int = 0
+
+
+def _parse_pin(pin: Union[RunKey, str]) -> RunKey:
+    if isinstance(pin, str):
+        node, run = pin.split(":", 1)
+        return node, run
+    return tuple(pin)
+
+
+def _list_files(dirs: Iterable[str]) -> Iterable[Tuple[str, os.stat_result]]:
+    for path in dirs:
+        for root, _, files in os.walk(path):
+            for file in files:
+                file_path = os.path.join(root, file)
+                yield file_path, os.lstat(file_path)
+
+
+def _usage(dirs: Iterable[str]) -> Dict[Tuple[int, int], int]:
+    return {(stat.st_dev, stat.st_ino): stat.st_size for _, stat in _list_files(dirs)}
+
+
+def _catalog_size(catalog_dir: str) -> int:
+    size = 0
+    for name in os.listdir(catalog_dir):
+        if name.startswith(pipeline.CATALOG_NAME) or name.startswith(
+            pipeline.SQLITE_CATALOG_NAME
+        ):
+            size += os.path.getsize(os.path.join(catalog_dir, name))
+    return size
+
+
+def _link(source: str, target: str) -> bool:
+    temp = f"{target}.gc-link"
+    try:
+        os.link(source, temp)
+    except OSError:
+        return False
+    os.replace(temp, target)
+    return True
+
+
+def _kept_runs(
+    records: List[dict], pinned: Optional[List[Union[RunKey, str]]]
+) -> Dict[RunKey, dict]:
+    kept: Dict[RunKey, dict] = {}
+    for record in records:
+        if record["success"]:
+            kept.setdefault((record["node"], record["name"]), record)
+    if pinned is None:
+        return kept
+    lineage = Lineage(kept.values())
+    needed: Set[RunKey] = set()
+    for pin in pinned:
+        node, run = _parse_pin(pin)
+        if (node, run) not in kept:
+            raise ValueError(f"Run `{run}` of node `{node}` does not exist.")
+        needed.update(lineage.ancestors(node, run).graph.nodes)
+    return {key: record for key, record in kept.items() if key in needed}
+
+
+def _scan_run_dirs(
+    catalog_dir: str, kept: Dict[RunKey, dict]
+) -> Tuple[List[str], List[str]]:
+    # The run directories with and without a kept record.
+    kept_dirs, removed_dirs = [], []
+    nodes_dir = os.path.join(catalog_dir, "nodes")
+    for node in sorted(os.listdir(nodes_dir)) if os.path.isdir(nodes_dir) else []:
+        runs_dir = os.path.join(nodes_dir, node, "runs")
+        if not os.path.isdir(runs_dir):
+            continue
+        for run in sorted(os.listdir(runs_dir)):
+            path = os.path.join(runs_dir, run)
+            (kept_dirs if (node, run) in kept else removed_dirs).append(path)
+    return kept_dirs, removed_dirs
+
+
+def _files_by_size(
+    dirs: Iterable[str],
+) -> Dict[int, List[Tuple[str, Tuple[int, int]]]]:
+    by_size: Dict[int, List[Tuple[str, Tuple[int, int]]]] = {}
+    for path, stat in _list_files(dirs):
+        if stat.st_size > 0 and os.path.isfile(path):
+            by_size.setdefault(stat.st_size, []).append(
+                (path, (stat.st_dev, stat.st_ino))
+            )
+    return by_size
+
+
+def _dedupe(dirs: Iterable[str], dry_run: bool, report: GCReport) -> None:
+    # Group by size first, so only files that may be identical are hashed.
+    for size, files in _files_by_size(dirs).items():
+        if len({inode for _, inode in files}) < 2:
+            continue
+        by_hash: Dict[str, Tuple[str, Tuple[int, int]]] = {}
+        linked: Set[Tuple[int, int]] = set()
+        for path, inode in files:
+            source, source_inode = by_hash.setdefault(hash_file(path), (path, inode))
+            if inode == source_inode or inode[0] != source_inode[0]:
+                continue
+            if dry_run or _link(source, path):
+                report.linked_files += 1
+                if inode not in linked:
+                    linked.add(inode)
+                    report.bytes_reclaimed += size
+
+
+def _delete(
+    catalog: Catalog,
+    catalog_dir: str,
+    nodes: List[dict],
+    kept: Dict[RunKey, dict],
+    report: GCReport,
+) -> None:
+    catalog_size = _catalog_size(catalog_dir)
+    unique_nodes: Dict[str, dict] = {}
+    for node in nodes:
+        unique_nodes.setdefault(node["name"], node)
+    catalog.replace(list(unique_nodes.values()), list(kept.values()))
+    catalog.compact()
+    report.bytes_reclaimed += max(catalog_size - _catalog_size(catalog_dir), 0)
+
+    # Directories are removed after the catalog, so no remaining record points to a removed one.
+    for path in report.removed_dirs:
+        shutil.rmtree(path)
+
+
+def collect_garbage(
+    pinned: Optional[List[Union[RunKey, str]]] = None,
+    dedupe: bool = True,
+    dry_run: bool = False,
+) -> GCReport:
+    """
+    Remove unused runs from the catalog directory and compact the catalog.
+
+    The following is removed:
+        - Failed run records, and successful records shadowed by an earlier one of the same name.
+        - Run records not needed by `pinned` runs, if given. A pinned run needs itself and all runs
+          it takes inputs from, transitively.
+        - Run directories under `nodes/<node>/runs` without a remaining run record.
+
+    Identical files of the remaining runs are then replaced by hard links to a single copy, and
+    the catalog is rewritten (and vacuumed, for SQLite catalogs). Like the outputs reused by
+    cached runs, linked files must not be modified in place afterwards.
+
+    No run may be executing in the catalog directory while this runs.
+
+    Args:
+        pinned (Optional[List[Union[Tuple[str, str], str]]]): Runs to keep, as `(node, run)` or
+            `"node:run"`. Defaults to None (keep all successful runs).
+        dedupe (bool): If True, identical files are hard-linked. Defaults to True.
+        dry_run (bool): If True, nothing is changed and the report shows what would be done.
+            The size of the catalog itself is not included. Defaults to False.
+
+    Returns:
+        GCReport: The number of removed records, removed directories, hard-linked files and the
+        bytes reclaimed.
+
+    Example:
+        >>> report = collect_garbage(pinned=["train:best"], dry_run=True)
+        >>> print(report.bytes_reclaimed)
+    """
+    catalog_dir = pipeline.get_catalog_dir()
+    catalog = pipeline.get_catalog()
+    nodes = catalog.nodes()
+    records = catalog.runs()
+
+    kept = _kept_runs(records, pinned)
+    kept_dirs, removed_dirs = _scan_run_dirs(catalog_dir, kept)
+    report = GCReport(
+        removed_records=len(records) - len(kept), removed_dirs=removed_dirs
+    )
+
+    kept_usage = _usage(kept_dirs)
+    report.bytes_reclaimed = sum(
+        size for inode, size in _usage(removed_dirs).items() if inode not in kept_usage
+    )
+    if dedupe:
+        _dedupe(kept_dirs, dry_run, report)
+    if not dry_run:
+        _delete(catalog, catalog_dir, nodes, kept, report)
+    return report
@@ -0,0 +1,90 @@
+import argparse
+from typing import List, Optional
+
+from .cleanup import collect_garbage
+from .file_queue import run_worker
+from .pipeline import set_catalog_backend, set_catalog_dir
+
+
+def _gc(args: argparse.Namespace) -> None:
+    report = collect_garbage(
+        pinned=args.pin or None, dedupe=not args.no_dedupe, dry_run=args.dry_run
+    )
+    prefix = "Would remove" if args.dry_run else "Removed"
+    print(f"{prefix} {report.removed_records} run records.")
+    for path in report.removed_dirs:
+        print(f"{prefix} {path}")
+    print(f"Hard-linked {report.linked_files} duplicate files.")
+    print(f"Reclaimed {report.bytes_reclaimed} bytes.")
+
+
+def _worker(args: argparse.Namespace) -> None:
+    count = run_worker(
+        args.queue_dir,
+        poll_interval=args.poll_interval,
+        max_jobs=args.max_jobs,
+        idle_timeout=args.idle_timeout,
+    )
+    print(f"Executed {count} jobs.")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Command line interface of the pipeline.
+
+    Args:
+        argv (Optional[List[str]]): The arguments. Defaults to `sys.argv[1:]`.
+
+    Example:
+        $ python -m omisoshiru.pipeline gc --pin train:best --dry-run
+        $ python -m omisoshiru.pipeline worker /shared/queue
+    """
+    parser = argparse.ArgumentParser(prog="omisoshiru-pipeline")
+    parser.add_argument(
+        "--catalog-dir",
+        help="The catalog directory. Defaults to the current directory.",
+    )
+    parser.add_argument(
+        "--backend", choices=["yaml", "sqlite"], help="The catalog backend."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    gc_parser = subparsers.add_parser(
+        "gc", help="Remove unused runs and compact the catalog."
+    )
+    gc_parser.add_argument(
+        "--pin",
+        action="append",
+        metavar="NODE:RUN",
+        help="A run to keep with the runs it depends on. May be repeated.",
+    )
+    gc_parser.add_argument(
+        "--no-dedupe", action="store_true", help="Do not hard-link identical files."
+    )
+    gc_parser.add_argument(
+        "--dry-run", action="store_true", help="Only report what would be done."
+    )
+    gc_parser.set_defaults(func=_gc)
+
+    worker_parser = subparsers.add_parser(
+        "worker", help="Execute jobs of a file queue."
+    )
+    worker_parser.add_argument("queue_dir", help="The queue directory.")
+    worker_parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between checks for new jobs.",
+    )
+    worker_parser.add_argument(
+        "--max-jobs", type=int, help="Stop after executing this many jobs."
+    )
+    worker_parser.add_argument(
+        "--idle-timeout", type=float, help="Stop after this many seconds without a job."
+    )
+    worker_parser.set_defaults(func=_worker)
+
+    args = parser.parse_args(argv)
+    set_catalog_dir(args.catalog_dir)
+    set_catalog_backend(args.backend)
+    args.func(args)
@@ -0,0 +1,252 @@
+import os
+import pickle
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+_HEARTBEAT_INTERVAL = 10.0
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    temp = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(temp, "wb") as f:
+        f.write(data)
+    os.replace(temp, path)
+
+
+def _remove(*paths: str) -> None:
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _job_paths(queue_dir: str, job_id: str) -> Dict[str, str]:
+    return {
+        suffix: os.path.join(queue_dir, f"{job_id}.{suffix}")
+        for suffix in ["job", "lock", "result"]
+    }
+
+
+def _try_lock(path: str) -> bool:
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, "w") as f:
+        f.write(f"{socket.gethostname()}:{os.getpid()}\n")
+    return True
+
+
+class FileQueueExecutor(Executor):
+    def __init__(
+        self,
+        queue_dir: str,
+        poll_interval: float = 1.0,
+        stale_timeout: Optional[float] = 120.0,
+    ) -> None:
+        """
+        An executor that hands calls to worker processes through a directory of job files.
+
+        Each call is pickled to a job file in `queue_dir`. Workers started with `run_worker` (or
+        `omisoshiru-pipeline worker QUEUE_DIR`), possibly on other machines sharing the
+        filesystem, claim jobs by atomically creating a lock file next to them and write back a
+        result file. Pass this executor to `execute_runs` to distribute runs across workers while
+        the calling process stays the only writer of the catalog.
+
+        Job files are unpickled by workers, so the queue directory must only be writable by
+        trusted users.
+
+        Args:
+            queue_dir (str): The queue directory. It is created if it does not exist.
+            poll_interval (float): Seconds between checks for results. Defaults to 1.
+            stale_timeout (Optional[float]): Seconds without a heartbeat of a worker before its
+                job is failed, e.g. when the worker was killed. Heartbeats are detected as changes
+                of the lock file's modification time, timed by this process's clock, so clock
+                skew between machines does not matter. Defaults to 120. None disables it.
+
+        Example:
+            >>> # On each machine: omisoshiru-pipeline worker /shared/queue
+            >>> with FileQueueExecutor("/shared/queue") as executor:
+            ...     execute_runs(specs, executor=executor)
+        """
+        os.makedirs(queue_dir, exist_ok=True)
+        self.queue_dir = queue_dir
+        self._poll_interval = poll_interval
+        self._stale_timeout = stale_timeout
+        self._futures: Dict[str, Future] = {}
+        # The last seen modification time of the lock file of each job, and when it was seen.
+        self._heartbeats: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            # Job ids sort by submission time, so workers claim jobs in order.
+            job_id = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+            _write_atomic(
+                _job_paths(self.queue_dir, job_id)["job"],
+                pickle.dumps((fn, args, kwargs)),
+            )
+            future = Future()
+            self._futures[job_id] = future
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._poll, daemon=True)
+                self._thread.start()
+        return future
+
+    def _poll(self) -> None:
+        while True:
+            with self._lock:
+                if self._shutdown and not self._futures:
+                    return
+                futures = list(self._futures.items())
+            for job_id, future in futures:
+                try:
+                    done = self._check(job_id, future)
+                except Exception as e:
+                    # E.g. a truncated or unpicklable result. Fail the job instead of the thread.
+                    _remove(*_job_paths(self.queue_dir, job_id).values())
+                    if future.set_running_or_notify_cancel():
+                        future.set_exception(e)
+                    done = True
+                if done:
+                    self._heartbeats.pop(job_id, None)
+                    with self._lock:
+                        del self._futures[job_id]
+            time.sleep(self._poll_interval)
+
+    def _check(self, job_id: str, future: Future) -> bool:
+        paths = _job_paths(self.queue_dir, job_id)
+        if os.path.exists(paths["result"]):
+            with open(paths["result"], "rb") as f:
+                ok, value = pickle.load(f)
+            _remove(paths["job"], paths["result"], paths["lock"])
+            if future.set_running_or_notify_cancel():
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+            return True
+
+        try:
+            mtime = os.path.getmtime(paths["lock"])
+        except FileNotFoundError:
+            # Not claimed yet. A cancelled job is withdrawn unless a worker claims it first.
+            if future.cancelled() and _try_lock(paths["lock"]):
+                _remove(paths["job"], paths["lock"])
+                return True
+            return False
+        now = time.monotonic()
+        last = self._heartbeats.get(job_id)
+        if last is None or last[0] != mtime:
+            self._heartbeats[job_id] = (mtime, now)
+        elif self._stale_timeout is not None and now - last[1] > self._stale_timeout:
+            _remove(paths["job"], paths["lock"])
+            if future.set_running_or_notify_cancel():
+                future.set_exception(
+                    RuntimeError(f"The worker of job `{job_id}` stopped responding.")
+                )
+            return True
+        return False
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                for future in self._futures.values():
+                    future.cancel()
+            thread = self._thread
+        if wait and thread is not None:
+            thread.join()
+
+
+def _heartbeat(path: str, stop: threading.Event) -> None:
+    while not stop.wait(_HEARTBEAT_INTERVAL):
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return
+
+
+def _claim(queue_dir: str) -> Optional[str]:
+    for file in sorted(os.listdir(queue_dir)):
+        if not file.endswith(".job"):
+            continue
+        job_id = file[: -len(".job")]
+        paths = _job_paths(queue_dir, job_id)
+        if not os.path.exists(paths["result"]) and _try_lock(paths["lock"]):
+            if os.path.exists(paths["job"]):
+                return job_id
+            # Withdrawn by the executor after listing.
+            _remove(paths["lock"])
+    return None
+
+
+def run_worker(
+    queue_dir: str,
+    poll_interval: float = 1.0,
+    max_jobs: Optional[int] = None,
+    idle_timeout: Optional[float] = None,
+) -> int:
+    """
+    Execute jobs of a `FileQueueExecutor` until stopped.
+
+    Several workers may serve the same queue directory. Each job is executed by exactly one
+    worker.
+
+    Args:
+        queue_dir (str): The queue directory.
+        poll_interval (float): Seconds between checks for new jobs. Defaults to 1.
+        max_jobs (Optional[int]): The number of jobs after which the worker stops.
+            Defaults to None (no limit).
+        idle_timeout (Optional[float]): Seconds without a job after which the worker stops.
+            Defaults to None (wait forever).
+
+    Returns:
+        int: The number of executed jobs.
+    """
+    os.makedirs(queue_dir, exist_ok=True)
+    count = 0
+    idle_since = time.monotonic()
+    while max_jobs is None or count < max_jobs:
+        job_id = _claim(queue_dir)
+        if job_id is None:
+            if (
+                idle_timeout is not None
+                and time.monotonic() - idle_since > idle_timeout
+            ):
+                break
+            time.sleep(poll_interval)
+            continue
+
+        paths = _job_paths(queue_dir, job_id)
+        stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=_heartbeat, args=(paths["lock"], stop), daemon=True
+        )
+        heartbeat.start()
+        try:
+            with open(paths["job"], "rb") as f:
+                fn, args, kwargs = pickle.load(f)
+            result: Any = (True, fn(*args, **kwargs))
+        except Exception as e:
+            result = (False, e)
+        finally:
+            stop.set()
+            heartbeat.join()
+        try:
+            data = pickle.dumps(result)
+        except Exception as e:
+            data = pickle.dumps((False, RuntimeError(f"Unpicklable result: {e!r}")))
+        _write_atomic(paths["result"], data)
+        count += 1
+        idle_since = time.monotonic()
+    return count
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, Tuple
+
+import nbformat
+
+_CHUNK_SIZE = 1 << 20
+
+# Content hashes keyed by path, memoized while the file's mtime and size are unchanged.
+_FILE_HASHES: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def hash_file(path: str) -> str:
+    """
+    Compute the SHA-256 hash of a file's content.
+
+    Hashes are cached per path and reused while the file's modification time and size stay the same.
+    Directories are hashed from the relative paths and hashes of all files they contain.
+
+    Args:
+        path (str): The path to the file or directory.
+
+    Returns:
+        str: The hex digest.
+    """
+    if os.path.isdir(path):
+        digest = hashlib.sha256()
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for file in sorted(files):
+                file_path = os.path.join(root, file)
+                digest.update(os.path.relpath(file_path, path).encode("utf-8"))
+                digest.update(hash_file(file_path).encode("ascii"))
+        return digest.hexdigest()
+
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _FILE_HASHES.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    _FILE_HASHES[path] = (stamp, digest.hexdigest())
+    return digest.hexdigest()
+
+
+def hash_notebook(path: str) -> str:
+    """
+    Compute the SHA-256 hash of a notebook's cell types and sources.
+
+    Outputs and metadata are ignored, so executing or re-saving a notebook does not change its hash.
+
+    Args:
+        path (str): The path to the notebook.
+
+    Returns:
+        str: The hex digest.
+    """
+    with open(path, encoding="utf-8") as f:
+        nb = nbformat.read(f, as_version=4)
+    cells = [[cell.cell_type, cell.source] for cell in nb.cells]
+    return hash_json(cells)
+
+
+def hash_json(obj: Any) -> str:
+    """
+    Compute the SHA-256 hash of a JSON-serializable object.
+
+    Args:
+        obj (Any): The object. Dictionary keys are sorted before hashing.
+
+    Returns:
+        str: The hex digest.
+    """
+    data = json.dumps(obj, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
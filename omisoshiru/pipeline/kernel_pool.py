@@ -0,0 +1,222 @@
+import queue
+import threading
+from typing import Dict, List, Literal, Optional, Union
+
+from jupyter_client import KernelManager
+
+_PREPARE_CODE = """
+def _prepare(os=__import__("os")):
+    for key in [key for key in os.environ if key.startswith("PIPELINE_")]:
+        del os.environ[key]
+    os.environ.update({env})
+    os.chdir({cwd})
+_prepare()
+del _prepare
+"""
+
+_RESET_CODE = """
+get_ipython().run_line_magic("reset", "-f")
+"""
+
+
+class KernelPool:
+    def __init__(
+        self,
+        size: int = 1,
+        kernel_name: Optional[str] = None,
+        warmup_code: str = "",
+        reset_policy: Literal["reset", "restart"] = "reset",
+        max_uses: Optional[int] = None,
+        startup_timeout: int = 60,
+    ) -> None:
+        """
+        A pool of pre-warmed Jupyter kernels for executing runs.
+
+        Starting a kernel and importing heavy libraries can dominate the execution time of short runs.
+        Kernels in the pool are started once, execute `warmup_code` (e.g. `import torch`), and are
+        reused across runs.
+
+        Isolation between runs is controlled by `reset_policy`:
+            - "reset": The user namespace is cleared with `%reset -f` after each run. Imported
+              modules stay loaded, so imports in the next run are fast.
+            - "restart": The kernel is restarted and warmed up again after each run, in the
+              background. This gives full isolation.
+
+        A kernel is always restarted after a failed run, and after `max_uses` runs if set. If a
+        kernel cannot be restarted, it is replaced with a new one; if that fails too, the error is
+        raised by the next `acquire` that would have used the kernel.
+
+        Args:
+            size (int): The number of kernels. Defaults to 1.
+            kernel_name (Optional[str]): The kernel name. Defaults to the default Python kernel.
+            warmup_code (str): Code executed in each kernel after it starts.
+            reset_policy (Literal["reset", "restart"]): How kernels are cleaned between runs.
+                Defaults to "reset".
+            max_uses (Optional[int]): The number of runs after which a kernel is restarted.
+                Defaults to None (no limit).
+            startup_timeout (int): Seconds to wait for a kernel to start. Defaults to 60.
+
+        Example:
+            >>> with KernelPool(size=4, warmup_code="import torch") as pool:
+            ...     node.create_run("run1", kernel_pool=pool)
+        """
+        valid_policies = ["reset", "restart"]
+        if reset_policy not in valid_policies:
+            raise ValueError(
+                f"Invalid reset_policy. Valid values are: {', '.join(valid_policies)}"
+            )
+
+        self._warmup_code = warmup_code
+        self._reset_policy = reset_policy
+        self._max_uses = max_uses
+        self._startup_timeout = startup_timeout
+        self._kernel_kwargs = {"kernel_name": kernel_name} if kernel_name else {}
+        # Idle kernels, or the error of a kernel that could not be restarted.
+        self._idle: "queue.Queue[Union[KernelManager, Exception]]" = queue.Queue()
+        self._uses: Dict[str, int] = {}
+        self._kernels: List[KernelManager] = []
+        self._threads: List[threading.Thread] = []
+
+        for _ in range(size):
+            self._idle.put(self._start_kernel())
+
+    def _execute(self, km: KernelManager, code: str) -> None:
+        kc = km.client()
+        kc.start_channels()
+        try:
+            kc.wait_for_ready(timeout=self._startup_timeout)
+            reply = kc.execute_interactive(code, output_hook=lambda msg: None)
+        finally:
+            kc.stop_channels()
+        if reply["content"]["status"] != "ok":
+            raise RuntimeError(
+                f"Kernel code failed: {reply['content'].get('ename')}: {reply['content'].get('evalue')}"
+            )
+
+    def _warmup(self, km: KernelManager) -> None:
+        self._uses[km.kernel_id] = 0
+        if self._warmup_code:
+            self._execute(km, self._warmup_code)
+
+    def _start_kernel(self) -> KernelManager:
+        km = KernelManager(**self._kernel_kwargs)
+        km.start_kernel()
+        self._kernels.append(km)
+        try:
+            self._warmup(km)
+        except Exception:
+            self._discard(km)
+            raise
+        return km
+
+    def _discard(self, km: KernelManager) -> None:
+        self._kernels.remove(km)
+        try:
+            km.shutdown_kernel(now=True)
+        except Exception:
+            pass
+
+    def _restart(self, km: KernelManager) -> None:
+        try:
+            km.restart_kernel(now=True)
+            self._warmup(km)
+        except Exception:
+            self._discard(km)
+            try:
+                km = self._start_kernel()
+            except Exception as error:
+                self._idle.put(error)
+                return
+        self._idle.put(km)
+
+    def acquire(
+        self,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> KernelManager:
+        """
+        Take an idle kernel from the pool, waiting until one is available.
+
+        Args:
+            cwd (Optional[str]): The working directory to set in the kernel.
+            env (Optional[Dict[str, str]]): `PIPELINE_*` environment variables to set in the kernel.
+                Variables left by a previous run are removed.
+            timeout (Optional[float]): Seconds to wait for an idle kernel. Defaults to None (no limit).
+
+        Returns:
+            KernelManager: The kernel manager, to be passed to `release` after the run.
+
+        Raises:
+            Exception: If the kernel taken from the pool could not be restarted, and a new kernel
+                cannot be started either.
+        """
+        km = self._idle.get(timeout=timeout)
+        if isinstance(km, Exception):
+            try:
+                km = self._start_kernel()
+            except Exception:
+                # Keep the error for the next caller instead of losing the kernel.
+                self._idle.put(km)
+                raise
+        try:
+            self._execute(
+                km,
+                _PREPARE_CODE.format(
+                    env=repr({str(k): str(v) for k, v in (env or {}).items()}),
+                    cwd=repr(cwd) if cwd else "os.getcwd()",
+                ),
+            )
+        except Exception:
+            self.release(km, restart=True)
+            raise
+        self._uses[km.kernel_id] += 1
+        return km
+
+    def release(self, km: KernelManager, restart: bool = False) -> None:
+        """
+        Return a kernel to the pool.
+
+        Args:
+            km (KernelManager): The kernel manager returned by `acquire`.
+            restart (bool): If True, the kernel is restarted regardless of the reset policy.
+                Use this after a failed or interrupted run.
+        """
+        restart = (
+            restart
+            or self._reset_policy == "restart"
+            or not km.is_alive()
+            or (
+                self._max_uses is not None
+                and self._uses.get(km.kernel_id, 0) >= self._max_uses
+            )
+        )
+        if not restart:
+            try:
+                self._execute(km, _RESET_CODE)
+            except Exception:
+                restart = True
+            else:
+                self._idle.put(km)
+                return
+
+        thread = threading.Thread(target=self._restart, args=(km,), daemon=True)
+        thread.start()
+        self._threads = [t for t in self._threads if t.is_alive()] + [thread]
+
+    def shutdown(self) -> None:
+        """
+        Shut down all kernels of the pool.
+        """
+        for thread in self._threads:
+            thread.join()
+        for km in self._kernels:
+            if km.has_kernel:
+                km.shutdown_kernel(now=True)
+        self._kernels = []
+
+    def __enter__(self) -> "KernelPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
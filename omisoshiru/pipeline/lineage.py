@@ -0,0 +1,245 @@
+import json
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import networkx as nx
+
+from ..text import join_str
+from .catalog import Catalog, Record
+
+RunKey = Tuple[str, str]
+
+
+def _format_label(record: Record) -> str:
+    lines = (
+        [
+            f"Node: {record['node']}",
+            f"Run: {record['name']}",
+        ]
+        + [f"Param {k}: {v}" for k, v in record["params"].items()]
+        + [
+            f"Success: {record['success']}",
+        ]
+    )
+    return join_str(lines, "\n")
+
+
+def _quote_dot(text: str) -> str:
+    text = text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{text}"'
+
+
+class Lineage:
+    def __init__(self, records: Iterable[Record]) -> None:
+        """
+        The lineage graph of runs.
+
+        The graph is built once from catalog records. An edge `a -> b` means that run `b` takes
+        inputs from files of run `a`; inputs referring to runs outside of `records` are ignored.
+        If several records share a run name, a successful one is kept.
+
+        Args:
+            records (Iterable[Record]): The run records, as returned by `Catalog.runs`.
+
+        Example:
+            >>> lineage = Lineage.from_catalog()
+            >>> lineage.ancestors("train", "v1", depth=2).to_html("lineage.html")
+        """
+        records = list(records)
+        self.graph = nx.DiGraph()
+        for record in records:
+            key = (record["node"], record["name"])
+            if key in self.graph and self.graph.nodes[key]["record"]["success"]:
+                continue
+            self.graph.add_node(key, record=record)
+
+        for key, record in list(self.graph.nodes(data="record")):
+            for input_name, value in record["inputs"].items():
+                upstream = (value["node"], value["run"])
+                if upstream not in self.graph:
+                    continue
+                if not self.graph.has_edge(upstream, key):
+                    self.graph.add_edge(upstream, key, inputs=[])
+                self.graph.edges[upstream, key]["inputs"].append(
+                    {"file": value["file"], "input": input_name}
+                )
+
+    @classmethod
+    def from_catalog(
+        cls, catalog: Optional[Catalog] = None, include_failed: bool = False
+    ) -> "Lineage":
+        """
+        Build the lineage graph of all runs in a catalog.
+
+        Args:
+            catalog (Optional[Catalog]): The catalog. Defaults to the catalog of the current catalog directory.
+            include_failed (bool): If True, failed runs are included. Defaults to False.
+
+        Returns:
+            Lineage: The lineage graph.
+        """
+        if catalog is None:
+            from .pipeline import get_catalog
+
+            catalog = get_catalog()
+        return cls(
+            record for record in catalog.runs() if include_failed or record["success"]
+        )
+
+    def _subgraph(self, keys: Iterable[RunKey]) -> "Lineage":
+        lineage = Lineage([])
+        lineage.graph = self.graph.subgraph(keys).copy()
+        return lineage
+
+    def _reachable(
+        self, graph: nx.DiGraph, node: str, run: str, depth: Optional[int]
+    ) -> Dict[RunKey, int]:
+        key = (node, run)
+        if key not in self.graph:
+            raise ValueError(f"Run `{run}` of node `{node}` is not in the lineage.")
+        return nx.single_source_shortest_path_length(graph, key, cutoff=depth)
+
+    def ancestors(self, node: str, run: str, depth: Optional[int] = None) -> "Lineage":
+        """
+        Restrict the lineage to a run and the runs it takes inputs from.
+
+        Args:
+            node (str): The node name of the run.
+            run (str): The run name.
+            depth (Optional[int]): The number of levels to include. Defaults to None (all levels).
+
+        Returns:
+            Lineage: The lineage of the ancestors, including the run itself.
+        """
+        return self._subgraph(
+            self._reachable(self.graph.reverse(copy=False), node, run, depth)
+        )
+
+    def descendants(
+        self, node: str, run: str, depth: Optional[int] = None
+    ) -> "Lineage":
+        """
+        Restrict the lineage to a run and the runs that take inputs from it.
+
+        Args:
+            node (str): The node name of the run.
+            run (str): The run name.
+            depth (Optional[int]): The number of levels to include. Defaults to None (all levels).
+
+        Returns:
+            Lineage: The lineage of the descendants, including the run itself.
+        """
+        return self._subgraph(self._reachable(self.graph, node, run, depth))
+
+    def neighborhood(
+        self,
+        node: str,
+        run: str,
+        ancestors: Optional[int] = None,
+        descendants: Optional[int] = None,
+    ) -> "Lineage":
+        """
+        Restrict the lineage to the ancestors and descendants of a run.
+
+        Args:
+            node (str): The node name of the run.
+            run (str): The run name.
+            ancestors (Optional[int]): The number of upstream levels. Defaults to None (all levels).
+            descendants (Optional[int]): The number of downstream levels. Defaults to None (all levels).
+
+        Returns:
+            Lineage: The lineage around the run.
+        """
+        keys = set(
+            self._reachable(self.graph.reverse(copy=False), node, run, ancestors)
+        )
+        keys.update(self._reachable(self.graph, node, run, descendants))
+        return self._subgraph(keys)
+
+    def records(self) -> List[Record]:
+        """
+        Get the run records of the lineage in topological order.
+
+        Returns:
+            List[Record]: The run records.
+        """
+        return [
+            self.graph.nodes[key]["record"] for key in nx.topological_sort(self.graph)
+        ]
+
+    def to_dot(self) -> str:
+        """
+        Export the lineage as Graphviz DOT text.
+
+        Returns:
+            str: The DOT source. Rendering it is left to the caller.
+        """
+        lines = ["digraph lineage {", "    node [shape=box];"]
+        for key, record in self.graph.nodes(data="record"):
+            lines.append(
+                f"    {_quote_dot(':'.join(key))} [label={_quote_dot(_format_label(record))}];"
+            )
+        for upstream, key, inputs in self.graph.edges(data="inputs"):
+            label = join_str([f"{i['file']} -> {i['input']}" for i in inputs], "\n")
+            lines.append(
+                f"    {_quote_dot(':'.join(upstream))} -> {_quote_dot(':'.join(key))}"
+                f" [label={_quote_dot(label)}];"
+            )
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> str:
+        """
+        Export the lineage as JSON.
+
+        Returns:
+            str: A JSON object with `nodes`, holding the run records with an `id` of the form
+            `node:run`, and `edges`, holding `source`, `target` and the `inputs` of each edge.
+        """
+        data = {
+            "nodes": [
+                {"id": ":".join(key), **record}
+                for key, record in self.graph.nodes(data="record")
+            ],
+            "edges": [
+                {
+                    "source": ":".join(upstream),
+                    "target": ":".join(key),
+                    "inputs": inputs,
+                }
+                for upstream, key, inputs in self.graph.edges(data="inputs")
+            ],
+        }
+        return json.dumps(data, ensure_ascii=False)
+
+    def to_html(self, output_file: str, gravity: int = -50) -> None:
+        """
+        Export the lineage as an interactive HTML file.
+
+        Args:
+            output_file (str): Output HTML file name.
+            gravity (int, optional): Gravity parameter for the force-directed layout (default is -50).
+        """
+        from pyvis.network import Network
+
+        g = Network(
+            "calc(100vh - 10px)",
+            "calc(100vw - 6px)",
+            directed=True,
+            notebook=True,
+            cdn_resources="remote",
+        )
+        for key, record in self.graph.nodes(data="record"):
+            g.add_node(
+                ":".join(key),
+                label=_format_label(record),
+                shape="box",
+                **({} if record["success"] else {"color": "red"}),
+            )
+        for upstream, key, inputs in self.graph.edges(data="inputs"):
+            g.add_edge(
+                ":".join(upstream),
+                ":".join(key),
+                label=join_str([f"{i['file']} -> {i['input']}" for i in inputs], "\n"),
+            )
+        g.force_atlas_2based(gravity)
+        g.write_html(output_file)
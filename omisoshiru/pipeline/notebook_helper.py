@@ -1,6 +1,8 @@
 import os
 import warnings
+from typing import Any, Optional
 
+from .artifacts import load_artifact, record_output, save_artifact
 from .pipeline import Node, Run, set_catalog_dir
 
 
@@ -40,7 +42,7 @@ class NotebookHelper:
             self._set_attribute(remaining)
 
     def get_current_run(self):
-        return Run.get(self._run) if self._run else None
+        return Run.get(self._node, self._run) if self._run else None
 
     def get_current_node(self):
         return Node.get(self._node) if self._node else None
@@ -72,3 +74,52 @@ class NotebookHelper:
             )
             value = default_value
         return value
+
+    def load_input(
+        self, name: str, format: Optional[str] = None, default_value=None
+    ) -> Any:
+        """
+        Load the artifact file of an input.
+
+        Files are loaded with `load_artifact`: `.npy` files are memory-mapped, and loaded objects
+        are cached in the process while the file is unchanged.
+
+        Args:
+            name (str): The name of the input.
+            format (Optional[str]): One of "npy", "parquet", "feather", "pickle" or "csv".
+                Defaults to the format given by the file extension.
+            default_value: The path to use when the input is not given outside of a run.
+
+        Returns:
+            Any: The loaded object.
+        """
+        return load_artifact(self.get_input(name, default_value), format=format)
+
+    def save_output(self, obj: Any, file: str, format: Optional[str] = None) -> str:
+        """
+        Save an output artifact of the run and record it.
+
+        Args:
+            obj (Any): The object to save.
+            file (str): The file name, relative to the run directory.
+            format (Optional[str]): The format. Defaults to the format given by the file extension.
+
+        Returns:
+            str: The path to the saved file.
+        """
+        save_artifact(obj, file, format=format)
+        self.register_output(file)
+        return os.path.abspath(file)
+
+    def register_output(self, file: str) -> None:
+        """
+        Record the size and hash of an output file written by the run.
+
+        Recorded outputs are stored in the catalog with the run when it finishes, and returned by
+        `Run.get_files`. Nothing is recorded outside of a run.
+
+        Args:
+            file (str): The file name, relative to the run directory.
+        """
+        if self._run is not None:
+            record_output(os.getcwd(), file)
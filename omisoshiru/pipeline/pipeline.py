@@ -1,17 +1,40 @@
+import asyncio
 import os
-from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, TypedDict, Union
+import shutil
+from dataclasses import asdict, dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 import nbformat
-import networkx as nx
+import pandas as pd
 from dataclass_wizard import YAMLWizard
 from IPython.display import Image
-from nbconvert.preprocessors import ClearOutputPreprocessor, ExecutePreprocessor
+from nbclient import NotebookClient
+from nbconvert.preprocessors import ClearOutputPreprocessor
 
-from ..text import insert_newlines, join_str
+from ..text import insert_newlines
+from .artifacts import read_outputs, reset_outputs
+from .catalog import Catalog, SQLiteCatalog, YAMLCatalog
+from .fingerprint import hash_file, hash_json, hash_notebook
+from .kernel_pool import KernelPool
+from .lineage import Lineage
+from .profiling import CellProfiler, profile_report
 
 CATALOG_DIR = os.getcwd()
 CATALOG_NAME = "catalog.yml"
+SQLITE_CATALOG_NAME = "catalog.db"
+CATALOG_BACKEND: Optional[str] = None
+
+_CATALOGS: Dict[str, Catalog] = {}
 
 
 def set_catalog_dir(catalog_dir: Optional[str] = None) -> None:
@@ -38,12 +61,83 @@ def get_catalog_dir() -> str:
     return CATALOG_DIR
 
 
+def set_catalog_backend(backend: Optional[Literal["yaml", "sqlite"]] = None) -> None:
+    """
+    Set the catalog storage backend.
+
+    Args:
+        backend (Optional[Literal["yaml", "sqlite"]]): The backend. If None, SQLite is used when
+            the catalog directory contains a `catalog.db` file, and YAML otherwise.
+
+    Returns:
+        None
+    """
+    valid_backends = ["yaml", "sqlite"]
+    if backend is not None and backend not in valid_backends:
+        raise ValueError(
+            f"Invalid backend. Valid values are: {', '.join(valid_backends)}"
+        )
+    global CATALOG_BACKEND
+    CATALOG_BACKEND = backend
+
+
+def get_catalog() -> Catalog:
+    """
+    Get the catalog of the current catalog directory.
+
+    Catalogs are cached per file path, so repeated lookups reuse the same connection or in-memory index.
+
+    Returns:
+        Catalog: The catalog.
+    """
+    backend = CATALOG_BACKEND
+    if backend is None:
+        sqlite_path = os.path.join(CATALOG_DIR, SQLITE_CATALOG_NAME)
+        backend = "sqlite" if os.path.exists(sqlite_path) else "yaml"
+
+    if backend == "sqlite":
+        path = os.path.join(CATALOG_DIR, SQLITE_CATALOG_NAME)
+        catalog_class = SQLiteCatalog
+    else:
+        path = os.path.join(CATALOG_DIR, CATALOG_NAME)
+        catalog_class = YAMLCatalog
+
+    catalog = _CATALOGS.get(path)
+    if catalog is None:
+        catalog = _CATALOGS[path] = catalog_class(path)
+    return catalog
+
+
+def _get_kernel_env(env: Dict[str, str]) -> Dict[str, str]:
+    # `PIPELINE_*` variables of the calling process are replaced by those of the run
+    kernel_env = {k: v for k, v in os.environ.items() if not k.startswith("PIPELINE_")}
+    kernel_env.update(env)
+    return kernel_env
+
+
 class InputDict(TypedDict):
     node: str
     run: str
     file: str
 
 
+def parse_input(value: Union[InputDict, str]) -> InputDict:
+    """
+    Parse an input reference.
+
+    Args:
+        value (Union[InputDict, str]): An InputDict, or a string in the form `node:run:file`.
+
+    Returns:
+        InputDict: The parsed input reference.
+    """
+    if isinstance(value, str):
+        value = InputDict(
+            **{k: v for k, v in zip(["node", "run", "file"], value.split(":"))}
+        )
+    return value
+
+
 @dataclass
 class Run:
     """
@@ -55,6 +149,9 @@ class Run:
     inputs: Dict[str, InputDict]
     params: Dict[str, str]
     success: bool
+    fingerprint: Optional[str] = None
+    profile: Optional[List[Dict[str, Any]]] = None
+    outputs: Optional[Dict[str, Dict[str, Any]]] = None
 
     @classmethod
     def create(
@@ -65,6 +162,8 @@ class Run:
         params: Optional[Dict[str, str]] = None,
         kernel_name: Optional[str] = None,
         timeout: Optional[int] = None,
+        cache: bool = False,
+        kernel_pool: Optional[KernelPool] = None,
     ) -> "Run":
         """
         Create a new run instance.
@@ -76,35 +175,168 @@ class Run:
             params (Optional[Dict[str, str]]): Parameters for the run.
             kernel_name (Optional[str]): The kernel name for execution.
             timeout (Optional[int]): Timeout for execution.
+            cache (bool): If True, the run is fingerprinted, and when a successful run with the
+                same fingerprint exists, its outputs are linked instead of executing the notebook.
+                Only runs created with `cache=True` have a fingerprint. Defaults to False.
+            kernel_pool (Optional[KernelPool]): A pool of warm kernels to execute the run in.
 
         Returns:
             Run: The created Run instance.
         """
+        run = cls._new(node, name, inputs, params)
+        if not (cache and run.reuse_cached()):
+            run.run(kernel_name=kernel_name, timeout=timeout, kernel_pool=kernel_pool)
+        run.save()
+        return run
+
+    @classmethod
+    async def async_create(
+        cls,
+        node: str,
+        name: str,
+        inputs: Optional[Dict[str, Union[InputDict, str]]] = None,
+        params: Optional[Dict[str, str]] = None,
+        kernel_name: Optional[str] = None,
+        timeout: Optional[int] = None,
+        cache: bool = False,
+        run_timeout: Optional[float] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> "Run":
+        """
+        Create a new run instance without blocking the event loop.
+
+        The run is saved to the catalog even if it fails, times out or is cancelled.
+
+        Args:
+            node (str): The name of the node.
+            name (str): The name of the run.
+            inputs (Optional[Dict[str, InputDict]]): Input information for the run.
+            params (Optional[Dict[str, str]]): Parameters for the run.
+            kernel_name (Optional[str]): The kernel name for execution.
+            timeout (Optional[int]): Timeout for execution of each cell.
+            cache (bool): If True, reuse the outputs of a run with the same fingerprint (see `create`).
+            run_timeout (Optional[float]): Timeout for execution of the whole notebook.
+            semaphore (Optional[asyncio.Semaphore]): A semaphore to bound the number of runs executed
+                concurrently. It is held while the notebook is executed.
+
+        Returns:
+            Run: The created Run instance.
+
+        Example:
+            >>> semaphore = asyncio.Semaphore(8)
+            >>> runs = await asyncio.gather(
+            ...     *[
+            ...         Run.async_create("train", f"lr{lr}", params={"lr": lr}, semaphore=semaphore)
+            ...         for lr in ["0.1", "0.01", "0.001"]
+            ...     ]
+            ... )
+        """
+        run = cls._new(node, name, inputs, params)
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            if not (cache and await asyncio.to_thread(run.reuse_cached)):
+                await run.async_run(
+                    kernel_name=kernel_name, timeout=timeout, run_timeout=run_timeout
+                )
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+            run.save()
+        return run
+
+    @classmethod
+    def _new(
+        cls,
+        node: str,
+        name: str,
+        inputs: Optional[Dict[str, Union[InputDict, str]]],
+        params: Optional[Dict[str, str]],
+    ) -> "Run":
         exist = cls.get(node, name)
         if exist and exist.success:
             raise ValueError(f"Run name `{name}` already exists for node `{node}`.")
 
-        inputs = inputs or {}
+        inputs = {k: parse_input(v) for k, v in (inputs or {}).items()}
         params = params or {}
 
-        for k, v in inputs.items():
-            if isinstance(v, str):
-                inputs[k] = InputDict(
-                    **{k_: v_ for k_, v_ in zip(["node", "run", "file"], v.split(":"))}
-                )
+        return cls(name=name, node=node, inputs=inputs, params=params, success=False)
 
-        run = cls(name=name, node=node, inputs=inputs, params=params, success=False)
-        run.run(kernel_name=kernel_name, timeout=timeout)
-        run.save()
-        return run
+    def get_fingerprint(self) -> str:
+        """
+        Compute the fingerprint of the run.
+
+        The fingerprint covers the cell sources of the node notebook, the params, and the content
+        of all input files. Runs with the same fingerprint are expected to produce the same outputs.
+
+        Returns:
+            str: The fingerprint.
+        """
+        inputs = {
+            k: hash_file(
+                os.path.join(Run.get(v["node"], v["run"]).get_dir(), v["file"])
+            )
+            for k, v in self.inputs.items()
+        }
+        return hash_json(
+            {
+                "notebook": hash_notebook(Node.get(self.node).get_path()),
+                "params": self.params,
+                "inputs": inputs,
+            }
+        )
+
+    def reuse_cached(self) -> bool:
+        """
+        Reuse the outputs of a successful run with the same fingerprint.
+
+        The fingerprint of this run is computed and set. If a matching run exists, its files are
+        hard-linked (or copied, where linking is not possible) into the directory of this run and
+        the run is marked as successful. The matching run is not reused if its directory or any of
+        its recorded outputs no longer exist, e.g. after they were deleted by `collect_garbage`.
+
+        Returns:
+            bool: True if the outputs of a cached run were reused.
+        """
+        self.fingerprint = self.get_fingerprint()
+        record = get_catalog().get_run_by_fingerprint(self.fingerprint)
+        if record is None:
+            return False
+
+        source = Run(**record)
+        source_dir = source.get_dir()
+        if not os.path.isdir(source_dir) or any(
+            not os.path.isfile(os.path.join(source_dir, file))
+            for file in source.outputs or {}
+        ):
+            return False
+        for root, _, files in os.walk(source_dir):
+            target_root = os.path.join(
+                self.get_dir(), os.path.relpath(root, source_dir)
+            )
+            os.makedirs(target_root, exist_ok=True)
+            for file in files:
+                target_file = file
+                if root == source_dir and file == f"{source.name}.ipynb":
+                    target_file = f"{self.name}.ipynb"
+                target = os.path.join(target_root, target_file)
+                if os.path.lexists(target):
+                    os.remove(target)
+                try:
+                    os.link(os.path.join(root, file), target)
+                except OSError:
+                    shutil.copy2(os.path.join(root, file), target)
+
+        self.outputs = source.outputs
+        self.success = True
+        print(f"Run `{self.name}` reused the outputs of run `{source.name}`.")
+        return True
 
     def save(self) -> None:
         """
         Save the run information to the catalog.
         """
-        pipeline = Pipeline.from_catalog()
-        pipeline.runs.append(self)
-        pipeline.to_catalog()
+        get_catalog().add_run(asdict(self))
 
     @classmethod
     def get(cls, node: str, name: str) -> Optional["Run"]:
@@ -118,56 +350,145 @@ class Run:
         Returns:
             Optional[Run]: The Run instance if found, else None.
         """
-        pipeline = Pipeline.from_catalog()
-        runs = pipeline.runs
-        runs = list(filter(lambda x: x.success, runs))
-        try:
-            return next(
-                filter(lambda item: item.node == node and item.name == name, runs)
-            )
-        except StopIteration:
-            return None
+        record = get_catalog().get_run(node, name)
+        return cls(**record) if record else None
 
     @classmethod
-    def search(cls, func: Optional[Callable] = None) -> List["Run"]:
+    def search(
+        cls, func: Optional[Callable] = None, node: Optional[str] = None
+    ) -> List["Run"]:
         """
         Search for runs based on the provided filter function or expression.
 
         Args:
             func (Optional[Callable]): A filter function or expression to match runs.
+            node (Optional[str]): If given, only runs of this node are searched.
+                This uses the catalog index and is faster than filtering by `func`.
 
         Returns:
             List[Run]: A list of matching Run instances.
         """
-        runs = Pipeline.from_catalog().runs
-        runs = list(filter(lambda x: x.success, runs))
+        runs = [
+            cls(**record)
+            for record in get_catalog().runs(node=node)
+            if record["success"]
+        ]
         if func is not None:
             runs = list(filter(func, runs))
         return runs
 
     def run(
-        self, kernel_name: Optional[str] = None, timeout: Optional[int] = None
+        self,
+        kernel_name: Optional[str] = None,
+        timeout: Optional[int] = None,
+        kernel_pool: Optional[KernelPool] = None,
     ) -> None:
         """
         Execute the run.
 
+        Inputs and params are passed to the kernel as `PIPELINE_INPUT_*` and `PIPELINE_PARAM_*`
+        environment variables of the kernel only. The environment of the calling process is not
+        modified, so runs can be executed concurrently from multiple threads.
+
         Args:
             kernel_name (Optional[str]): The kernel name for execution.
             timeout (Optional[int]): Timeout for execution.
+            kernel_pool (Optional[KernelPool]): A pool of warm kernels to execute the run in.
+                If given, `kernel_name` is ignored.
         """
         os.makedirs(self.get_dir(), exist_ok=True)
-        os.environ.update(
-            **{
-                f"PIPELINE_INPUT_{k.upper()}": os.path.join(
-                    Run.get(v["node"], v["run"]).get_dir(), v["file"]
-                )
-                for k, v in self.inputs.items()
-            }
-        )
-        os.environ.update(
-            **{f"PIPELINE_PARAM_{k.upper()}": v for k, v in self.params.items()}
-        )
+        # Outputs recorded by a previous, failed attempt of this run are not outputs of this one.
+        reset_outputs(self.get_dir())
+        env = self._get_env()
+        km = kernel_pool.acquire(cwd=self.get_dir(), env=env) if kernel_pool else None
+        try:
+            client, profiler = self._create_client(kernel_name, timeout, km=km)
+        except BaseException:
+            if kernel_pool:
+                kernel_pool.release(km)
+            raise
+        try:
+            client.execute(env=_get_kernel_env(env))
+            self.success = True
+            print(f"Run `{self.name}` executed successfully.")
+        except Exception as e:
+            self.success = False
+            print(f"Run `{self.name}` failed with the following error:\n{e}")
+        finally:
+            if kernel_pool:
+                if client.kc is not None:
+                    client.kc.stop_channels()
+                kernel_pool.release(km, restart=not self.success)
+        self.profile = profiler.profile
+        self.outputs = read_outputs(self.get_dir())
+        self._write_notebook(client.nb)
+
+    async def async_run(
+        self,
+        kernel_name: Optional[str] = None,
+        timeout: Optional[int] = None,
+        run_timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Execute the run without blocking the event loop.
 
+        If the run times out or is cancelled, its kernel is shut down and the partially executed
+        notebook is still written.
+
+        Args:
+            kernel_name (Optional[str]): The kernel name for execution.
+            timeout (Optional[int]): Timeout for execution of each cell.
+            run_timeout (Optional[float]): Timeout for execution of the whole notebook.
+        """
+        os.makedirs(self.get_dir(), exist_ok=True)
+        # Outputs recorded by a previous, failed attempt of this run are not outputs of this one.
+        reset_outputs(self.get_dir())
+        env = self._get_env()
+        client, profiler = self._create_client(kernel_name, timeout)
+        # nbclient turns cancellation into other errors, so the execution runs in its own task
+        # and is cancelled explicitly.
+        task = asyncio.ensure_future(client.async_execute(env=_get_kernel_env(env)))
+        try:
+            try:
+                done, _ = await asyncio.wait({task}, timeout=run_timeout)
+            except asyncio.CancelledError:
+                task.cancel()
+                await asyncio.wait({task})
+                raise
+            if not done:
+                task.cancel()
+                await asyncio.wait({task})
+                self.success = False
+                print(f"Run `{self.name}` timed out after {run_timeout} seconds.")
+                return
+            task.result()
+            self.success = True
+            print(f"Run `{self.name}` executed successfully.")
+        except asyncio.CancelledError:
+            self.success = False
+            print(f"Run `{self.name}` was cancelled.")
+            raise
+        except Exception as e:
+            self.success = False
+            print(f"Run `{self.name}` failed with the following error:\n{e}")
+        finally:
+            self.profile = profiler.profile
+            self.outputs = read_outputs(self.get_dir())
+            self._write_notebook(client.nb)
+
+    def _get_env(self) -> Dict[str, str]:
+        env = {
+            f"PIPELINE_INPUT_{k.upper()}": os.path.join(
+                Run.get(v["node"], v["run"]).get_dir(), v["file"]
+            )
+            for k, v in self.inputs.items()
+        }
+        env.update({f"PIPELINE_PARAM_{k.upper()}": v for k, v in self.params.items()})
+        return env
+
+    def _create_client(
+        self, kernel_name: Optional[str], timeout: Optional[int], km=None
+    ) -> Tuple[NotebookClient, CellProfiler]:
         with open(Node.get(self.node).get_path(), encoding="utf-8") as f:
             nb = nbformat.read(f, as_version=4)
 
@@ -179,21 +500,22 @@ class Run:
             source = source[:max_length] + "..." if len(source) > max_length else source
             print(f"Executing cell {cell_index} | {source}")
 
-        kernel_name = kernel_name or ""
-
-        ep = ExecutePreprocessor(
-            kernel_name=kernel_name,
+        client = NotebookClient(
+            nb,
+            km=km,
+            kernel_name=kernel_name or "",
             timeout=timeout,
+            resources={"metadata": {"path": self.get_dir()}},
             on_cell_start=handle_cell_start,
         )
-        try:
-            ep.preprocess(nb, {"metadata": {"path": self.get_dir()}})
-            self.success = True
-            print(f"Run `{self.name}` executed successfully.")
-        except Exception as e:
-            self.success = False
-            print(f"Run `{self.name}` failed with the following error:\n{e}")
+        profiler = CellProfiler(
+            lambda: getattr(getattr(client.km, "provisioner", None), "pid", None)
+        )
+        client.on_cell_execute = profiler.on_cell_execute
+        client.on_cell_executed = profiler.on_cell_executed
+        return client, profiler
 
+    def _write_notebook(self, nb: nbformat.NotebookNode) -> None:
         with open(
             os.path.join(self.get_dir(), f"{self.name}.ipynb"), "w", encoding="utf-8"
         ) as f:
@@ -210,50 +532,49 @@ class Run:
 
     def get_files(self) -> List[str]:
         """
-        Get the list of files in the run directory.
+        Get the list of output files of the run.
+
+        If the run recorded its outputs with `NotebookHelper.save_output`, they are taken from the
+        catalog without accessing the run directory.
 
         Returns:
-            List[str]: The list of files in the run directory
+            List[str]: The recorded output files, or the list of files in the run directory if
+            no output was recorded.
         """
+        if self.outputs is not None:
+            return list(self.outputs)
         return os.listdir(self.get_dir())
 
     @classmethod
     def search_plot(cls, func: Optional[Callable] = None):
-        G = nx.DiGraph()
-
-        def format_run_label(run):
-            lines = (
-                [
-                    f"Node: {run.node}",
-                    f"Run: {run.name}",
-                ]
-                + [f"Param {k}: {v}" for k, v in run.params.items()]
-                + [
-                    f"Success: {run.success}",
-                ]
-            )
-            label = join_str([line for line in lines], "\n")
-            return f'"{label}"'
-
-        for run in cls.search(func=func):
-            G.add_node(format_run_label(run))
-            edge_labels = {}
-            for input_name, input_dict in run.inputs.items():
-                if not input_dict["node"] in edge_labels:
-                    edge_labels[input_dict["node"]] = {}
-                if not input_dict["run"] in edge_labels[input_dict["node"]]:
-                    edge_labels[input_dict["node"]][input_dict["run"]] = []
-                edge_labels[input_dict["node"]][input_dict["run"]].append(
-                    f'{input_dict["file"]} -> {input_name}'
-                )
-            for src_node, run_dict in edge_labels.items():
-                for src_run, labels in run_dict.items():
-                    G.add_edge(
-                        format_run_label(Run.get(src_node, src_run)),
-                        format_run_label(run),
-                        label='"{}"'.format(join_str(labels, "\n")),
-                    )
-        png = nx.drawing.nx_pydot.to_pydot(G).create_png()
+        """
+        Render the lineage of runs as a PNG image with Graphviz.
+
+        For large catalogs, use `Lineage` to restrict the graph and export it without Graphviz.
+
+        Args:
+            func (Optional[Callable]): A function to filter runs. Runs they take inputs from are
+                also shown.
+
+        Returns:
+            Image: The rendered image, also saved as `pipeline.png` in the catalog directory.
+        """
+        import pydot
+
+        catalog = get_catalog()
+        records = [asdict(run) for run in cls.search(func=func)]
+        keys = {(record["node"], record["name"]) for record in records}
+        for record in list(records):
+            for input_dict in record["inputs"].values():
+                key = (input_dict["node"], input_dict["run"])
+                if key not in keys:
+                    upstream = catalog.get_run(*key)
+                    if upstream is not None:
+                        records.append(upstream)
+                    keys.add(key)
+
+        (graph,) = pydot.graph_from_dot_data(Lineage(records).to_dot())
+        png = graph.create_png()
         path = os.path.join(CATALOG_DIR, "pipeline.png")
         with open(path, "wb") as f:
             f.write(png)
@@ -304,9 +625,7 @@ class Node:
         """
         Save the node information to the catalog.
         """
-        pipeline = Pipeline.from_catalog()
-        pipeline.nodes.append(self)
-        pipeline.to_catalog()
+        get_catalog().add_node(asdict(self))
 
     @classmethod
     def get(cls, name: str) -> Optional["Node"]:
@@ -319,11 +638,8 @@ class Node:
         Returns:
             Optional[Node]: The Node instance if found, else None.
         """
-        pipeline = Pipeline.from_catalog()
-        try:
-            return next(filter(lambda item: item.name == name, pipeline.nodes))
-        except StopIteration:
-            return None
+        record = get_catalog().get_node(name)
+        return cls(**record) if record else None
 
     @classmethod
     def search(cls, func: Optional[Callable] = None) -> List["Node"]:
@@ -336,7 +652,7 @@ class Node:
         Returns:
             List[Node]: A list of matching Node instances.
         """
-        nodes = Pipeline.from_catalog().nodes
+        nodes = [cls(**record) for record in get_catalog().nodes()]
         if func is not None:
             nodes = list(filter(func, nodes))
         return nodes
@@ -348,7 +664,19 @@ class Node:
         Returns:
             List[Run]: runs associated with this node.
         """
-        return Run.search(lambda x: x.node == self.name)
+        return Run.search(node=self.name)
+
+    def get_profile_report(self, top: Optional[int] = None) -> pd.DataFrame:
+        """
+        Rank the slowest cells across all runs of this node.
+
+        Args:
+            top (Optional[int]): The number of rows to return. Defaults to None (all rows).
+
+        Returns:
+            pd.DataFrame: One row per executed cell, sorted by wall time in descending order.
+        """
+        return profile_report(self.get_runs(), top=top)
 
     def create_run(self, *args, **kwargs) -> Run:
         """
@@ -360,6 +688,66 @@ class Node:
         run = Run.create(self.name, *args, **kwargs)
         return run
 
+    async def async_create_run(self, *args, **kwargs) -> Run:
+        """
+        Create a run associated with this node without blocking the event loop.
+
+        Returns:
+            Run: The created Run instance.
+        """
+        run = await Run.async_create(self.name, *args, **kwargs)
+        return run
+
+    def sweep(
+        self,
+        grid: Dict[str, List[Any]],
+        inputs: Optional[Dict[str, Union[InputDict, str]]] = None,
+        n_samples: Optional[int] = None,
+        seed: Optional[int] = None,
+        prefix: str = "sweep-",
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Create runs of this node for combinations of parameters, in parallel.
+
+        Each combination becomes a run named from the hash of its params and inputs, so the same
+        combination always gets the same name and combinations that already have a successful run
+        are skipped.
+
+        Args:
+            grid (Dict[str, List[Any]]): The values of each parameter (see `expand_grid`).
+            inputs (Optional[Dict[str, InputDict]]): Inputs shared by all runs.
+            n_samples (Optional[int]): If given, this many combinations are sampled at random.
+            seed (Optional[int]): The random seed for sampling.
+            prefix (str): The prefix of run names. Defaults to "sweep-".
+            max_workers (Optional[int]): The number of runs executed concurrently.
+            **kwargs: Other arguments of `execute_runs`, e.g. `kernel_name`, `timeout`,
+                `executor` or `cache`.
+
+        Returns:
+            pd.DataFrame: One row per combination, with the columns `run`, `status` and one column
+            per parameter. The status is one of those of `execute_runs`.
+
+        Example:
+            >>> node.sweep({"lr": [0.1, 0.01], "batch_size": [32, 64]}, max_workers=4)
+        """
+        from .scheduler import RunSpec, execute_runs, expand_grid
+
+        inputs = {k: parse_input(v) for k, v in (inputs or {}).items()}
+        specs = []
+        for params in expand_grid(grid, n_samples=n_samples, seed=seed):
+            name = prefix + hash_json({"params": params, "inputs": inputs})[:12]
+            specs.append(RunSpec(self.name, name, inputs=inputs, params=params))
+        statuses = execute_runs(specs, max_workers=max_workers, **kwargs)
+        return pd.DataFrame(
+            [
+                {"run": spec.name, "status": statuses[spec.key], **spec.params}
+                for spec in specs
+            ],
+            columns=["run", "status", *grid],
+        )
+
     def get_path(self) -> str:
         """
         Get the file path for the node.
@@ -382,20 +770,21 @@ class Pipeline(YAMLWizard):
     @classmethod
     def from_catalog(cls) -> "Pipeline":
         """
-        Load the catalog from the YAML file.
+        Load the catalog from the catalog store.
 
         Returns:
             Catalog: The loaded Catalog instance.
         """
-        if not os.path.exists(os.path.join(CATALOG_DIR, CATALOG_NAME)):
-            pipeline = cls(nodes=[], runs=[])
-            return pipeline
-        else:
-            pipeline = cls.from_yaml_file(os.path.join(CATALOG_DIR, CATALOG_NAME))
-            return pipeline
+        catalog = get_catalog()
+        return cls(
+            nodes=[Node(**record) for record in catalog.nodes()],
+            runs=[Run(**record) for record in catalog.runs()],
+        )
 
     def to_catalog(self) -> None:
         """
-        Save the catalog to the YAML file.
+        Save the catalog to the catalog store.
         """
-        self.to_yaml_file(os.path.join(CATALOG_DIR, CATALOG_NAME))
+        get_catalog().replace(
+            [asdict(node) for node in self.nodes], [asdict(run) for run in self.runs]
+        )
@@ -0,0 +1,113 @@
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+CellProfile = Dict[str, Any]
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else None
+
+
+def _read_cpu_time(pid: int) -> Optional[float]:
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except (OSError, IndexError):
+        return None
+    # utime and stime are the 14th and 15th fields, counted from the pid
+    return (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS
+
+
+def _read_peak_rss(pid: int) -> Optional[int]:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _reset_peak_rss(pid: int) -> None:
+    try:
+        with open(f"/proc/{pid}/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+class CellProfiler:
+    def __init__(self, get_pid: Callable[[], Optional[int]]) -> None:
+        """
+        Records wall time, CPU time and peak RSS of executed notebook cells.
+
+        CPU time and peak RSS are read for the kernel process from `/proc`, so they are only
+        available on Linux, and None elsewhere. Peak RSS is reset before each cell where the
+        kernel allows it; otherwise it is the peak of the kernel process so far.
+
+        Use `on_cell_execute` and `on_cell_executed` as the hooks of the same names of
+        `NotebookClient`.
+
+        Args:
+            get_pid (Callable[[], Optional[int]]): Returns the process id of the kernel, or None if unknown.
+        """
+        self._get_pid = get_pid
+        self._start: Optional[Tuple[float, Optional[float]]] = None
+        self.profile: List[CellProfile] = []
+
+    def on_cell_execute(self, cell, cell_index: int) -> None:
+        pid = self._get_pid()
+        if pid is not None:
+            _reset_peak_rss(pid)
+        cpu_time = _read_cpu_time(pid) if pid is not None else None
+        self._start = (time.perf_counter(), cpu_time)
+
+    def on_cell_executed(self, cell, cell_index: int, execute_reply=None) -> None:
+        if self._start is None:
+            return
+        start_time, start_cpu_time = self._start
+        wall_time = time.perf_counter() - start_time
+        self._start = None
+
+        pid = self._get_pid()
+        cpu_time = peak_rss = None
+        if pid is not None:
+            end_cpu_time = _read_cpu_time(pid)
+            if start_cpu_time is not None and end_cpu_time is not None:
+                cpu_time = end_cpu_time - start_cpu_time
+            peak_rss = _read_peak_rss(pid)
+
+        record = {
+            "wall_time": wall_time,
+            "cpu_time": cpu_time,
+            "peak_rss": peak_rss,
+        }
+        cell.metadata["profile"] = dict(record)
+        self.profile.append(
+            {"cell": cell_index, "source": cell.get("source", "")[:100], **record}
+        )
+
+
+def profile_report(runs: List[Any], top: Optional[int] = None) -> pd.DataFrame:
+    """
+    Rank the cells of runs by their wall time.
+
+    Args:
+        runs (List[Run]): The runs. Runs without a profile are ignored.
+        top (Optional[int]): The number of rows to return. Defaults to None (all rows).
+
+    Returns:
+        pd.DataFrame: One row per executed cell, with the columns `node`, `run`, `cell`, `source`,
+        `wall_time`, `cpu_time` and `peak_rss`, sorted by `wall_time` in descending order.
+    """
+    columns = ["node", "run", "cell", "source", "wall_time", "cpu_time", "peak_rss"]
+    rows = [
+        {"node": run.node, "run": run.name, **record}
+        for run in runs
+        for record in run.profile or []
+    ]
+    df = pd.DataFrame(rows, columns=columns)
+    df = df.sort_values("wall_time", ascending=False, ignore_index=True)
+    return df if top is None else df.head(top)
@@ -0,0 +1,275 @@
+import itertools
+import random
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import networkx as nx
+
+from . import pipeline
+from .pipeline import InputDict, Run, parse_input
+
+
+@dataclass
+class RunSpec:
+    """
+    Specification of a run to be executed by `execute_runs`.
+    """
+
+    node: str
+    name: str
+    inputs: Dict[str, Union[InputDict, str]] = field(default_factory=dict)
+    params: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.node, self.name
+
+
+def _execute_run(
+    catalog_dir: str,
+    catalog_backend: Optional[str],
+    run: Run,
+    kernel_name: Optional[str],
+    timeout: Optional[int],
+) -> Run:
+    # May be executed in a worker process, which does not share the driver's settings.
+    pipeline.set_catalog_dir(catalog_dir)
+    pipeline.set_catalog_backend(catalog_backend)
+    run.run(kernel_name=kernel_name, timeout=timeout)
+    return run
+
+
+def expand_grid(
+    grid: Dict[str, Sequence[Any]],
+    n_samples: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> List[Dict[str, str]]:
+    """
+    Expand a parameter grid into parameter combinations.
+
+    Args:
+        grid (Dict[str, Sequence[Any]]): The values of each parameter. Values are converted to strings.
+        n_samples (Optional[int]): If given, this many distinct combinations are sampled at random
+            instead of returning all of them.
+        seed (Optional[int]): The random seed for sampling.
+
+    Returns:
+        List[Dict[str, str]]: The parameter combinations, in grid order.
+
+    Example:
+        >>> expand_grid({"lr": [0.1, 0.01], "batch_size": [32]})
+        [{'lr': '0.1', 'batch_size': '32'}, {'lr': '0.01', 'batch_size': '32'}]
+    """
+    keys = list(grid)
+    values = [[str(value) for value in grid[key]] for key in keys]
+    sizes = [len(v) for v in values]
+    total = 1
+    for size in sizes:
+        total *= size
+
+    if n_samples is None:
+        combinations = itertools.product(*values)
+    else:
+        # Sample indices into the product, so the grid is never materialized.
+        indices = sorted(
+            random.Random(seed).sample(range(total), min(n_samples, total))
+        )
+        combinations = []
+        for index in indices:
+            combination = []
+            for v, size in zip(reversed(values), reversed(sizes)):
+                index, i = divmod(index, size)
+                combination.append(v[i])
+            combinations.append(reversed(combination))
+    return [dict(zip(keys, combination)) for combination in combinations]
+
+
+def build_run_graph(specs: List[RunSpec]) -> nx.DiGraph:
+    """
+    Build the dependency graph of run specs.
+
+    An edge `a -> b` means that run `b` uses an output of run `a`. Inputs referring to runs
+    outside of `specs` are not part of the graph; they must already exist in the catalog.
+
+    Args:
+        specs (List[RunSpec]): The run specs.
+
+    Returns:
+        nx.DiGraph: A directed acyclic graph whose nodes are `(node, run)` keys.
+    """
+    graph = nx.DiGraph()
+    for spec in specs:
+        if spec.key in graph:
+            raise ValueError(f"Duplicate run `{spec.name}` for node `{spec.node}`.")
+        graph.add_node(spec.key, spec=spec)
+
+    for spec in specs:
+        for value in spec.inputs.values():
+            value = parse_input(value)
+            upstream = (value["node"], value["run"])
+            if upstream in graph:
+                graph.add_edge(upstream, spec.key)
+
+    if not nx.is_directed_acyclic_graph(graph):
+        raise ValueError("Run specs contain a dependency cycle.")
+    return graph
+
+
+class _Scheduler:
+    # The state of an `execute_runs` call: the status of each finished run, the number of
+    # unfinished upstream runs of each pending run, and the run of each submitted future.
+
+    def __init__(
+        self,
+        graph: nx.DiGraph,
+        executor: Executor,
+        kernel_name: Optional[str],
+        timeout: Optional[int],
+        cache: bool,
+    ) -> None:
+        self.graph = graph
+        self.executor = executor
+        self.kernel_name = kernel_name
+        self.timeout = timeout
+        self.cache = cache
+        self.statuses: Dict[Tuple[str, str], str] = {}
+        self.remaining = {key: graph.in_degree(key) for key in graph}
+        self.futures: Dict[Future, Tuple[str, str]] = {}
+
+    def finish(self, key: Tuple[str, str], status: str) -> None:
+        self.statuses[key] = status
+        print(f"Run `{key[1]}` of node `{key[0]}`: {status}")
+        for successor in self.graph.successors(key):
+            if status in ("success", "exists", "cached"):
+                self.remaining[successor] -= 1
+            elif successor not in self.statuses:
+                self.finish(successor, "skipped")
+
+    def _start(self, key: Tuple[str, str]) -> Optional[str]:
+        # Returns the status of a run finished without executing it, or None once submitted.
+        spec = self.graph.nodes[key]["spec"]
+        if Run.get(spec.node, spec.name):
+            return "exists"
+        run = Run(
+            node=spec.node,
+            name=spec.name,
+            inputs={k: parse_input(v) for k, v in spec.inputs.items()},
+            params=dict(spec.params),
+            success=False,
+        )
+        try:
+            cached = self.cache and run.reuse_cached()
+        except Exception as e:
+            print(f"Run `{key[1]}` of node `{key[0]}` raised an error:\n{e}")
+            return "failed"
+        if cached:
+            run.save()
+            return "cached"
+        future = self.executor.submit(
+            _execute_run,
+            pipeline.get_catalog_dir(),
+            pipeline.CATALOG_BACKEND,
+            run,
+            self.kernel_name,
+            self.timeout,
+        )
+        self.futures[future] = key
+        return None
+
+    def submit_ready(self) -> None:
+        ready = [key for key, count in self.remaining.items() if count == 0]
+        while ready:
+            key = ready.pop(0)
+            del self.remaining[key]
+            if key in self.statuses:
+                continue
+            status = self._start(key)
+            if status is None:
+                continue
+            self.finish(key, status)
+            ready.extend(
+                s for s in self.graph.successors(key) if self.remaining.get(s) == 0
+            )
+
+    def complete(self, done: Iterable[Future]) -> None:
+        for future in done:
+            key = self.futures.pop(future)
+            try:
+                run = future.result()
+            except Exception as e:
+                print(f"Run `{key[1]}` of node `{key[0]}` raised an error:\n{e}")
+                self.finish(key, "failed")
+                continue
+            run.save()
+            self.finish(key, "success" if run.success else "failed")
+
+
+def execute_runs(
+    specs: List[RunSpec],
+    max_workers: Optional[int] = None,
+    kernel_name: Optional[str] = None,
+    timeout: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    cache: bool = False,
+) -> Dict[Tuple[str, str], str]:
+    """
+    Execute runs concurrently, respecting the dependencies between them.
+
+    A run is submitted as soon as all runs it takes inputs from have finished successfully.
+    Notebooks are executed in worker processes, while the catalog is only written by the
+    calling process.
+
+    The status of each run is one of:
+        - "success": The run was executed successfully.
+        - "failed": The execution of the run failed.
+        - "skipped": The run was not executed because a run it depends on did not succeed.
+        - "exists": A successful run with the same name already exists in the catalog.
+        - "cached": The outputs of a run with the same fingerprint were reused (see `Run.create`).
+
+    Args:
+        specs (List[RunSpec]): The runs to execute.
+        max_workers (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+        kernel_name (Optional[str]): The kernel name for execution.
+        timeout (Optional[int]): Timeout for execution of each cell.
+        executor (Optional[Executor]): An executor to use instead of a new process pool,
+            e.g. a `ThreadPoolExecutor` to execute runs from threads of the calling process, or a
+            `FileQueueExecutor` to execute runs on workers of other machines.
+        cache (bool): If True, runs are fingerprinted and reuse the outputs of cached runs.
+            Defaults to False.
+
+    Returns:
+        Dict[Tuple[str, str], str]: The status of each run, keyed by `(node, run)`.
+
+    Example:
+        >>> statuses = execute_runs(
+        ...     [
+        ...         RunSpec("preprocess", "v1"),
+        ...         RunSpec("train", "v1", inputs={"data": "preprocess:v1:data.csv"}),
+        ...     ],
+        ...     max_workers=4,
+        ... )
+    """
+    graph = build_run_graph(specs)
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    scheduler = _Scheduler(graph, executor, kernel_name, timeout, cache)
+    try:
+        scheduler.submit_ready()
+        while scheduler.futures:
+            done, _ = wait(scheduler.futures, return_when=FIRST_COMPLETED)
+            scheduler.complete(done)
+            scheduler.submit_ready()
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    return {spec.key: scheduler.statuses[spec.key] for spec in specs}
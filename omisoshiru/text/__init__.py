@@ -2,14 +2,20 @@
 Text processing utilities for various tasks, including Japanese text processing, fuzzy replacements, string manipulation, and more.
 """
 
+from .._lazy import attach
 
-from . import wakachi
-from .fuzzy_replacer import FuzzyReplacer
-from .insert_newlines import insert_newlines
-from .join_str import join_str
-from .replace_text_ranges import replace_text_ranges
-from .tfidf_cosine_similarity import tfidf_cosine_similarity
-from .unify_hz import unify_hz
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=["wakachi"],
+    attributes={
+        "FuzzyReplacer": "fuzzy_replacer",
+        "insert_newlines": "insert_newlines",
+        "join_str": "join_str",
+        "replace_text_ranges": "replace_text_ranges",
+        "tfidf_cosine_similarity": "tfidf_cosine_similarity",
+        "unify_hz": "unify_hz",
+    },
+)
 
 __all__ = [
     "FuzzyReplacer",
@@ -1,5 +1,4 @@
 from .join_str import join_str
-from .wakachi import Wakachi
 
 # TODO: Wakachiを使って単語区切りにする
 
@@ -1,7 +1,5 @@
 from typing import List, Optional
 
-import pandas as pd
-
 
 def join_str(strings: List[str], sep: Optional[str] = None) -> str:
     """
@@ -22,4 +20,6 @@ def join_str(strings: List[str], sep: Optional[str] = None) -> str:
     if sep is None:
         sep = ""
 
+    import pandas as pd
+
     return sep.join([s if pd.notna(s) else "" for s in strings])
@@ -1,7 +1,6 @@
 from typing import List, Optional
 
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
 
 from omisoshiru.math import cosine_similarity
 
@@ -31,6 +30,8 @@ def tfidf_cosine_similarity(
         >>> tfidf_cosine_similarity(documents_a, documents_b)
         array([0.2753838, 0.])
     """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
     # Convert documents to TF-IDF vectors
     vectorizer = TfidfVectorizer(tokenizer=tokenizer)
     vectorizer.fit(a + b)
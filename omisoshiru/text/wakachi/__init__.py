@@ -3,8 +3,16 @@ Japanese text processing utilities using MeCab.
 
 This module provides classes and functions for tokenizing Japanese text, matching patterns, and performing replacements.
 """
-from .wakachi import Wakachi
-from .wakachi_matcher import WakachiMatcher
-from .wakachi_replacer import WakachiReplacer
+
+from ..._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "Wakachi": "wakachi",
+        "WakachiMatcher": "wakachi_matcher",
+        "WakachiReplacer": "wakachi_replacer",
+    },
+)
 
 __all__ = ["Wakachi", "WakachiMatcher", "WakachiReplacer"]
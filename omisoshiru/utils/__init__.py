@@ -1,10 +1,13 @@
-from .convert_dict_of_lists_to_list_of_dicts import (
-    convert_dict_of_lists_to_list_of_dicts,
-)
-from .convert_list_of_dicts_to_dict_of_lists import (
-    convert_list_of_dicts_to_dict_of_lists,
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "convert_dict_of_lists_to_list_of_dicts": "convert_dict_of_lists_to_list_of_dicts",
+        "convert_list_of_dicts_to_dict_of_lists": "convert_list_of_dicts_to_dict_of_lists",
+        "process_batches": "process_batches",
+    },
 )
-from .process_batches import process_batches
 
 __all__ = [
     "process_batches",
@@ -1,7 +1,6 @@
 from typing import Literal, Optional
 
 import numpy as np
-import torch
 
 
 def convert_list_of_dicts_to_dict_of_lists(
@@ -18,6 +17,8 @@ def convert_list_of_dicts_to_dict_of_lists(
     elif stack == "numpy":
         dict_of_lists = {k: np.stack(v) for k, v in dict_of_lists.items()}
     elif stack == "torch":
+        import torch
+
         dict_of_lists = {k: torch.stack(v) for k, v in dict_of_lists.items()}
 
     return dict_of_lists
@@ -1,10 +1,12 @@
-from typing import Callable, Literal, Optional, Union
+from typing import TYPE_CHECKING, Callable, Literal, Optional, Union
 
 import numpy as np
 import pandas as pd
-import torch
 from tqdm.auto import tqdm
 
+if TYPE_CHECKING:
+    import torch
+
 from .convert_dict_of_lists_to_list_of_dicts import (
     convert_dict_of_lists_to_list_of_dicts,
 )
@@ -14,13 +16,13 @@ from .convert_list_of_dicts_to_dict_of_lists import (
 
 
 def process_batches(
-    iterable: Union[pd.DataFrame, pd.Series, list, np.ndarray, torch.Tensor],
+    iterable: Union[pd.DataFrame, pd.Series, list, np.ndarray, "torch.Tensor"],
     function: Callable,
     batch_size: int,
     result_type: Optional[Literal["numpy", "torch"]] = None,
     axis: Optional[int] = None,
     dictionary_input: Optional[Union[Literal["numpy", "torch"], bool]] = None,
-) -> Union[np.ndarray, torch.Tensor, list]:
+) -> Union[np.ndarray, "torch.Tensor", list]:
     """
     Process data in batches using a specified function.
 
@@ -83,6 +85,8 @@ def process_batches(
     if result_type == "numpy":
         results = np.concatenate(results, axis=axis)
     elif result_type == "torch":
+        import torch
+
         results = torch.cat(results, dim=axis)
     elif result_type == "list":
         results = [sample for batch in results for sample in batch]
@@ -1,3 +1,10 @@
 from setuptools import find_packages, setup
 
-setup(name="omisoshiru", version="0.1.0", packages=find_packages())
+setup(
+    name="omisoshiru",
+    version="0.1.0",
+    packages=find_packages(),
+    entry_points={
+        "console_scripts": ["omisoshiru-pipeline=omisoshiru.pipeline.cli:main"]
+    },
+)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from omisoshiru.collections import ArrayHeapQueue
+
+
+def test_push_and_pop():
+    queue = ArrayHeapQueue()
+    queue.push(3, 0)
+    queue.push(1, 1)
+    queue.push(2, 2)
+
+    assert queue.peek() == (1, 1)
+    assert queue.pop() == (1, 1)
+    assert queue.pop() == (2, 2)
+    assert queue.pop() == (3, 0)
+    assert not queue
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+def test_push_many_and_pop_k_descending():
+    queue = ArrayHeapQueue(ascending=False, capacity=2)
+    queue.push_many(np.array([3.0, 1.0, 2.0, 5.0]), np.array([0, 1, 2, 3]))
+    queue.push(4.0, 4)
+
+    values, ids = queue.pop_k(3)
+    np.testing.assert_array_equal(values, [5.0, 4.0, 3.0])
+    np.testing.assert_array_equal(ids, [3, 4, 0])
+    assert len(queue) == 2
+    assert queue.pop() == (2.0, 2)
+
+
+def test_ties_in_insertion_order():
+    queue = ArrayHeapQueue()
+    queue.push_many(np.zeros(5), np.arange(5))
+    queue.push(0.0, 5)
+
+    values, ids = queue.pop_k(10)
+    np.testing.assert_array_equal(ids, np.arange(6))
+
+
+@pytest.mark.parametrize("batch", [1, 10, 1000])
+def test_matches_sorted_order(batch):
+    rng = np.random.default_rng(0)
+    queue = ArrayHeapQueue()
+    expected = []
+    for step in range(20):
+        values = rng.integers(0, 100, size=batch).astype(float)
+        ids = np.arange(step * batch, (step + 1) * batch)
+        queue.push_many(values, ids)
+        expected += list(zip(values, ids))
+        expected.sort()
+        popped_values, popped_ids = queue.pop_k(batch // 2 + 1)
+        head, expected = expected[: batch // 2 + 1], expected[batch // 2 + 1 :]
+        assert list(zip(popped_values, popped_ids)) == head
+    assert len(queue) == len(expected)
+
+
+def test_bulk_operations_keep_heap_invariant():
+    rng = np.random.default_rng(1)
+    queue = ArrayHeapQueue()
+    expected = []
+    for step in range(10):
+        # Many ties, so the insertion order matters
+        values = rng.integers(0, 5, size=3000).astype(float)
+        ids = np.arange(step * 3000, (step + 1) * 3000)
+        queue.push_many(values, ids)
+        expected += list(zip(values, ids))
+        heap_values, _ = queue.items()
+        children = np.arange(1, len(heap_values))
+        assert (heap_values[(children - 1) // 2] <= heap_values[children]).all()
+
+        expected.sort()
+        popped_values, popped_ids = queue.pop_k(1000)
+        head, expected = expected[:1000], expected[1000:]
+        assert list(zip(popped_values, popped_ids)) == head
+
+
+def test_pop_k_invalid():
+    queue = ArrayHeapQueue()
+    queue.push(1.0, 0)
+    with pytest.raises(ValueError):
+        queue.pop_k(-1)
+    values, ids = queue.pop_k(0)
+    assert len(values) == len(ids) == 0
+    assert len(queue) == 1
@@ -1,3 +1,7 @@
+import random
+
+import pytest
+
 from omisoshiru.collections import HeapQueue
 
 
@@ -45,3 +49,69 @@ def test_ascending():
     heap_queue_descending.push(2, "orange")
 
     assert heap_queue_descending.items() == [(3, "apple"), (1, "banana"), (2, "orange")]
+
+
+def test_update_and_remove():
+    heap_queue = HeapQueue()
+    heap_queue.push(3, "apple")
+    heap_queue.push(1, "banana")
+    heap_queue.push(2, "orange")
+
+    heap_queue.update(0, "apple")
+    heap_queue.update(5, "banana")
+    heap_queue.update(4, "grape")
+    assert "orange" in heap_queue
+    assert heap_queue.get("banana") == 5
+    assert heap_queue.remove("orange") == 2
+    assert "orange" not in heap_queue
+    assert [heap_queue.pop() for _ in range(len(heap_queue))] == [
+        (0, "apple"),
+        (4, "grape"),
+        (5, "banana"),
+    ]
+
+
+def test_push_duplicate():
+    heap_queue = HeapQueue()
+    heap_queue.push(3, "apple")
+
+    with pytest.raises(ValueError):
+        heap_queue.push(1, "apple")
+
+
+def test_peek_and_pushpop():
+    heap_queue = HeapQueue(ascending=False)
+    heap_queue.push(3, "apple")
+    heap_queue.push(1, "banana")
+
+    assert heap_queue.peek() == (3, "apple")
+    assert heap_queue.pushpop(5, "grape") == (5, "grape")
+    assert heap_queue.pushpop(2, "orange") == (3, "apple")
+    assert len(heap_queue) == 2
+    assert heap_queue.peek() == (2, "orange")
+
+
+def test_bulk_construction_and_ties():
+    heap_queue = HeapQueue(items=[(2, "a"), (1, "b"), (2, "c"), (1, "d")])
+
+    assert [heap_queue.pop() for _ in range(4)] == [
+        (1, "b"),
+        (1, "d"),
+        (2, "a"),
+        (2, "c"),
+    ]
+
+
+def test_random_operations():
+    rng = random.Random(0)
+    heap_queue = HeapQueue(items=[(rng.random(), i) for i in range(100)])
+    expected = {item: value for value, item in heap_queue.items()}
+    for _ in range(1000):
+        item = rng.randrange(200)
+        if rng.random() < 0.3 and item in expected:
+            assert heap_queue.remove(item) == expected.pop(item)
+        else:
+            expected[item] = rng.random()
+            heap_queue.update(expected[item], item)
+    result = [heap_queue.pop() for _ in range(len(heap_queue))]
+    assert result == sorted((value, item) for item, value in expected.items())
@@ -0,0 +1,69 @@
+import random
+from collections import deque
+
+import pytest
+
+from omisoshiru.collections import LazyDeque, remove_item_from_deque
+
+
+def test_append_and_pop():
+    queue = LazyDeque()
+    queue.append(1)
+    queue.append(2)
+    queue.appendleft(0)
+
+    assert list(queue) == [0, 1, 2]
+    assert queue.popleft() == 0
+    assert queue.pop() == 2
+    assert queue.pop() == 1
+    assert not queue
+    with pytest.raises(IndexError):
+        queue.popleft()
+
+
+def test_remove_by_key():
+    queue = LazyDeque(key=lambda x: x[0])
+    queue.append(("apple", 1))
+    queue.append(("banana", 2))
+    queue.append(("apple", 3))
+
+    assert queue.remove("apple") == 2
+    assert queue.remove("apple") == 0
+    assert "apple" not in queue
+    queue.append(("apple", 4))
+    assert "apple" in queue
+    assert len(queue) == 2
+    assert list(queue) == [("banana", 2), ("apple", 4)]
+    assert queue.popleft() == ("banana", 2)
+    assert queue.popleft() == ("apple", 4)
+
+
+def test_remove_where():
+    queue = LazyDeque()
+    for i in range(10):
+        queue.append(i)
+    queue.remove(3)
+
+    assert remove_item_from_deque(queue, lambda x: x % 2 == 0) is queue
+    assert list(queue) == [1, 5, 7, 9]
+    assert len(queue) == 4
+
+
+def test_matches_deque():
+    rng = random.Random(0)
+    queue = LazyDeque(key=lambda x: x % 10)
+    expected = deque()
+    for i in range(2000):
+        operation = rng.random()
+        if operation < 0.5:
+            queue.append(i)
+            expected.append(i)
+        elif operation < 0.7:
+            key = rng.randrange(10)
+            removed = sum(1 for x in expected if x % 10 == key)
+            expected = deque(x for x in expected if x % 10 != key)
+            assert queue.remove(key) == removed
+        elif expected:
+            assert queue.popleft() == expected.popleft()
+        assert len(queue) == len(expected)
+    assert list(queue) == list(expected)
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from omisoshiru.collections.priority_set import PrioritySet
@@ -147,3 +149,53 @@ def test_priority_set_max_size_descending():
     # Adding a new item should remove the lowest priority item
     assert priority_set.add(2, "orange") == (True, (1, "banana"))
     assert priority_set.items() == [(3, "apple"), (2, "orange")]
+
+
+def test_priority_set_key():
+    priority_set = PrioritySet(key=lambda x: x[0], ascending=True)
+
+    assert priority_set.add(3, ("apple", 1)) == (True, None)
+    assert priority_set.add(2, ("apple", 2)) == (True, (3, ("apple", 1)))
+    assert priority_set.add(4, ("apple", 3)) == (False, None)
+    assert ("apple", 0) in priority_set
+    assert priority_set.get(("apple", 0)) == 2
+    assert priority_set.items() == [(2, ("apple", 2))]
+
+
+def test_priority_set_contains_len_remove():
+    priority_set = PrioritySet(ascending=True)
+
+    priority_set.add(3, "apple")
+    priority_set.add(1, "banana")
+
+    assert "apple" in priority_set
+    assert "orange" not in priority_set
+    assert len(priority_set) == 2
+    assert priority_set.remove("apple") == (3, "apple")
+    assert "apple" not in priority_set
+    assert priority_set.items() == [(1, "banana")]
+    with pytest.raises(KeyError):
+        priority_set.remove("apple")
+
+
+def test_priority_set_matches_sorted_list():
+    rng = random.Random(0)
+    max_size = 20
+    priority_set = PrioritySet(ascending=True, max_size=max_size)
+    expected = {}
+    for _ in range(2000):
+        value, item = rng.randint(0, 100), rng.randint(0, 50)
+        if item in expected and expected[item] <= value:
+            continue
+        expected[item] = value
+        if len(expected) > max_size:
+            worst = max(expected.items(), key=lambda x: (x[1], x[0]))
+            del expected[worst[0]]
+        priority_set.add(value, item)
+        if rng.random() < 0.1 and priority_set:
+            popped_value, popped_item = priority_set.pop()
+            assert (popped_value, popped_item) == min(
+                (v, i) for i, v in expected.items()
+            )
+            del expected[popped_item]
+        assert priority_set.items() == sorted((v, i) for i, v in expected.items())
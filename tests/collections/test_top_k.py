@@ -0,0 +1,81 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from omisoshiru.collections import TopK
+
+
+def test_offer():
+    top_k = TopK(2)
+
+    assert top_k.offer(3, "apple")
+    assert top_k.offer(1, "banana")
+    assert top_k.offer(5, "orange")
+    assert not top_k.offer(1, "grape")
+    assert top_k.threshold == 3
+    assert top_k.items() == [(5, "orange"), (3, "apple")]
+
+
+def test_offer_smallest_ties():
+    top_k = TopK(2, largest=False)
+
+    for item, value in enumerate([2, 1, 2, 1, 2]):
+        top_k.offer(value, item)
+
+    assert top_k.items() == [(1, 1), (1, 3)]
+
+
+def test_offer_key():
+    top_k = TopK(2, key=lambda x: x[0])
+
+    assert top_k.offer(3, ("apple", 1))
+    assert top_k.offer(4, ("apple", 2))
+    assert not top_k.offer(2, ("apple", 3))
+    assert top_k.offer(1, ("banana", 1))
+    assert top_k.offer(5, ("orange", 1))
+    assert top_k.items() == [(5, ("orange", 1)), (4, ("apple", 2))]
+
+
+@pytest.mark.parametrize("largest", [True, False])
+@pytest.mark.parametrize("chunk_size", [7, 1000])
+def test_offer_many_matches_sort(largest, chunk_size):
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 20, size=500)
+    top_k = TopK(10, largest=largest)
+
+    top_k.offer_many(values[:200], chunk_size=chunk_size)
+    top_k.offer_many(values[200:], chunk_size=chunk_size)
+
+    order = np.argsort(-values if largest else values, kind="stable")[:10]
+    assert top_k.items() == [(values[i].item(), i) for i in order]
+
+
+def test_offer_many_key():
+    rng = np.random.default_rng(0)
+    values = rng.random(300)
+    items = [i % 13 for i in range(300)]
+    top_k = TopK(5, key=lambda x: x)
+
+    top_k.offer_many(values, items, chunk_size=50)
+
+    best = {}
+    for value, item in zip(values.tolist(), items):
+        best[item] = max(best.get(item, value), value)
+    expected = sorted(((v, i) for i, v in best.items()), reverse=True)[:5]
+    assert top_k.items() == expected
+
+
+def test_merge():
+    values = np.arange(100.0)
+    parts = []
+    for part in np.array_split(np.random.default_rng(0).permutation(100), 4):
+        top_k = TopK(5)
+        top_k.offer_many(values[part], part.tolist())
+        parts.append(pickle.loads(pickle.dumps(top_k)))
+
+    merged = TopK(5)
+    for part in parts:
+        merged.merge(part)
+
+    assert merged.items() == [(v, int(v)) for v in [99.0, 98.0, 97.0, 96.0, 95.0]]
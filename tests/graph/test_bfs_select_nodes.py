@@ -1,7 +1,8 @@
 import networkx as nx
+import numpy as np
 import pytest
 
-from omisoshiru.graph import bfs_select_nodes
+from omisoshiru.graph import CSRGraph, bfs_select_nodes
 
 
 @pytest.fixture
@@ -32,5 +33,40 @@ def test_bfs_select_nodes_case3(graph):
     assert bfs_select_nodes(graph, start_node, target_count) == expected_result
 
 
+def test_bfs_select_nodes_multiple_start_nodes(graph):
+    assert bfs_select_nodes(graph, [5, 2, 5], 4) == [5, 2, 3, 1]
+
+
+def test_bfs_select_nodes_direction():
+    graph = nx.DiGraph()
+    graph.add_edges_from([(1, 2), (2, 3), (4, 2)])
+
+    assert bfs_select_nodes(graph, 2, 4) == [2, 3]
+    assert bfs_select_nodes(graph, 2, 4, direction="in") == [2, 1, 4]
+    assert bfs_select_nodes(graph, 2, 4, direction="both") == [2, 3, 1, 4]
+    with pytest.raises(ValueError, match="Invalid direction"):
+        bfs_select_nodes(graph, 2, 4, direction="invalid")
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("target_count", [0, 1, 10, 30, 100])
+@pytest.mark.parametrize("direction", ["out", "in", "both"])
+def test_bfs_select_nodes_csr(directed, target_count, direction):
+    graph = nx.gnm_random_graph(100, 150, seed=0, directed=directed)
+    # Edges added in an order unrelated to the node order
+    shuffled = nx.DiGraph() if directed else nx.Graph()
+    shuffled.add_nodes_from(graph)
+    edges = list(graph.edges)
+    np.random.default_rng(0).shuffle(edges)
+    shuffled.add_edges_from(edges)
+    csr = CSRGraph.from_networkx(shuffled)
+
+    for start in [0, [3, 50, 3]]:
+        result = bfs_select_nodes(csr, start, target_count, direction=direction)
+        expected = bfs_select_nodes(shuffled, start, target_count, direction=direction)
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == expected
+
+
 if __name__ == "__main__":
     pytest.main()
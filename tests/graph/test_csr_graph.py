@@ -0,0 +1,105 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from omisoshiru.graph import CSRGraph, hop_bounded_costs, min_cost_within_n_hops
+
+
+def brute_force_costs(graph, source, max_hops, cost_type):
+    best = {source: 0 if cost_type == "cost" else 1}
+    layer = dict(best)
+    for _ in range(max_hops):
+        next_layer = {}
+        for node, value in layer.items():
+            for _, neighbor, data in graph.edges(node, data=True):
+                if cost_type == "cost":
+                    candidate = value + data["cost"]
+                    better = candidate < best.get(neighbor, np.inf)
+                else:
+                    candidate = value * data["weight"]
+                    better = candidate > best.get(neighbor, -np.inf)
+                if better:
+                    best[neighbor] = candidate
+                    next_layer[neighbor] = candidate
+        layer = next_layer
+    return best
+
+
+def test_from_networkx():
+    graph = nx.MultiDiGraph()
+    graph.add_edge("a", "b", cost=1)
+    graph.add_edge("a", "b", cost=2)
+    graph.add_edge("b", "c")
+    graph.add_node("d")
+
+    csr = CSRGraph.from_networkx(graph)
+
+    assert csr.nodes == ["a", "b", "c", "d"]
+    np.testing.assert_array_equal(csr.indptr, [0, 2, 3, 3, 3])
+    np.testing.assert_array_equal(csr.neighbors(csr.index("a")), [1, 1])
+    np.testing.assert_array_equal(csr.edge_data["cost"][:2], [1, 2])
+    with pytest.raises(KeyError):
+        csr.edge_attribute("cost")
+
+
+def test_reverse():
+    graph = nx.MultiDiGraph()
+    graph.add_node("b")
+    graph.add_edge("c", "a", cost=3)
+    graph.add_edge("b", "a", cost=2)
+    graph.add_edge("b", "a", cost=1)
+
+    csr = CSRGraph.from_networkx(graph)
+    reverse = csr.reverse()
+
+    # In the order of graph.in_edges, or by source for a graph built from arrays
+    assert [csr.nodes[i] for i in reverse.neighbors(csr.index("a"))] == ["c", "b", "b"]
+    np.testing.assert_array_equal(reverse.edge_data["cost"], [3, 2, 1])
+    assert reverse.reverse() is csr
+    rebuilt = CSRGraph(csr.indptr, csr.indices, csr.nodes, csr.edge_data).reverse()
+    np.testing.assert_array_equal(rebuilt.neighbors(csr.index("a")), [0, 0, 1])
+    assert CSRGraph.from_networkx(nx.Graph(graph)).reverse().directed is False
+
+
+def test_min_cost_within_n_hops_csr():
+    graph = nx.Graph()
+    graph.add_edge(1, 2, cost=-1)
+    graph.add_edge(2, 3, cost=-2)
+    graph.add_edge(1, 4, cost=-4)
+
+    result = min_cost_within_n_hops(
+        CSRGraph.from_networkx(graph), source_node=1, max_hops=2
+    )
+    assert result.items() == [(-8, 1), (-4, 4), (-3, 3), (-1, 2)]
+
+
+def test_min_cost_within_n_hops_csr_weight_max_nodes():
+    graph = nx.Graph()
+    graph.add_edge(1, 2, weight=0.5)
+    graph.add_edge(2, 3, weight=0.1)
+    graph.add_edge(1, 4, weight=0.9)
+
+    result = min_cost_within_n_hops(
+        CSRGraph.from_networkx(graph),
+        source_node=1,
+        max_hops=2,
+        max_nodes=3,
+        cost_type="weight",
+    )
+    assert result.items() == [(1, 1), (0.9, 4), (0.5, 2)]
+
+
+@pytest.mark.parametrize("cost_type", ["cost", "weight"])
+@pytest.mark.parametrize("directed", [False, True])
+def test_hop_bounded_costs_random_graph(cost_type, directed):
+    rng = np.random.default_rng(0)
+    graph = nx.gnm_random_graph(60, 200, seed=0, directed=directed)
+    for _, _, data in graph.edges(data=True):
+        data["cost"] = int(rng.integers(-2, 10))
+        data["weight"] = float(rng.random())
+    csr = CSRGraph.from_networkx(graph)
+
+    for source in [0, 7, 42]:
+        reached, costs = hop_bounded_costs(csr, source, 3, cost_type)
+        expected = brute_force_costs(graph, source, 3, cost_type)
+        assert dict(zip(reached.tolist(), costs.tolist())) == pytest.approx(expected)
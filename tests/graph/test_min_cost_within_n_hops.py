@@ -1,7 +1,8 @@
 import networkx as nx
+import numpy as np
 import pytest
 
-from omisoshiru.graph import min_cost_within_n_hops
+from omisoshiru.graph import CSRGraph, min_cost_within_n_hops
 
 
 def test_min_cost_within_n_hops_cost_type_cost():
@@ -98,3 +99,113 @@ def test_min_cost_within_n_hops_with_max_nodes():
         graph, source_node=1, max_hops=2, cost_type="cost", max_nodes=3
     )
     assert result.items() == [(0, 1), (2, 3), (3, 2)]
+
+
+@pytest.mark.parametrize(
+    "cost_type, low, high",
+    [("cost", 0, 10), ("cost", -2, 10), ("weight", 0, 1), ("weight", 0, 2)],
+)
+@pytest.mark.parametrize("max_nodes", [None, 5])
+def test_min_cost_within_n_hops_random_graph(cost_type, low, high, max_nodes):
+    rng = np.random.default_rng(0)
+    graph = nx.gnm_random_graph(50, 150, seed=0, directed=True)
+    for _, _, data in graph.edges(data=True):
+        data[cost_type] = float(rng.uniform(low, high))
+    csr = CSRGraph.from_networkx(graph)
+
+    for source in [0, 10, 20]:
+        result = min_cost_within_n_hops(
+            graph, source, max_hops=4, max_nodes=max_nodes, cost_type=cost_type
+        )
+        expected = min_cost_within_n_hops(
+            csr, source, max_hops=4, max_nodes=max_nodes, cost_type=cost_type
+        )
+        assert [node for _, node in result] == [node for _, node in expected]
+        assert [cost for cost, _ in result] == pytest.approx(
+            [cost for cost, _ in expected]
+        )
+
+
+@pytest.mark.parametrize("max_nodes", [1, 3, 5, 10])
+def test_min_cost_within_n_hops_tied_costs(max_nodes):
+    # Integer costs, so many nodes tie at the max_nodes-th cost
+    rng = np.random.default_rng(0)
+    for seed in range(100):
+        graph = nx.gnm_random_graph(20, 40, seed=seed, directed=seed % 2 == 0)
+        for _, _, data in graph.edges(data=True):
+            data["cost"] = int(rng.integers(0, 3))
+        csr = CSRGraph.from_networkx(graph)
+
+        result = min_cost_within_n_hops(graph, 0, max_hops=3, max_nodes=max_nodes)
+        expected = min_cost_within_n_hops(csr, 0, max_hops=3, max_nodes=max_nodes)
+        assert result.items() == expected.items()
+
+
+@pytest.mark.parametrize("backend", [lambda graph: graph, CSRGraph.from_networkx])
+def test_min_cost_within_n_hops_unbounded(backend):
+    graph = nx.path_graph(10)
+    nx.set_edge_attributes(graph, 1, "cost")
+
+    result = min_cost_within_n_hops(backend(graph), source_node=0, max_hops=None)
+    assert result.items() == [(i, i) for i in range(10)]
+
+    nx.set_edge_attributes(graph, -1, "cost")
+    with pytest.raises(ValueError, match="cycle"):
+        min_cost_within_n_hops(backend(graph), source_node=0, max_hops=None)
+
+
+@pytest.mark.parametrize("backend", [lambda graph: graph, CSRGraph.from_networkx])
+@pytest.mark.parametrize("max_nodes", [None, 1])
+def test_min_cost_within_n_hops_improving_cycle(backend, max_nodes):
+    # With max_hops, a cycle that keeps improving costs is walked up to the last hop.
+    graph = nx.DiGraph([(0, 1), (1, 0)])
+    nx.set_edge_attributes(graph, -1, "cost")
+    result = min_cost_within_n_hops(
+        backend(graph), source_node=0, max_hops=5, max_nodes=max_nodes
+    )
+    assert result.items() == [(-5, 1), (-4, 0)][:max_nodes]
+
+    graph = nx.path_graph(2)
+    nx.set_edge_attributes(graph, 2.0, "weight")
+    result = min_cost_within_n_hops(
+        backend(graph),
+        source_node=0,
+        max_hops=5,
+        max_nodes=max_nodes,
+        cost_type="weight",
+    )
+    assert result.items() == [(32.0, 1), (16.0, 0)][:max_nodes]
+
+
+@pytest.mark.parametrize("cost_type, low, high", [("cost", -3, 10), ("weight", 0, 2)])
+@pytest.mark.parametrize("max_nodes", [1, 3])
+def test_min_cost_within_n_hops_improving_edges_max_nodes(
+    cost_type, low, high, max_nodes
+):
+    # An improving edge far from the source must not be missed by stopping early.
+    rng = np.random.default_rng(0)
+    for seed in range(20):
+        graph = nx.gnm_random_graph(20, 60, seed=seed, directed=True)
+        for u, v in graph.edges:
+            graph.edges[u, v][cost_type] = float(rng.uniform(low, high))
+
+        result = min_cost_within_n_hops(
+            graph, 0, max_hops=4, max_nodes=max_nodes, cost_type=cost_type
+        )
+        expected = min_cost_within_n_hops(
+            CSRGraph.from_networkx(graph),
+            0,
+            max_hops=4,
+            max_nodes=max_nodes,
+            cost_type=cost_type,
+        )
+        assert result.items() == pytest.approx(expected.items())
+
+
+def test_min_cost_within_n_hops_improving_edge_behind_cutoff():
+    graph = nx.DiGraph()
+    graph.add_edge(0, 1, cost=1)
+    graph.add_edge(1, 0, cost=-5)
+
+    result = min_cost_within_n_hops(graph, 0, max_hops=2, max_nodes=1)
+    assert result.items() == [(-4, 0)]
@@ -0,0 +1,41 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from omisoshiru.graph import (
+    CSRGraph,
+    min_cost_within_n_hops,
+    min_cost_within_n_hops_many,
+)
+
+
+@pytest.fixture
+def graph():
+    rng = np.random.default_rng(0)
+    graph = nx.gnm_random_graph(100, 400, seed=0)
+    for _, _, data in graph.edges(data=True):
+        data["cost"] = float(rng.random())
+    return graph
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+@pytest.mark.parametrize("max_hops", [3, None])
+def test_min_cost_within_n_hops_many(graph, max_workers, max_hops):
+    sources = [5, 0, 99, 42]
+
+    results = list(
+        min_cost_within_n_hops_many(
+            graph, sources, max_hops=max_hops, max_nodes=10, max_workers=max_workers
+        )
+    )
+
+    csr = CSRGraph.from_networkx(graph)
+    assert [source for source, _ in results] == sources
+    for source, result in results:
+        expected = min_cost_within_n_hops(csr, source, max_hops=max_hops, max_nodes=10)
+        assert result.items() == expected.items()
+
+
+def test_min_cost_within_n_hops_many_invalid_cost_type(graph):
+    with pytest.raises(ValueError, match="Invalid cost_type"):
+        list(min_cost_within_n_hops_many(graph, [0], cost_type="invalid"))
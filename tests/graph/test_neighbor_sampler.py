@@ -0,0 +1,117 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from omisoshiru.graph import CSRGraph, NeighborSampler
+
+
+def edge_set(subgraph):
+    sources, targets = subgraph.nodes[subgraph.edge_index]
+    return set(zip(sources.tolist(), targets.tolist()))
+
+
+def test_neighbor_sampler_full_fanout():
+    graph = nx.gnm_random_graph(50, 120, seed=0, directed=True)
+    sampler = NeighborSampler(graph, fanouts=[-1, -1])
+    csr = sampler.csr
+
+    subgraph = next(sampler.sample([0]))
+
+    expected_nodes = {0}
+    expected_edges = set()
+    frontier = {0}
+    for _ in range(2):
+        hop = set()
+        for node in frontier:
+            for neighbor in graph.successors(node):
+                expected_edges.add((node, neighbor))
+                if neighbor not in expected_nodes:
+                    hop.add(neighbor)
+        expected_nodes |= hop
+        frontier = hop
+    assert subgraph.nodes[0] == csr.index(0)
+    assert subgraph.num_seeds == 1
+    assert {csr.nodes[i] for i in subgraph.nodes} == expected_nodes
+    assert len(subgraph.nodes) == len(expected_nodes)
+    assert edge_set(subgraph) == {
+        (csr.index(u), csr.index(v)) for u, v in expected_edges
+    }
+
+
+@pytest.mark.parametrize("direction", ["out", "in", "both"])
+def test_neighbor_sampler_fanouts(direction):
+    graph = nx.gnm_random_graph(200, 2000, seed=1, directed=True)
+    csr = CSRGraph.from_networkx(graph)
+    sampler = NeighborSampler(
+        csr, fanouts=[3, 2], batch_size=4, direction=direction, seed=0
+    )
+    edges = {(u, v) for u, v in graph.edges}
+
+    subgraphs = list(sampler.sample(range(10)))
+
+    assert [subgraph.num_seeds for subgraph in subgraphs] == [4, 4, 2]
+    for subgraph in subgraphs:
+        num_seeds = subgraph.num_seeds
+        assert len(subgraph.nodes) == len(set(subgraph.nodes.tolist()))
+        assert len(subgraph.nodes) <= num_seeds * (1 + 3 + 3 * 2)
+        assert subgraph.edge_index.max() < len(subgraph.nodes)
+        assert edge_set(subgraph) <= edges
+        if direction != "both":
+            # Every node has at most 3 sampled edges at the first hop.
+            side = 0 if direction == "out" else 1
+            seeds = subgraph.edge_index[side][subgraph.edge_index[side] < num_seeds]
+            assert np.bincount(seeds).max() <= 3
+
+
+@pytest.mark.parametrize("graph_class", [nx.DiGraph, nx.MultiDiGraph])
+def test_neighbor_sampler_both_directions_edges_once(graph_class):
+    graph = graph_class([(0, 1), (1, 0), (1, 2), (0, 1)])
+    sampler = NeighborSampler(graph, fanouts=[-1, -1], direction="both")
+
+    subgraph = next(sampler.sample([0, 1]))
+
+    sources, targets = subgraph.nodes[subgraph.edge_index]
+    edges = sorted(zip(sources.tolist(), targets.tolist()))
+    # Parallel edges of a multigraph are kept, each once
+    assert edges == sorted(graph.edges())
+
+
+def test_neighbor_sampler_seed():
+    graph = nx.gnm_random_graph(100, 500, seed=2)
+
+    def sample(**kwargs):
+        sampler = NeighborSampler(graph, fanouts=[2, 2], seed=0, **kwargs)
+        return [subgraph.nodes.tolist() for subgraph in sampler.sample(range(5))]
+
+    assert sample() == sample()
+    assert sample(shuffle=True) == sample(shuffle=True)
+
+
+def test_neighbor_sampler_dynamic_dataset():
+    pytest.importorskip("torch")
+    from omisoshiru.ml.datasets import DynamicDataset
+
+    graph = nx.gnm_random_graph(100, 500, seed=3)
+    sampler = NeighborSampler(graph, fanouts=[2], batch_size=8, shuffle=True, seed=0)
+    dataset = DynamicDataset(list(graph.nodes), sampler)
+
+    first = [subgraph.nodes.tolist() for subgraph in dataset]
+    second = [subgraph.nodes.tolist() for subgraph in dataset]
+
+    assert len(first) == len(second) == 13
+    assert first != second
+    seeds = [
+        n
+        for subgraph in sampler(1, graph.nodes)
+        for n in subgraph.nodes[: subgraph.num_seeds]
+    ]
+    assert sorted(seeds) == list(range(100))
+    assert first == [subgraph.nodes.tolist() for subgraph in sampler(0, graph.nodes)]
+
+
+def test_neighbor_sampler_invalid():
+    graph = nx.path_graph(3)
+    with pytest.raises(ValueError, match="Invalid direction"):
+        NeighborSampler(graph, fanouts=[1], direction="invalid")
+    with pytest.raises(ValueError, match="batch_size"):
+        NeighborSampler(graph, fanouts=[1], batch_size=0)
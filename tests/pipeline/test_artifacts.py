@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from omisoshiru.pipeline.artifacts import (
+    load_artifact,
+    read_outputs,
+    record_output,
+    reset_outputs,
+    save_artifact,
+)
+
+
+@pytest.fixture
+def temp_dir(request):
+    temp_dir = tempfile.mkdtemp()
+
+    def fin():
+        shutil.rmtree(temp_dir)
+
+    request.addfinalizer(fin)
+    return temp_dir
+
+
+def test_npy_memory_mapped(temp_dir):
+    path = os.path.join(temp_dir, "x.npy")
+    save_artifact(np.arange(10), path)
+
+    x = load_artifact(path)
+    assert isinstance(x, np.memmap)
+    assert x.tolist() == list(range(10))
+
+
+def test_cache(temp_dir):
+    path = os.path.join(temp_dir, "x.pkl")
+    save_artifact({"a": 1}, path)
+    assert load_artifact(path) is load_artifact(path)
+
+    save_artifact({"a": 2, "b": 3}, path)
+    assert load_artifact(path) == {"a": 2, "b": 3}
+
+
+def test_csv_and_format(temp_dir):
+    path = os.path.join(temp_dir, "df.txt")
+    df = pd.DataFrame({"a": [1, 2]})
+    save_artifact(df, path, format="csv")
+    pd.testing.assert_frame_equal(load_artifact(path, format="csv"), df)
+
+    with pytest.raises(ValueError):
+        load_artifact(path)
+    with pytest.raises(ValueError):
+        load_artifact(path, format="txt")
+
+
+def test_record_output(temp_dir):
+    assert read_outputs(temp_dir) is None
+    with open(os.path.join(temp_dir, "out.txt"), "w") as f:
+        f.write("output")
+
+    output = record_output(temp_dir, "out.txt")
+    assert output["size"] == 6
+    assert read_outputs(temp_dir) == {"out.txt": output}
+
+    reset_outputs(temp_dir)
+    assert read_outputs(temp_dir) is None
+    assert os.path.exists(os.path.join(temp_dir, "out.txt"))
+    reset_outputs(temp_dir)
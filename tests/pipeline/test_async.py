@@ -0,0 +1,61 @@
+import asyncio
+import os
+import shutil
+import tempfile
+
+import nbformat
+import pytest
+
+from omisoshiru.pipeline import Node, Pipeline, Run, set_catalog_dir
+
+
+@pytest.fixture
+def node(request):
+    catalog_dir = tempfile.mkdtemp()
+
+    def fin():
+        shutil.rmtree(catalog_dir)
+
+    request.addfinalizer(fin)
+    set_catalog_dir(catalog_dir)
+
+    node = Node.create("test_node")
+    source = "import os, time\ntime.sleep(float(os.environ['PIPELINE_PARAM_SLEEP']))"
+    nb = nbformat.v4.new_notebook(cells=[nbformat.v4.new_code_cell(source)])
+    with open(node.get_path(), "w", encoding="utf-8") as f:
+        nbformat.write(nb, f)
+    return node
+
+
+def test_async_create_run(node):
+    async def main():
+        semaphore = asyncio.Semaphore(2)
+        return await asyncio.gather(
+            node.async_create_run("run1", params={"sleep": "0"}, semaphore=semaphore),
+            node.async_create_run("run2", params={"sleep": "0"}, semaphore=semaphore),
+            node.async_create_run(
+                "run3", params={"sleep": "60"}, run_timeout=5, semaphore=semaphore
+            ),
+        )
+
+    run1, run2, run3 = asyncio.run(main())
+    assert run1.success and run2.success
+    assert not run3.success
+    assert Run.get("test_node", "run1") == run1
+    assert Run.get("test_node", "run3") is None
+    assert os.path.exists(os.path.join(run3.get_dir(), "run3.ipynb"))
+
+
+def test_async_create_run_cancel(node):
+    async def main():
+        task = asyncio.ensure_future(
+            node.async_create_run("run1", params={"sleep": "60"})
+        )
+        await asyncio.sleep(5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    runs = Pipeline.from_catalog().runs
+    assert [(run.name, run.success) for run in runs] == [("run1", False)]
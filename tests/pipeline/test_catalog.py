@@ -0,0 +1,149 @@
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import yaml
+
+from omisoshiru.pipeline import Catalog, SQLiteCatalog, YAMLCatalog
+
+
+@pytest.fixture
+def catalog_dir(request):
+    catalog_dir = tempfile.mkdtemp()
+
+    def fin():
+        shutil.rmtree(catalog_dir)
+
+    request.addfinalizer(fin)
+    return catalog_dir
+
+
+@pytest.fixture
+def catalog_path(catalog_dir):
+    return os.path.join(catalog_dir, "catalog.yml")
+
+
+@pytest.fixture(params=[YAMLCatalog, SQLiteCatalog])
+def catalog(request, catalog_dir):
+    return request.param(os.path.join(catalog_dir, "catalog"))
+
+
+def make_run(node, name, success=True, inputs=None):
+    return {
+        "node": node,
+        "name": name,
+        "inputs": inputs or {},
+        "params": {},
+        "success": success,
+    }
+
+
+def test_lookup(catalog):
+    catalog.add_node({"name": "a"})
+    catalog.add_run(make_run("a", "r1", success=False))
+    catalog.add_run(make_run("a", "r1"))
+    catalog.add_run(make_run("b", "r1"))
+
+    assert catalog.get_node("a") == {"name": "a"}
+    assert catalog.get_node("b") is None
+    assert catalog.get_run("a", "r1") == make_run("a", "r1")
+    assert catalog.get_run("a", "r2") is None
+    assert len(catalog.runs()) == 3
+    assert catalog.runs(node="b") == [make_run("b", "r1")]
+
+
+def test_replace(catalog):
+    catalog.add_node({"name": "a"})
+    catalog.replace([{"name": "b"}], [make_run("b", "r1")])
+
+    assert catalog.nodes() == [{"name": "b"}]
+    assert catalog.runs() == [make_run("b", "r1")]
+
+
+def test_reload_only_when_file_changes(catalog_path, monkeypatch):
+    catalog = YAMLCatalog(catalog_path)
+    catalog.add_node({"name": "a"})
+
+    calls = []
+    safe_load = yaml.safe_load
+    monkeypatch.setattr(yaml, "safe_load", lambda f: calls.append(f) or safe_load(f))
+
+    for _ in range(10):
+        catalog.get_node("a")
+    assert calls == []
+
+    # Another writer modifies the file
+    other = YAMLCatalog(catalog_path)
+    other.add_node({"name": "b"})
+    os.utime(catalog_path, ns=(0, 0))
+
+    assert catalog.get_node("b") == {"name": "b"}
+    assert len(calls) == 2
+
+
+def test_reload_after_same_size_rewrite(catalog_path):
+    catalog = YAMLCatalog(catalog_path)
+    catalog.add_run(make_run("a", "r1"))
+    assert catalog.get_run("a", "r2") is None
+
+    # Another writer replaces a record with one of the same size, within the same mtime
+    other = YAMLCatalog(catalog_path)
+    stat = os.stat(catalog_path)
+    other.replace([], [make_run("a", "r2")])
+    os.utime(catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert os.path.getsize(catalog_path) == stat.st_size
+
+    assert catalog.get_run("a", "r2") == make_run("a", "r2")
+
+
+def test_returned_records_are_copies(catalog):
+    catalog.add_run(make_run("a", "r1"))
+
+    catalog.get_run("a", "r1")["params"]["x"] = "1"
+    assert catalog.get_run("a", "r1")["params"] == {}
+
+
+def test_sqlite_yaml_roundtrip(catalog_dir, catalog_path):
+    runs = [
+        make_run("a", "r1"),
+        make_run("b", "r1", inputs={"x": {"node": "a", "run": "r1", "file": "f"}}),
+    ]
+    YAMLCatalog(catalog_path).replace([{"name": "a"}, {"name": "b"}], runs)
+
+    catalog = SQLiteCatalog(os.path.join(catalog_dir, "catalog.db"))
+    catalog.import_yaml(catalog_path)
+    assert catalog.runs() == runs
+
+    export_path = os.path.join(catalog_dir, "export.yml")
+    catalog.export_yaml(export_path)
+    with open(catalog_path) as f, open(export_path) as g:
+        assert f.read() == g.read()
+
+
+def append_runs(path, worker, count):
+    catalog = SQLiteCatalog(path)
+    for i in range(count):
+        catalog.add_run(make_run("a", f"{worker}-{i}"))
+
+
+def test_sqlite_concurrent_writers(catalog_dir):
+    path = os.path.join(catalog_dir, "catalog.db")
+    with ProcessPoolExecutor(4) as executor:
+        futures = [
+            executor.submit(append_runs, path, worker, 20) for worker in range(4)
+        ]
+        for future in futures:
+            future.result()
+
+    assert len(SQLiteCatalog(path).runs()) == 80
+
+
+def test_catalog_abstract():
+    class NodesOnly(Catalog):
+        def nodes(self):
+            return []
+
+    with pytest.raises(TypeError):
+        NodesOnly()
@@ -0,0 +1,103 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from omisoshiru.pipeline import collect_garbage, get_catalog, set_catalog_dir
+from omisoshiru.pipeline.cli import main
+
+
+@pytest.fixture
+def catalog_dir(request):
+    catalog_dir = tempfile.mkdtemp()
+
+    def fin():
+        shutil.rmtree(catalog_dir)
+
+    request.addfinalizer(fin)
+    set_catalog_dir(catalog_dir)
+
+    catalog = get_catalog()
+    catalog.add_node({"name": "a"})
+    catalog.add_node({"name": "a"})
+    for node, name, success, upstream in [
+        ("a", "r1", False, None),
+        ("a", "r1", True, None),
+        ("a", "r2", False, None),
+        ("b", "r1", True, "a"),
+        ("c", "r1", True, None),
+    ]:
+        inputs = (
+            {"data": {"node": upstream, "run": "r1", "file": "data.bin"}}
+            if upstream
+            else {}
+        )
+        catalog.add_run(
+            {
+                "node": node,
+                "name": name,
+                "inputs": inputs,
+                "params": {},
+                "success": success,
+            }
+        )
+    for node, name in [("a", "r1"), ("a", "r2"), ("a", "r9"), ("b", "r1"), ("c", "r1")]:
+        run_dir = os.path.join(catalog_dir, "nodes", node, "runs", name)
+        os.makedirs(run_dir)
+        with open(os.path.join(run_dir, "data.bin"), "wb") as f:
+            f.write(b"x" * 1000)
+    return catalog_dir
+
+
+def run_dir(catalog_dir, node, name):
+    return os.path.join(catalog_dir, "nodes", node, "runs", name)
+
+
+def test_collect_garbage(catalog_dir):
+    report = collect_garbage()
+
+    assert report.removed_records == 2
+    assert report.removed_dirs == [
+        run_dir(catalog_dir, "a", "r2"),
+        run_dir(catalog_dir, "a", "r9"),
+    ]
+    assert report.linked_files == 2
+    assert report.bytes_reclaimed >= 4000
+    assert not os.path.exists(run_dir(catalog_dir, "a", "r9"))
+    assert os.path.samefile(
+        os.path.join(run_dir(catalog_dir, "a", "r1"), "data.bin"),
+        os.path.join(run_dir(catalog_dir, "c", "r1"), "data.bin"),
+    )
+
+    catalog = get_catalog()
+    assert [(r["node"], r["name"]) for r in catalog.runs()] == [
+        ("a", "r1"),
+        ("b", "r1"),
+        ("c", "r1"),
+    ]
+    assert catalog.nodes() == [{"name": "a"}]
+
+
+def test_collect_garbage_pinned(catalog_dir):
+    report = collect_garbage(pinned=["b:r1"], dedupe=False, dry_run=True)
+    assert report.removed_records == 3
+    assert run_dir(catalog_dir, "c", "r1") in report.removed_dirs
+    assert report.bytes_reclaimed == 3000
+    assert os.path.exists(run_dir(catalog_dir, "c", "r1"))
+    assert len(get_catalog().runs()) == 5
+
+    collect_garbage(pinned=[("b", "r1")], dedupe=False)
+    assert sorted(os.listdir(os.path.join(catalog_dir, "nodes", "a", "runs"))) == ["r1"]
+    assert not os.path.exists(run_dir(catalog_dir, "c", "r1"))
+
+    with pytest.raises(ValueError):
+        collect_garbage(pinned=["c:r1"])
+
+
+def test_cli(catalog_dir, capsys):
+    main(["--catalog-dir", catalog_dir, "gc", "--dry-run"])
+    out = capsys.readouterr().out
+    assert "Would remove 2 run records." in out
+    assert "Hard-linked 2 duplicate files." in out
+    assert os.path.exists(run_dir(catalog_dir, "a", "r9"))
@@ -0,0 +1,147 @@
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+
+from omisoshiru.pipeline import (
+    FileQueueExecutor,
+    Run,
+    RunSpec,
+    execute_runs,
+    run_worker,
+    set_catalog_dir,
+)
+
+from .test_scheduler import create_node
+
+
+@pytest.fixture
+def temp_dir(request):
+    temp_dir = tempfile.mkdtemp()
+
+    def fin():
+        shutil.rmtree(temp_dir)
+
+    request.addfinalizer(fin)
+    return temp_dir
+
+
+def mark(directory, i):
+    # Fails if the job is executed twice
+    os.close(os.open(os.path.join(directory, str(i)), os.O_CREAT | os.O_EXCL))
+    return i * i
+
+
+def fail():
+    raise KeyError("failed")
+
+
+def test_workers(temp_dir):
+    queue_dir = os.path.join(temp_dir, "queue")
+    marks_dir = os.path.join(temp_dir, "marks")
+    os.makedirs(marks_dir)
+
+    with FileQueueExecutor(queue_dir, poll_interval=0.01) as executor:
+        futures = [executor.submit(mark, marks_dir, i) for i in range(20)]
+        failed = executor.submit(fail)
+        workers = [
+            threading.Thread(
+                target=run_worker,
+                args=(queue_dir,),
+                kwargs={"poll_interval": 0.01, "idle_timeout": 0.5},
+            )
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        assert [future.result() for future in futures] == [i * i for i in range(20)]
+        with pytest.raises(KeyError):
+            failed.result()
+        for worker in workers:
+            worker.join()
+
+    assert sorted(os.listdir(queue_dir)) == []
+
+
+def test_cancel(temp_dir):
+    executor = FileQueueExecutor(temp_dir, poll_interval=0.01)
+    future = executor.submit(pow, 2, 3)
+    executor.shutdown(cancel_futures=True)
+    assert future.cancelled()
+    assert os.listdir(temp_dir) == []
+
+
+def test_truncated_result(temp_dir):
+    with FileQueueExecutor(temp_dir, poll_interval=0.01) as executor:
+        future = executor.submit(pow, 2, 3)
+        (job,) = os.listdir(temp_dir)
+        job_id = job[: -len(".job")]
+        with open(os.path.join(temp_dir, f"{job_id}.result"), "wb") as f:
+            f.write(pickle.dumps((True, 8))[:5])
+
+        with pytest.raises(Exception):
+            future.result(timeout=10)
+        # The executor keeps serving other jobs
+        other = executor.submit(pow, 2, 4)
+        worker = threading.Thread(
+            target=run_worker, args=(temp_dir,), kwargs={"max_jobs": 1}
+        )
+        worker.start()
+        assert other.result(timeout=10) == 16
+        worker.join()
+
+
+def test_stale_worker_with_skewed_clock(temp_dir):
+    with FileQueueExecutor(temp_dir, poll_interval=0.01, stale_timeout=1.0) as executor:
+        future = executor.submit(pow, 2, 3)
+        (job,) = os.listdir(temp_dir)
+        lock = os.path.join(temp_dir, job[: -len(".job")] + ".lock")
+        # A worker on a host whose clock is far behind claims the job
+        with open(lock, "w") as f:
+            f.write("worker")
+        os.utime(lock, (0, 0))
+
+        time.sleep(0.5)
+        assert not future.done()
+        with pytest.raises(RuntimeError, match="stopped responding"):
+            future.result(timeout=10)
+
+
+def test_execute_runs_on_workers(temp_dir):
+    catalog_dir = os.path.join(temp_dir, "catalog")
+    queue_dir = os.path.join(temp_dir, "queue")
+    set_catalog_dir(catalog_dir)
+    create_node("a", "open('out.txt', 'w').write('a')")
+    create_node(
+        "b", "import os\nassert open(os.environ['PIPELINE_INPUT_X']).read() == 'a'"
+    )
+
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    )
+    command = [sys.executable, "-m", "omisoshiru.pipeline", "worker", queue_dir]
+    command += ["--poll-interval", "0.1", "--idle-timeout", "5"]
+    workers = [subprocess.Popen(command, env=env) for _ in range(2)]
+    try:
+        with FileQueueExecutor(queue_dir, poll_interval=0.1) as executor:
+            statuses = execute_runs(
+                [
+                    RunSpec("a", "r1"),
+                    RunSpec("a", "r2"),
+                    RunSpec("b", "r1", inputs={"x": "a:r1:out.txt"}),
+                ],
+                executor=executor,
+            )
+    finally:
+        for worker in workers:
+            worker.wait(timeout=60)
+
+    assert set(statuses.values()) == {"success"}
+    assert Run.get("b", "r1").success
@@ -0,0 +1,99 @@
+import json
+import os
+import shutil
+import tempfile
+
+import nbformat
+import pytest
+from jupyter_client import KernelManager
+
+from omisoshiru.pipeline import KernelPool, Node, set_catalog_dir
+
+SOURCE = """
+import json, os, sys
+params = {k: v for k, v in os.environ.items() if k.startswith("PIPELINE_PARAM_")}
+with open("out.json", "w") as f:
+    json.dump({"pid": os.getpid(), "params": params, "warm": "WARM" in globals(), "decimal": "decimal" in sys.modules}, f)
+WARM = True
+"""
+
+
+@pytest.fixture
+def node(request):
+    catalog_dir = tempfile.mkdtemp()
+
+    def fin():
+        shutil.rmtree(catalog_dir)
+
+    request.addfinalizer(fin)
+    set_catalog_dir(catalog_dir)
+
+    node = Node.create("test_node")
+    nb = nbformat.v4.new_notebook(cells=[nbformat.v4.new_code_cell(SOURCE)])
+    with open(node.get_path(), "w", encoding="utf-8") as f:
+        nbformat.write(nb, f)
+    return node
+
+
+def read_output(run):
+    with open(os.path.join(run.get_dir(), "out.json")) as f:
+        return json.load(f)
+
+
+def test_kernel_pool_reset(node):
+    with KernelPool(size=1, warmup_code="import decimal") as pool:
+        run1 = node.create_run("run1", params={"a": "1"}, kernel_pool=pool)
+        run2 = node.create_run("run2", params={"b": "2"}, kernel_pool=pool)
+
+    out1, out2 = read_output(run1), read_output(run2)
+    assert run1.success and run2.success
+    assert out1["pid"] == out2["pid"]
+    assert out1["decimal"] and out2["decimal"]
+    assert out1["params"] == {"PIPELINE_PARAM_A": "1"}
+    assert out2["params"] == {"PIPELINE_PARAM_B": "2"}
+    assert not out2["warm"]
+
+
+def test_kernel_pool_restart(node):
+    with KernelPool(size=1, reset_policy="restart") as pool:
+        run1 = node.create_run("run1", kernel_pool=pool)
+        run2 = node.create_run("run2", kernel_pool=pool)
+
+    assert read_output(run1)["pid"] != read_output(run2)["pid"]
+
+
+def test_kernel_pool_invalid_reset_policy():
+    with pytest.raises(ValueError, match="Invalid reset_policy"):
+        KernelPool(size=0, reset_policy="invalid")
+
+
+def test_kernel_pool_restart_failure(node, monkeypatch):
+    def restart_kernel(self, now=False):
+        raise RuntimeError("restart failed")
+
+    with KernelPool(size=1, reset_policy="restart") as pool:
+        monkeypatch.setattr(KernelManager, "restart_kernel", restart_kernel)
+        run1 = node.create_run("run1", kernel_pool=pool)
+        # The kernel that failed to restart is replaced with a new one
+        run2 = node.create_run("run2", kernel_pool=pool)
+
+        assert run1.success and run2.success
+        assert read_output(run1)["pid"] != read_output(run2)["pid"]
+
+        # Neither restarting nor replacing the kernel works: acquire raises instead of blocking
+        km = pool.acquire()
+        pool._warmup_code = "raise ValueError('warmup failed')"
+        pool.release(km, restart=True)
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="warmup failed"):
+                pool.acquire(timeout=60)
+
+
+def test_kernel_pool_release_on_client_failure(node):
+    os.remove(node.get_path())
+
+    with KernelPool(size=1) as pool:
+        with pytest.raises(FileNotFoundError):
+            node.create_run("run1", kernel_pool=pool)
+        # The kernel is back in the pool
+        pool.release(pool.acquire(timeout=30))
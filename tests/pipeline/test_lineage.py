@@ -0,0 +1,84 @@
+import json
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from omisoshiru.pipeline import Lineage, YAMLCatalog
+
+
+@pytest.fixture
+def catalog(request):
+    catalog_dir = tempfile.mkdtemp()
+
+    def fin():
+        shutil.rmtree(catalog_dir)
+
+    request.addfinalizer(fin)
+    catalog = YAMLCatalog(os.path.join(catalog_dir, "catalog.yml"))
+    # a -> b -> c -> d, and a -> e
+    for node, upstream in [("a", None), ("b", "a"), ("c", "b"), ("d", "c"), ("e", "a")]:
+        inputs = (
+            {"data": {"node": upstream, "run": "r1", "file": "out.csv"}}
+            if upstream
+            else {}
+        )
+        catalog.add_run(
+            {
+                "node": node,
+                "name": "r1",
+                "inputs": inputs,
+                "params": {},
+                "success": True,
+            }
+        )
+    catalog.add_run(
+        {"node": "f", "name": "r1", "inputs": {}, "params": {}, "success": False}
+    )
+    return catalog
+
+
+def keys(lineage):
+    return sorted(lineage.graph.nodes)
+
+
+def test_from_catalog(catalog):
+    lineage = Lineage.from_catalog(catalog)
+    assert keys(lineage) == [(n, "r1") for n in "abcde"]
+    assert lineage.graph.edges[("a", "r1"), ("b", "r1")]["inputs"] == [
+        {"file": "out.csv", "input": "data"}
+    ]
+    assert len(Lineage.from_catalog(catalog, include_failed=True).graph) == 6
+    assert [r["node"] for r in lineage.records()][0] == "a"
+
+
+def test_ancestors_descendants(catalog):
+    lineage = Lineage.from_catalog(catalog)
+    assert keys(lineage.ancestors("d", "r1")) == [(n, "r1") for n in "abcd"]
+    assert keys(lineage.ancestors("d", "r1", depth=1)) == [("c", "r1"), ("d", "r1")]
+    assert keys(lineage.descendants("a", "r1", depth=1)) == [(n, "r1") for n in "abe"]
+    assert keys(lineage.neighborhood("b", "r1", ancestors=1, descendants=1)) == [
+        (n, "r1") for n in "abc"
+    ]
+    with pytest.raises(ValueError):
+        lineage.ancestors("x", "r1")
+
+
+def test_export(catalog, tmp_path):
+    lineage = Lineage.from_catalog(catalog).ancestors("c", "r1")
+
+    dot = lineage.to_dot()
+    assert dot.startswith("digraph lineage {")
+    assert '"a:r1" -> "b:r1" [label="out.csv -> data"];' in dot
+
+    data = json.loads(lineage.to_json())
+    assert sorted(node["id"] for node in data["nodes"]) == ["a:r1", "b:r1", "c:r1"]
+    assert {(edge["source"], edge["target"]) for edge in data["edges"]} == {
+        ("a:r1", "b:r1"),
+        ("b:r1", "c:r1"),
+    }
+
+    path = str(tmp_path / "lineage.html")
+    lineage.to_html(path)
+    assert os.path.exists(path)
@@ -2,9 +2,16 @@ import os
 import shutil
 import tempfile
 
+import nbformat
 import pytest
 
-from omisoshiru.pipeline import Node, Pipeline, Run, set_catalog_dir
+from omisoshiru.pipeline import (
+    Node,
+    Pipeline,
+    Run,
+    set_catalog_backend,
+    set_catalog_dir,
+)
 
 
 @pytest.fixture
@@ -42,3 +49,182 @@ def test_create_run(temp_catalog_dir):
 
     # Check if the run was created
     assert Run.get(node_name, run_name) == run
+
+
+def test_create_run_sqlite(temp_catalog_dir):
+    set_catalog_dir(temp_catalog_dir)
+    set_catalog_backend("sqlite")
+
+    try:
+        node = Node.create("test_node")
+        run = node.create_run("test_run")
+
+        assert os.path.exists(os.path.join(temp_catalog_dir, "catalog.db"))
+        assert Run.get("test_node", "test_run") == run
+        assert node.get_runs() == [run]
+    finally:
+        set_catalog_backend(None)
+
+
+def test_create_run_cache(temp_catalog_dir):
+    set_catalog_dir(temp_catalog_dir)
+
+    node = Node.create("test_node")
+    run1 = node.create_run("run1", params={"x": "1"}, cache=True)
+    with open(os.path.join(run1.get_dir(), "out.txt"), "w") as f:
+        f.write("output")
+
+    # Same notebook and params: outputs are reused
+    run2 = node.create_run("run2", params={"x": "1"}, cache=True)
+    assert run2.success
+    assert run2.fingerprint == run1.fingerprint
+    assert os.path.samefile(
+        os.path.join(run1.get_dir(), "out.txt"),
+        os.path.join(run2.get_dir(), "out.txt"),
+    )
+    assert os.path.exists(os.path.join(run2.get_dir(), "run2.ipynb"))
+
+    # Different params: executed
+    run3 = node.create_run("run3", params={"x": "2"}, cache=True)
+    assert run3.fingerprint != run1.fingerprint
+    assert not os.path.exists(os.path.join(run3.get_dir(), "out.txt"))
+
+
+def test_create_run_cache_source_deleted(temp_catalog_dir, monkeypatch):
+    # The kernel imports the package from this source tree
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    monkeypatch.setenv("PYTHONPATH", root)
+    set_catalog_dir(temp_catalog_dir)
+
+    node = Node.create("test_node")
+    nb = nbformat.v4.new_notebook(
+        cells=[
+            nbformat.v4.new_code_cell(
+                "from omisoshiru.pipeline import NotebookHelper\n"
+                "NotebookHelper().save_output([1], 'out.pkl')"
+            )
+        ]
+    )
+    with open(node.get_path(), "w", encoding="utf-8") as f:
+        nbformat.write(nb, f)
+    run1 = node.create_run("run1", cache=True)
+    assert run1.outputs is not None
+
+    # A recorded output of the cached run is missing: executed
+    os.remove(os.path.join(run1.get_dir(), "out.pkl"))
+    run2 = node.create_run("run2", cache=True)
+    assert run2.success
+    assert run2.fingerprint == run1.fingerprint
+    assert not os.path.samefile(
+        os.path.join(run1.get_dir(), "run1.ipynb"),
+        os.path.join(run2.get_dir(), "run2.ipynb"),
+    )
+
+    # The cached run has no directory any more: executed
+    shutil.rmtree(run1.get_dir())
+    run3 = node.create_run("run3", cache=True)
+    assert run3.success
+    assert os.path.exists(os.path.join(run3.get_dir(), "out.pkl"))
+
+
+def test_run_profile(temp_catalog_dir):
+    set_catalog_dir(temp_catalog_dir)
+
+    node = Node.create("test_node")
+    nb = nbformat.v4.new_notebook(
+        cells=[
+            nbformat.v4.new_code_cell("x = 1"),
+            nbformat.v4.new_markdown_cell("# Sleep"),
+            nbformat.v4.new_code_cell("import time\ntime.sleep(0.5)"),
+        ]
+    )
+    with open(node.get_path(), "w", encoding="utf-8") as f:
+        nbformat.write(nb, f)
+
+    run = node.create_run("test_run")
+
+    assert [record["cell"] for record in Run.get("test_node", "test_run").profile] == [
+        0,
+        2,
+    ]
+    with open(os.path.join(run.get_dir(), "test_run.ipynb"), encoding="utf-8") as f:
+        executed = nbformat.read(f, as_version=4)
+    assert executed.cells[2].metadata["profile"]["wall_time"] >= 0.5
+
+    report = node.get_profile_report(top=1)
+    assert report.loc[0, "cell"] == 2
+    assert report.loc[0, "wall_time"] >= 0.5
+
+
+def test_save_output(temp_catalog_dir, monkeypatch):
+    # The kernel imports the package from this source tree
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    monkeypatch.setenv("PYTHONPATH", root)
+    set_catalog_dir(temp_catalog_dir)
+    set_catalog_backend("sqlite")
+
+    try:
+        producer = Node.create("producer")
+        nb = nbformat.v4.new_notebook(
+            cells=[
+                nbformat.v4.new_code_cell(
+                    "import numpy as np\n"
+                    "from omisoshiru.pipeline import NotebookHelper\n"
+                    "helper = NotebookHelper()\n"
+                    "helper.save_output(np.arange(3), 'x.npy')"
+                )
+            ]
+        )
+        with open(producer.get_path(), "w", encoding="utf-8") as f:
+            nbformat.write(nb, f)
+        run = producer.create_run("run1")
+        assert run.success
+        assert Run.get("producer", "run1").get_files() == ["x.npy"]
+        assert run.outputs["x.npy"]["size"] > 0
+
+        consumer = Node.create("consumer")
+        nb = nbformat.v4.new_notebook(
+            cells=[
+                nbformat.v4.new_code_cell(
+                    "from omisoshiru.pipeline import NotebookHelper\n"
+                    "helper = NotebookHelper()\n"
+                    "assert helper.load_input('x').tolist() == [0, 1, 2]"
+                )
+            ]
+        )
+        with open(consumer.get_path(), "w", encoding="utf-8") as f:
+            nbformat.write(nb, f)
+        run = consumer.create_run("run1", inputs={"x": "producer:run1:x.npy"})
+        assert run.success
+    finally:
+        set_catalog_backend(None)
+
+
+def test_retry_resets_outputs(temp_catalog_dir, monkeypatch):
+    # The kernel imports the package from this source tree
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    monkeypatch.setenv("PYTHONPATH", root)
+    set_catalog_dir(temp_catalog_dir)
+
+    node = Node.create("test_node")
+
+    def write_notebook(source):
+        nb = nbformat.v4.new_notebook(cells=[nbformat.v4.new_code_cell(source)])
+        with open(node.get_path(), "w", encoding="utf-8") as f:
+            nbformat.write(nb, f)
+
+    write_notebook(
+        "from omisoshiru.pipeline import NotebookHelper\n"
+        "NotebookHelper().save_output([1], 'out.pkl')\n"
+        "raise RuntimeError('failed')"
+    )
+    run = node.create_run("run1")
+    assert not run.success
+    assert list(run.outputs) == ["out.pkl"]
+
+    # The retry records no output, so the output of the failed attempt is not reported
+    write_notebook("x = 1")
+    run = node.create_run("run1")
+    assert run.success
+    assert run.outputs is None
+    assert Run.get("test_node", "run1").outputs is None
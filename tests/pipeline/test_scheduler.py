@@ -0,0 +1,160 @@
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import nbformat
+import pytest
+
+from omisoshiru.pipeline import (
+    Node,
+    Run,
+    RunSpec,
+    build_run_graph,
+    execute_runs,
+    set_catalog_dir,
+)
+
+
+@pytest.fixture
+def temp_catalog_dir(request):
+    catalog_dir = tempfile.mkdtemp()
+
+    def fin():
+        shutil.rmtree(catalog_dir)
+
+    request.addfinalizer(fin)
+    return catalog_dir
+
+
+def create_node(name, source):
+    node = Node.create(name)
+    nb = nbformat.v4.new_notebook(cells=[nbformat.v4.new_code_cell(source)])
+    with open(node.get_path(), "w", encoding="utf-8") as f:
+        nbformat.write(nb, f)
+    return node
+
+
+def test_build_run_graph():
+    graph = build_run_graph(
+        [
+            RunSpec("a", "r1"),
+            RunSpec("b", "r1", inputs={"x": "a:r1:out.txt", "y": "c:r1:out.txt"}),
+        ]
+    )
+    assert list(graph.edges) == [(("a", "r1"), ("b", "r1"))]
+
+
+def test_build_run_graph_cycle():
+    with pytest.raises(ValueError, match="cycle"):
+        build_run_graph(
+            [
+                RunSpec("a", "r1", inputs={"x": "b:r1:out.txt"}),
+                RunSpec("b", "r1", inputs={"x": "a:r1:out.txt"}),
+            ]
+        )
+
+
+def test_execute_runs(temp_catalog_dir):
+    set_catalog_dir(temp_catalog_dir)
+    create_node(
+        "src",
+        "import os\n" "open('out.txt', 'w').write(os.environ['PIPELINE_PARAM_TEXT'])",
+    )
+    create_node(
+        "dst",
+        "import os\n"
+        "text = open(os.environ['PIPELINE_INPUT_X']).read()\n"
+        "open('out.txt', 'w').write(text + '!')",
+    )
+    create_node("broken", "raise RuntimeError()")
+
+    statuses = execute_runs(
+        [
+            RunSpec("dst", "r1", inputs={"x": "src:r1:out.txt"}),
+            RunSpec("src", "r1", params={"text": "hello"}),
+            RunSpec("src", "r2", params={"text": "world"}),
+            RunSpec("broken", "r1"),
+            RunSpec("dst", "r2", inputs={"x": "broken:r1:out.txt"}),
+        ],
+        max_workers=2,
+    )
+
+    assert statuses == {
+        ("dst", "r1"): "success",
+        ("src", "r1"): "success",
+        ("src", "r2"): "success",
+        ("broken", "r1"): "failed",
+        ("dst", "r2"): "skipped",
+    }
+    with open(os.path.join(Run.get("dst", "r1").get_dir(), "out.txt")) as f:
+        assert f.read() == "hello!"
+
+    statuses = execute_runs([RunSpec("src", "r1", params={"text": "hello"})])
+    assert statuses == {("src", "r1"): "exists"}
+
+
+def test_execute_runs_cache(temp_catalog_dir):
+    set_catalog_dir(temp_catalog_dir)
+    create_node("src", "open('out.txt', 'w').write('hello')")
+    create_node("dst", "import os\nprint(open(os.environ['PIPELINE_INPUT_X']).read())")
+
+    specs = [
+        RunSpec("src", "v1"),
+        RunSpec("dst", "v1", inputs={"x": "src:v1:out.txt"}),
+    ]
+    assert set(execute_runs(specs, cache=True).values()) == {"success"}
+
+    # Nothing changed: all outputs are reused
+    specs = [
+        RunSpec("src", "v2"),
+        RunSpec("dst", "v2", inputs={"x": "src:v2:out.txt"}),
+    ]
+    assert set(execute_runs(specs, cache=True).values()) == {"cached"}
+
+    # Changed upstream: the dependent run is executed again
+    create_node("src2", "open('out.txt', 'w').write('changed')")
+    specs = [
+        RunSpec("src2", "v1"),
+        RunSpec("dst", "v3", inputs={"x": "src2:v1:out.txt"}),
+    ]
+    assert set(execute_runs(specs, cache=True).values()) == {"success"}
+
+
+def test_execute_runs_threads(temp_catalog_dir):
+    set_catalog_dir(temp_catalog_dir)
+    create_node(
+        "node",
+        "import os, time\n"
+        "time.sleep(0.5)\n"
+        "params = sorted(k for k in os.environ if k.startswith('PIPELINE_'))\n"
+        "open('out.txt', 'w').write(','.join(params) + ':' + os.environ['PIPELINE_PARAM_X'])",
+    )
+
+    specs = [
+        RunSpec("node", f"r{i}", params={"x": str(i), f"p{i}": ""}) for i in range(3)
+    ]
+    with ThreadPoolExecutor(3) as executor:
+        statuses = execute_runs(specs, executor=executor)
+
+    assert set(statuses.values()) == {"success"}
+    assert not any(k.startswith("PIPELINE_") for k in os.environ)
+    for i in range(3):
+        with open(os.path.join(Run.get("node", f"r{i}").get_dir(), "out.txt")) as f:
+            assert f.read() == f"PIPELINE_PARAM_P{i},PIPELINE_PARAM_X:{i}"
+
+
+def test_sweep(temp_catalog_dir):
+    set_catalog_dir(temp_catalog_dir)
+    node = create_node("a", "import os\nassert os.environ['PIPELINE_PARAM_X'] != '3'")
+
+    df = node.sweep({"x": [1, 2, 3]}, max_workers=2)
+    assert list(df.columns) == ["run", "status", "x"]
+    assert df["x"].tolist() == ["1", "2", "3"]
+    assert df["status"].tolist() == ["success", "success", "failed"]
+    assert Run.get("a", df.loc[0, "run"]).params == {"x": "1"}
+
+    # Names are deterministic, so successful combinations are skipped
+    df2 = node.sweep({"x": [1, 2, 3]}, n_samples=2, seed=0, max_workers=2)
+    assert set(df2["run"]) <= set(df["run"])
+    assert df2["status"].isin(["exists", "failed"]).all()
@@ -0,0 +1,44 @@
+import importlib.util
+import json
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def cold_start():
+    spec = importlib.util.spec_from_file_location(
+        "cold_start", os.path.join(ROOT, "benchmarks", "cold_start.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.slow
+def test_report(cold_start, tmp_path):
+    output = str(tmp_path / "report.json")
+    args = ["--packages", "omisoshiru.text", "--first-calls", "FuzzyReplacer"]
+    assert cold_start.main(args + ["--repeat", "1", "--output", output]) == 0
+
+    with open(output, encoding="utf-8") as f:
+        report = json.load(f)
+    assert report["imports"]["omisoshiru.text"]["seconds"] > 0
+    assert report["imports"]["omisoshiru.text"]["top"]
+    assert set(report["first_calls"]["FuzzyReplacer"]) == {
+        "import",
+        "construct",
+        "first_call",
+        "total",
+    }
+
+    # A much slower baseline is not a regression, a much faster one is.
+    report["imports"]["omisoshiru.text"]["seconds"] *= 100
+    assert cold_start.compare(report, report, threshold=0.2) == []
+    baseline = json.loads(json.dumps(report))
+    baseline["first_calls"]["FuzzyReplacer"]["total"] /= 100
+    assert cold_start.compare(report, baseline, threshold=0.2) == [
+        "first call FuzzyReplacer is 9900% slower"
+    ]
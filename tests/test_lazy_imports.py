@@ -0,0 +1,101 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PACKAGES = [
+    "omisoshiru.algorithm",
+    "omisoshiru.collections",
+    "omisoshiru.datetime",
+    "omisoshiru.graph",
+    "omisoshiru.math",
+    "omisoshiru.ml",
+    "omisoshiru.ml.datasets",
+    "omisoshiru.ml.models",
+    "omisoshiru.pipeline",
+    "omisoshiru.text",
+    "omisoshiru.text.wakachi",
+    "omisoshiru.utils",
+]
+
+HEAVY_MODULES = [
+    "torch",
+    "transformers",
+    "sklearn",
+    "networkx",
+    "pyvis",
+    "nbconvert",
+    "nbclient",
+    "MeCab",
+    "seaborn",
+    "matplotlib",
+    "pandas",
+]
+
+
+def import_in_subprocess(code):
+    script = (
+        "import json, sys\n"
+        f"{code}\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'heavy': heavy}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_import_packages_is_lightweight():
+    result = import_in_subprocess("\n".join(f"import {p}" for p in PACKAGES))
+    assert result["heavy"] == []
+
+
+@pytest.mark.parametrize(
+    "code, forbidden",
+    [
+        (
+            "from omisoshiru.text import insert_newlines, join_str, unify_hz",
+            ["torch", "sklearn", "MeCab"],
+        ),
+        (
+            "from omisoshiru.utils import convert_list_of_dicts_to_dict_of_lists, process_batches",
+            ["torch", "transformers"],
+        ),
+        ("from omisoshiru.math import cosine_similarity", ["sklearn"]),
+        ("from omisoshiru.ml import TrainingLogger", ["torch", "matplotlib"]),
+        (
+            "from omisoshiru.pipeline import FileQueueExecutor, SQLiteCatalog",
+            ["nbclient", "pandas"],
+        ),
+        ("from omisoshiru.pipeline import Lineage, Run", ["pyvis"]),
+    ],
+)
+def test_optional_dependencies_are_deferred(code, forbidden):
+    heavy = import_in_subprocess(code)["heavy"]
+    assert not set(heavy) & set(forbidden)
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_exports_resolve(package):
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        assert getattr(module, name).__name__ == name
+        assert name in dir(module)
+    assert set(module._lazy_attributes) <= set(module.__all__)
+
+
+def test_submodule_import_keeps_exported_function():
+    import omisoshiru.text
+    import omisoshiru.text.replace_text_ranges
+
+    assert callable(omisoshiru.text.replace_text_ranges)